@@ -0,0 +1,257 @@
+""" Benchmarks the end-to-end cost of docstring inheritance on synthetic packages of class hierarchies.
+
+Usage:
+    python benchmarks/bench_hierarchy.py [--depth 10] [--width 50] [--fan-in 2] [--methods 5] [--style numpy]
+                                         [--variants none,metaclass,...] [--runs 5] [--output results.json]
+
+A package is generated for each variant of docstring inheritance, with the same classes and docstrings (see
+corpus.py): a root class, `--fan-in` root mixins, and `--depth` levels (one module each) of `--width` classes,
+each deriving from a class of the previous level and from the mixins. The root and the mixins fully document
+themselves and `--methods` methods, which every other class overrides, documenting them (and itself) as a
+child does. The variants are:
+
+- none: no docstring inheritance.
+- metaclass: the root's metaclass is `DocInheritMeta(style)`.
+- metaclass_lazy: the root's metaclass is `DocInheritMeta(style, lazy=True)`.
+- metaclass_dedupe: the root's metaclass is `DocInheritMeta(style, dedupe=True)`.
+- metaclass_shared: the root's metaclass is `DocInheritMeta(style, share_sections=True)`.
+- doc_inherit: each method is decorated by `doc_inherit(<its parent's method>, style)`.
+- inherit_docstrings: each class is decorated by `inherit_docstrings(style=style)`.
+
+Each package is imported `--runs` times, each in a fresh interpreter (with the bytecode cached), and the median
+of each phase is reported: importing custom_inherit, importing the package (creating the classes), then reading
+the docstrings of all of the classes and methods (via `inspect.getdoc`) a first and a second time. The peak
+resident memory of the interpreter is reported as well (where the `resource` module is available).
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SRC = os.path.join(os.path.dirname(_HERE), "src")
+sys.path.insert(0, _HERE)
+
+from corpus import STYLES, generate  # noqa: E402
+
+VARIANTS = (
+    "none",
+    "metaclass",
+    "metaclass_lazy",
+    "metaclass_dedupe",
+    "metaclass_shared",
+    "doc_inherit",
+    "inherit_docstrings",
+)
+
+PHASES = ("import custom_inherit", "import package", "first docstring access", "second docstring access")
+
+_MEASURE = '''
+import inspect, sys, time
+
+start = time.perf_counter()
+import custom_inherit
+imported = time.perf_counter()
+import {package}
+created = time.perf_counter()
+
+def read_docs():
+    for cls in {package}.CLASSES:
+        inspect.getdoc(cls)
+        for name in {package}.METHODS:
+            inspect.getdoc(getattr(cls, name))
+
+read_docs()
+first_access = time.perf_counter()
+read_docs()
+second_access = time.perf_counter()
+
+try:
+    import resource
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # in bytes
+        peak_kib //= 1024
+except ImportError:
+    peak_kib = None
+
+print(repr(([imported - start, created - imported, first_access - created, second_access - first_access], peak_kib)))
+'''
+
+
+class _DocPool(object):
+    """ Cycles through the (parent, child) docstring pairs of the corpus."""
+
+    def __init__(self, style, size, num_items, seed):
+        self._pairs = generate(style, size, num_items, seed)
+        self._count = 0
+
+    def parent(self):
+        return self._pairs[0][0]
+
+    def child(self):
+        self._count += 1
+        return self._pairs[self._count % len(self._pairs)][1]
+
+
+def _class_source(name, bases, doc, methods, method_docs, variant, style, decorated_parent=None):
+    lines = []
+    if variant == "inherit_docstrings":
+        lines.append("@inherit_docstrings(style={!r})".format(style))
+    lines.append("class {}({}):".format(name, ", ".join(bases)))
+    lines.append("    {!r}".format(doc))
+    for method, method_doc in zip(methods, method_docs):
+        lines.append("")
+        if variant == "doc_inherit" and decorated_parent is not None:
+            lines.append("    @doc_inherit({}.{}, style={!r})".format(decorated_parent, method, style))
+        lines.append("    def {}(self):".format(method))
+        lines.append("        {!r}".format(method_doc))
+    return "\n".join(lines) + "\n\n"
+
+
+def generate_package(directory, package, variant, style, depth, width, fan_in, num_methods, pool_size, seed):
+    """ Write the package `package`, of the given shape and variant of inheritance, within `directory`.
+
+    Returns
+    -------
+    int
+        The number of classes of the package."""
+    pool = _DocPool(style, pool_size, num_items=8, seed=seed)
+    methods = ["method_{}".format(i) for i in range(num_methods)]
+    header = "from custom_inherit import DocInheritMeta, doc_inherit, inherit_docstrings\n\n"
+
+    root_path = os.path.join(directory, package)
+    os.makedirs(root_path)
+
+    metaclass = {
+        "metaclass": "metaclass=DocInheritMeta(style={!r})".format(style),
+        "metaclass_lazy": "metaclass=DocInheritMeta(style={!r}, lazy=True)".format(style),
+        "metaclass_dedupe": "metaclass=DocInheritMeta(style={!r}, dedupe=True)".format(style),
+        "metaclass_shared": "metaclass=DocInheritMeta(style={!r}, share_sections=True)".format(style),
+    }.get(variant)
+    source = header + _class_source(
+        "Root",
+        ["object"] + ([metaclass] if metaclass else []),
+        pool.parent(),
+        methods,
+        [pool.parent()] * num_methods,
+        "none" if variant == "inherit_docstrings" else variant,
+        style,
+    )
+    mixins = ["Mixin{}".format(i) for i in range(fan_in)]
+    for mixin in mixins:
+        source += _class_source(
+            mixin,
+            ["object"] + ([metaclass] if metaclass else []),
+            pool.parent(),
+            methods,
+            [pool.parent()] * num_methods,
+            "none" if variant == "inherit_docstrings" else variant,
+            style,
+        )
+    with open(os.path.join(root_path, "level_0.py"), "w") as f:
+        f.write(source)
+
+    previous = ["Root"]
+    all_classes = ["level_0." + name for name in ["Root"] + mixins]
+    for level in range(1, depth + 1):
+        source = header + "from .level_0 import {}\nfrom .level_{} import *\n\n".format(
+            ", ".join(["Root"] + mixins), level - 1
+        )
+        names = []
+        for i in range(width):
+            name = "C{}_{}".format(level, i)
+            parent = previous[i % len(previous)]
+            bases = [parent] + mixins
+            source += _class_source(name, bases, pool.child(), methods, [pool.child() for _ in methods], variant, style, parent)
+            names.append(name)
+        source += "__all__ = {!r}\n".format(names + ["Root"] + mixins)
+        with open(os.path.join(root_path, "level_{}.py".format(level)), "w") as f:
+            f.write(source)
+        all_classes += ["level_{}.{}".format(level, name) for name in names]
+        previous = names
+
+    with open(os.path.join(root_path, "__init__.py"), "w") as f:
+        f.write("from . import {}\n\n".format(", ".join("level_{}".format(level) for level in range(depth + 1))))
+        f.write("CLASSES = [{}]\n".format(", ".join(all_classes)))
+        f.write("METHODS = {!r}\n".format(methods))
+    return len(all_classes)
+
+
+def run(directory, package, runs):
+    """ The median duration of each phase, and the median peak memory, over `runs` fresh imports of `package`."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [directory, _SRC, env.get("PYTHONPATH")]))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = os.path.join(directory, "__pycache__")
+    code = _MEASURE.format(package=package)
+    subprocess.check_call([sys.executable, "-c", "import " + package], env=env)  # caches the bytecode
+
+    measures = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code], env=env).decode()
+        measures.append(ast.literal_eval(output))
+    timings = [statistics.median(measure[0][phase] for measure in measures) for phase in range(len(PHASES))]
+    peaks = [measure[1] for measure in measures if measure[1] is not None]
+    return timings, (statistics.median(peaks) if peaks else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=10, help="number of levels of the hierarchy")
+    parser.add_argument("--width", type=int, default=50, help="number of classes per level")
+    parser.add_argument("--fan-in", type=int, default=2, help="number of mixins of each class")
+    parser.add_argument("--methods", type=int, default=5, help="number of methods of each class")
+    parser.add_argument("--style", choices=STYLES, default="numpy")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="comma-separated variants to measure")
+    parser.add_argument("--pool", type=int, default=100, help="number of distinct docstring pairs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    args = parser.parse_args(argv)
+
+    variants = args.variants.split(",")
+    unknown = set(variants) - set(VARIANTS)
+    if unknown:
+        parser.error("unknown variants: {}".format(", ".join(sorted(unknown))))
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for variant in variants:
+            package = "hierarchy_" + variant
+            num_classes = generate_package(
+                directory, package, variant, args.style, args.depth, args.width, args.fan_in, args.methods,
+                args.pool, args.seed,
+            )
+            timings, peak_kib = run(directory, package, args.runs)
+            results[variant] = {"seconds": dict(zip(PHASES, timings)), "peak_memory_kib": peak_kib}
+
+    print("{} classes, {} methods each, {} style; median of {} runs".format(
+        num_classes, args.methods, args.style, args.runs
+    ))
+    print("{:<26}".format("phase (ms)") + "".join("{:>20}".format(variant) for variant in variants))
+    for phase in PHASES:
+        print("{:<26}".format(phase) + "".join(
+            "{:>20.1f}".format(results[variant]["seconds"][phase] * 1e3) for variant in variants
+        ))
+    print("{:<26}".format("peak memory (MiB)") + "".join(
+        "{:>20}".format(
+            "n/a" if results[variant]["peak_memory_kib"] is None
+            else "{:.1f}".format(results[variant]["peak_memory_kib"] / 1024)
+        )
+        for variant in variants
+    ))
+
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key != "output"}
+        with open(args.output, "w") as f:
+            json.dump({"config": config, "classes": num_classes, "results": results}, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
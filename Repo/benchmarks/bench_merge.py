@@ -0,0 +1,142 @@
+""" Benchmarks the docstring parsers and merge functions on a synthetic corpus (see corpus.py).
+
+Usage:
+    python benchmarks/bench_merge.py [--pairs 50] [--items 8] [--seed 0] [--repeat 5] [--parse-cache]
+                                     [--output results.json] [--baseline baseline.json] [--tolerance 0.1]
+
+Each benchmark merges every (parent, child) pair of the corpus; the fastest of `--repeat` timings is reported,
+per merge. The parse cache is disabled unless `--parse-cache` is given, so that each merge parses both of its
+docstrings. The results are printed, and written as JSON to `--output`; given a `--baseline` (the JSON output
+of a previous run) they are compared with it, and the script exits with status 1 if any benchmark is slower
+than its baseline by more than `--tolerance` (a fraction).
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(os.path.dirname(_HERE), "src"), _HERE]
+
+import custom_inherit  # noqa: E402
+from custom_inherit._doc_parse_tools import (  # noqa: E402
+    merge_google_napoleon_docs,
+    merge_numpy_docs,
+    merge_numpy_napoleon_docs,
+    merge_rest_docs,
+    section_items,
+)
+from custom_inherit._doc_parse_tools.numpy_parse_tools import parse_numpy_doc  # noqa: E402
+
+from corpus import generate  # noqa: E402
+
+
+def _merge_pairs(merge, pairs, **kwargs):
+    def run():
+        for prnt_doc, child_doc in pairs:
+            merge(prnt_doc, child_doc, **kwargs)
+
+    return run
+
+
+def _section_items_pairs(pairs):
+    """ The parsed Parameters sections of the numpy pairs, as merged by section_items.merge."""
+    return [(parse_numpy_doc(prnt)["Parameters"], parse_numpy_doc(child)["Parameters"]) for prnt, child in pairs]
+
+
+def benchmarks(num_pairs, num_items, seed):
+    """ The benchmarks, by name: (function running all of the merges, number of merges)."""
+    numpy_pairs = generate("numpy", num_pairs, num_items, seed)
+    google_pairs = generate("google", num_pairs, num_items, seed)
+    rest_pairs = generate("reST", num_pairs, num_items, seed)
+    items_pairs = _section_items_pairs(numpy_pairs)
+
+    cases = {
+        "merge_numpy_docs": _merge_pairs(merge_numpy_docs, numpy_pairs),
+        "merge_numpy_docs[merge_within_sections]": _merge_pairs(
+            merge_numpy_docs, numpy_pairs, merge_within_sections=True
+        ),
+        "merge_numpy_napoleon_docs": _merge_pairs(merge_numpy_napoleon_docs, numpy_pairs),
+        "merge_google_napoleon_docs": _merge_pairs(merge_google_napoleon_docs, google_pairs),
+        "merge_google_napoleon_docs[merge_within_sections]": _merge_pairs(
+            merge_google_napoleon_docs, google_pairs, merge_within_sections=True
+        ),
+        "merge_rest_docs": _merge_pairs(merge_rest_docs, rest_pairs),
+        "section_items.merge": _merge_pairs(section_items.merge, items_pairs, merge_within_sections=False, style="numpy"),
+        "section_items.merge[merge_within_sections]": _merge_pairs(
+            section_items.merge, items_pairs, merge_within_sections=True, style="numpy"
+        ),
+    }
+    return {name: (run, num_pairs) for name, run in cases.items()}
+
+
+def measure(run, repeat):
+    """ The fastest duration, in seconds, of a call to `run` over `repeat` timings."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(results, baseline, tolerance):
+    """ Print the ratio of each result to its baseline; return the names of the regressed benchmarks."""
+    regressions = []
+    for name, result in sorted(results.items()):
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            print("{:<52} (no baseline)".format(name))
+            continue
+        ratio = result["seconds_per_merge"] / reference["seconds_per_merge"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print("{:<52} {:6.2f}x the baseline{}".format(name, ratio, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=50, help="number of (parent, child) docstring pairs")
+    parser.add_argument("--items", type=int, default=8, help="number of parameters documented by a parent")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--parse-cache", action="store_true", help="keep the parse cache enabled")
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if not args.parse_cache:
+        custom_inherit.parse_cache.maxsize = 0
+
+    results = {}
+    for name, (run, num_merges) in benchmarks(args.pairs, args.items, args.seed).items():
+        results[name] = {"seconds_per_merge": measure(run, args.repeat) / num_merges}
+        print("{:<52} {:9.2f} us per merge".format(name, results[name]["seconds_per_merge"] * 1e6))
+
+    output = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "custom_inherit": custom_inherit.__version__,
+        "config": {"pairs": args.pairs, "items": args.items, "seed": args.seed, "parse_cache": args.parse_cache},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != output["config"]:
+            print("warning: the baseline was measured with a different configuration: {}".format(baseline.get("config")))
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+""" Measures how the splitting of a section into its items scales with the number of items.
+
+Usage:
+    python benchmarks/bench_split_items.py [--sizes 10,100,1000,10000] [--repeat 5] [--max-ratio 10]
+
+A numpy-style section of each size is split by `section_items._split_items`; the fastest of `--repeat` timings
+is reported, along with the time per item. The script exits with status 1 if the time per item of any size
+exceeds `--max-ratio` times that of the smallest size, i.e. upon super-linear (e.g. quadratic) behavior.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from custom_inherit._doc_parse_tools.section_items import _split_items  # noqa: E402
+
+
+def section(num_items):
+    """ The content of a numpy-style section of `num_items` items, each with a two-line description."""
+    return "\n".join("x{0} : int\n    {1}\n{2}".format(i, "*" * 50, "*" * 50) for i in range(num_items))
+
+
+def measure(num_items, repeat):
+    """ The fastest duration, in seconds, of splitting a section of `num_items` items."""
+    content = section(num_items)
+    assert len(_split_items(content)) == num_items
+    number = max(1, 10000 // num_items)
+    return min(timeit.repeat(lambda: _split_items(content), number=number, repeat=repeat)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ratio", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    per_item = dict()
+    for size in sizes:
+        duration = measure(size, args.repeat)
+        per_item[size] = duration / size
+        print("{:>8} items: {:10.3f} ms, {:8.3f} us per item".format(size, duration * 1e3, per_item[size] * 1e6))
+    ratio = max(per_item.values()) / per_item[sizes[0]]
+    print("largest ratio of the time per item to that of {} items: {:.1f} (max: {:.1f})".format(
+        sizes[0], ratio, args.max_ratio
+    ))
+    return 0 if ratio <= args.max_ratio else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
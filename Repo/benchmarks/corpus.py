@@ -0,0 +1,150 @@
+""" A seeded generator of synthetic, realistic, parent and child docstrings, in the numpy, google and reST styles.
+
+A parent docstring documents a summary, an extended summary, parameters, return values, raised exceptions,
+notes and examples. Its child overrides the summary, documents some parameters anew and adds a few, and
+documents its own return value, as a method overriding its parent's typically does.
+"""
+
+import random
+import textwrap
+
+__all__ = ["STYLES", "generate"]
+
+STYLES = ("numpy", "google", "reST")
+
+_WORDS = (
+    "array axis batch buffer cache column data default dimension element field file index input item key "
+    "label length mapping mask matrix mode name number object offset order output parameter path point "
+    "range rate record result sample scale shape size source state step string table target value vector "
+    "weight window"
+).split()
+
+_TYPES = ("int", "float", "str", "bool", "Optional[int]", "Sequence[float]", "Dict[str, Any]", "numpy.ndarray")
+
+
+def _sentence(rng, num_words):
+    words = [rng.choice(_WORDS) for _ in range(num_words)]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng, num_sentences):
+    text = " ".join(_sentence(rng, rng.randint(5, 12)) for _ in range(num_sentences))
+    return textwrap.fill(text, 72)
+
+
+def _items(rng, num_items, prefix):
+    return [
+        ("{}_{}".format(prefix, rng.choice(_WORDS)) + str(i), rng.choice(_TYPES), _paragraph(rng, rng.randint(1, 2)))
+        for i in range(num_items)
+    ]
+
+
+def _sections(rng, num_items, child):
+    """ The contents of a docstring, as an ordered list of (section name, body); items are (name, type,
+    description) triples."""
+    sections = [("Summary", _sentence(rng, 8))]
+    if not child:
+        sections.append(("Extended", _paragraph(rng, 3)))
+        sections.append(("Parameters", _items(rng, num_items, "param")))
+        sections.append(("Returns", [("", rng.choice(_TYPES), _paragraph(rng, 1))]))
+        sections.append(("Raises", [("", "ValueError", _paragraph(rng, 1))]))
+        sections.append(("Notes", _paragraph(rng, 4)))
+        sections.append(("Examples", ">>> obj.method(1, 2)\n3"))
+    else:
+        sections.append(("Parameters", _items(rng, max(1, num_items // 4), "param")))
+        sections.append(("Returns", [("", rng.choice(_TYPES), _paragraph(rng, 1))]))
+    return sections
+
+
+def _render_numpy(sections):
+    lines = []
+    for name, body in sections:
+        if name in ("Summary", "Extended"):
+            lines += [body, ""]
+            continue
+        lines += [name, "-" * len(name)]
+        if isinstance(body, list):
+            for item, type_, description in body:
+                lines.append("{} : {}".format(item, type_) if item else type_)
+                lines.append(textwrap.indent(description, "    "))
+        else:
+            lines.append(body)
+        lines.append("")
+    return lines
+
+
+_GOOGLE_HEADERS = {"Parameters": "Args", "Returns": "Returns", "Raises": "Raises", "Notes": "Note", "Examples": "Examples"}
+
+
+def _render_google(sections):
+    lines = []
+    for name, body in sections:
+        if name in ("Summary", "Extended"):
+            lines += [body, ""]
+            continue
+        lines.append(_GOOGLE_HEADERS[name] + ":")
+        if isinstance(body, list):
+            for item, type_, description in body:
+                description = textwrap.indent(description, "        ").lstrip()
+                if item:
+                    lines.append("    {} ({}): {}".format(item, type_, description))
+                else:
+                    lines.append("    {}: {}".format(type_, description))
+        else:
+            lines.append(textwrap.indent(body, "    "))
+        lines.append("")
+    return lines
+
+
+def _render_rest(sections):
+    lines = []
+    for name, body in sections:
+        if name in ("Summary", "Extended"):
+            lines += [body, ""]
+            continue
+        lines += [name, "~" * len(name)]
+        if isinstance(body, list):
+            for item, type_, description in body:
+                lines.append("- **{}** ({}) -- {}".format(item, type_, description) if item else "- " + description)
+        else:
+            lines.append(body)
+        lines.append("")
+    return lines
+
+
+_RENDERERS = {"numpy": _render_numpy, "google": _render_google, "reST": _render_rest}
+
+
+def _render(style, sections, indent):
+    lines = _RENDERERS[style](sections)
+    # as written in source code: the first line follows the quotes, the others are indented
+    return lines[0] + "\n" + textwrap.indent("\n".join(lines[1:]).rstrip(), indent) + "\n" + indent
+
+
+def generate(style, num_pairs=50, num_items=8, seed=0):
+    """ Generate (parent docstring, child docstring) pairs.
+
+    Parameters
+    ----------
+    style : str
+        One of "numpy", "google" and "reST".
+    num_pairs : int
+        The number of pairs.
+    num_items : int
+        The number of parameters documented by a parent docstring; its child documents a quarter of them.
+    seed : int
+        The seed of the generator: a given seed always yields the same docstrings.
+
+    Returns
+    -------
+    List[Tuple[str, str]]"""
+    if style not in _RENDERERS:
+        raise ValueError("`style` must be one of {}, got {!r}".format(STYLES, style))
+    rng = random.Random(seed)
+    return [
+        (
+            _render(style, _sections(rng, num_items, child=False), " " * 8),
+            _render(style, _sections(rng, num_items, child=True), " " * 8),
+        )
+        for _ in range(num_pairs)
+    ]
@@ -0,0 +1,52 @@
+""" Measures the time taken by `import custom_inherit` in fresh interpreters, against a budget.
+
+Usage:
+    python benchmarks/import_time.py [--runs 21] [--budget-ms 20]
+
+Each run imports custom_inherit in a new interpreter (with the package's bytecode already cached), so the
+measure includes the standard-library modules that custom_inherit imports and that the interpreter has not
+imported at startup. The median over the runs is compared with the budget; the script exits with status 1 if
+it is exceeded.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+_CODE = "import time; start = time.perf_counter(); import custom_inherit; print(time.perf_counter() - start)"
+
+
+def measure(runs):
+    """ The durations, in seconds, of `runs` imports of custom_inherit, each in a fresh interpreter."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_SRC, env.get("PYTHONPATH")]))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    with tempfile.TemporaryDirectory() as pycache:
+        env["PYTHONPYCACHEPREFIX"] = pycache
+        subprocess.check_call([sys.executable, "-c", "import custom_inherit"], env=env)  # caches the bytecode
+        return [float(subprocess.check_output([sys.executable, "-c", _CODE], env=env)) for _ in range(runs)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=21)
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    durations = measure(args.runs)
+    median = statistics.median(durations) * 1e3
+    print(
+        "import custom_inherit: median {:.1f} ms, min {:.1f} ms, max {:.1f} ms over {} runs (budget: {:.1f} ms)".format(
+            median, min(durations) * 1e3, max(durations) * 1e3, args.runs, args.budget_ms
+        )
+    )
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,40 @@
 from __future__ import absolute_import as _absolute_import
 
+import sys as _sys
 from abc import ABCMeta as _ABCMeta
+from importlib import import_module as _import_module
+from weakref import WeakSet as _WeakSet
 
 from ._decorator_base import DocInheritDecorator as _DocInheritDecorator
 from ._metaclass_base import DocInheritorBase as _DocInheritorBase
+from ._metaclass_base import _clear_dedupe, _retrofit_classes, _retrofit_docstrings, _subclasses
 from . import _style_store
+from . import hooks, instrumentation
+from ._compiled_docs import load_compiled_docs
+from ._doc_parse_tools.parse_cache import parse_cache
+from ._merge_cache import forget_style as _forget_style
+from ._merge_cache import set_pure as _set_pure
+from ._merge_cache import disable_persistent_cache, enable_persistent_cache, merge_cache
 from ._style_store import (
     google, numpy, numpy_napoleon, parent, reST,
     google_with_merge, numpy_napoleon_with_merge, numpy_with_merge
 )
-from ._version import get_versions
 
-__version__ = get_versions()["version"]
-del get_versions
+
+def __getattr__(name):
+    # the version is resolved upon first access: in a source checkout, versioneer queries git for it
+    if name == "__version__":
+        from ._version import get_versions
+
+        global __version__
+        __version__ = get_versions()["version"]
+        return __version__
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if _sys.version_info < (3, 7):  # module-level __getattr__ (PEP 562) is ignored: resolve the version now
+    __getattr__("__version__")
+
 
 try:
     _basestring = basestring
@@ -20,25 +42,84 @@ except NameError:
     _basestring = str  # Python 2 -> 3 alias
 
 
-__all__ = ["DocInheritMeta", "doc_inherit", "store", "add_style", "remove_style"]
+__all__ = [
+    "DocInheritMeta", "doc_inherit", "inherit_docstrings", "getdoc", "apply_to_module", "apply_to_tree",
+    "store", "add_style", "remove_style", "parse_cache", "merge_cache",
+    "enable_persistent_cache", "disable_persistent_cache", "load_compiled_docs",
+    "hooks", "instrumentation", "stats", "memory_report", "clear_dedupe",
+]
+
 
+def _check_style_function(style_func, validation="call"):
+    if validation == "signature":
+        try:
+            from inspect import signature
+        except ImportError:  # Python 2: only the arity of the Python functions and methods is checked
+            from inspect import getcallargs, isfunction, ismethod
 
-def _check_style_function(style_func):
+            if isfunction(style_func) or ismethod(style_func):
+                getcallargs(style_func, "", "")
+                return None
+        else:
+            try:
+                parameters = signature(style_func)
+            except ValueError:  # no signature available (e.g. some built-ins): fall back to calling the function
+                pass
+            else:
+                parameters.bind("", "")
+                return None
     out = style_func("", "")
     if not isinstance(out, _basestring) and out is not None:
         raise TypeError
     return None
 
 
+def _style_entry_points(group):
+    """ The entry points declared under `group`, by name, without loading them."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        return {}
+    try:
+        declared = entry_points(group=group)
+    except TypeError:  # Python < 3.10
+        declared = entry_points().get(group, ())
+    return {entry_point.name: entry_point for entry_point in declared}
+
+
 class _Store(object):
     """ A dictionary-like object that stores the styles available for the doc-inheritance metaclass and decorator,
    respectively.
 
    Only callable objects with the signature: f(Optional[str], Optional[str]) -> Optional[str]
-   can be stored. If f is a valid callable, then _Store()[f] -> f."""
+   can be stored. If f is a valid callable, then _Store()[f] -> f.
+
+   The merges of the styles that are registered as pure (see `_Store.add`) are memoized through
+   `custom_inherit.merge_cache` and/or the persistent cache (see `custom_inherit.enable_persistent_cache`)
+   when those are enabled. The store itself always returns the style functions, so that the metaclasses
+   built for a style do not depend on whether the caches are enabled.
+
+   A callable is validated the first time that it is stored or looked up, and is remembered (weakly) as valid
+   afterwards. By default (`validation = "call"`), it is validated by calling it with two empty docstrings;
+   with `validation = "signature"`, only its signature is checked, and it is never called by the store (except
+   on Python 2, for the callables other than functions and methods, or in the absence of a signature).
+
+   Styles can also be provided by installed distributions, declared as entry points of the group
+   `_Store.entry_point_group` ("custom_inherit.styles"), named after the style, e.g. in a pyproject.toml:
+
+        [project.entry-points."custom_inherit.styles"]
+        my_style = "my_package.styles:my_style"
+
+   Such a style is only imported upon its first look up by name, and is stored afterwards."""
+
+    entry_point_group = "custom_inherit.styles"
 
     def __init__(self, *args, **kwargs):
+        self._validation = "call"
         self._store = dict()
+        self._validated = _WeakSet()  # style functions that passed the validation
+        self._entry_points = None  # style name -> entry point, discovered upon the first unknown style name
+        self._pure = set()  # names of the styles whose output depends only on their inputs
         self.update(*args, **kwargs)
 
     def __repr__(self):
@@ -49,6 +130,9 @@ class _Store(object):
         styles = "\n".join("\t- " + style for style in sorted(self.keys()))
         return "\n".join((out_str, styles))
 
+    def __contains__(self, style_name):
+        return style_name in self._store
+
     def __setitem__(self, style_name, style_func):
         """ Make available a new function for merging a 'parent' and 'child' docstring.
 
@@ -58,33 +142,112 @@ class _Store(object):
             The identifier of the style being logged
         style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
             The style function that merges two docstrings into a single docstring."""
+        self.add(style_name, style_func)
+
+    def add(self, style_name, style_func, pure=False, bind_parent=None, merge_sections=None):
+        """ Make available a new function for merging a 'parent' and 'child' docstring.
+
+        Parameters
+        ----------
+        style_name : Any
+            The identifier of the style being logged
+        style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
+            The style function that merges two docstrings into a single docstring.
+        pure: bool, optional (default: False)
+            Whether the output of `style_func` depends only on the two docstrings that it is
+            passed, and thus can be memoized by the caches of merged docstrings.
+        bind_parent : Optional[Callable[[Optional[str]], Callable[[Optional[str]], Optional[str]]]]
+            If provided, registered as the `bind_parent` hook of `style_func`
+            (see custom_inherit._style_store).
+        merge_sections : Optional[Callable[[Optional[str], Optional[str]], Optional[Sequence[str]]]]
+            If provided, registered as the `merge_sections` hook of `style_func`
+            (see custom_inherit._style_store)."""
         try:
-            _check_style_function(style_func)
+            self._validate(style_func)
         except TypeError:
             raise TypeError(
                 "The style store only stores callables of the form: "
                 "\n\tstyle_func(Optional[str], Optional[str]) -> Optional[str]"
             )
+        self._forget(style_name)
         self._store[style_name] = style_func
+        if bind_parent is not None or merge_sections is not None:
+            _style_store.register_hooks(style_func, bind_parent, merge_sections)
+        if pure:
+            self._pure.add(style_name)
+            _set_pure(style_func)
+
+    @property
+    def validation(self):
+        """ How callables are validated: "call" (by calling them) or "signature" (by their signature)."""
+        return self._validation
+
+    @validation.setter
+    def validation(self, validation):
+        if validation not in ("call", "signature"):
+            raise ValueError("`validation` must be either 'call' or 'signature', got {!r}".format(validation))
+        self._validation = validation
+
+    def _validate(self, style_func):
+        """ Raise TypeError (or ValueError) if `style_func` is not a valid style function, unless it
+        was validated already."""
+        try:
+            if style_func in self._validated:
+                return
+        except TypeError:  # unhashable
+            pass
+        _check_style_function(style_func, self._validation)
+        try:
+            self._validated.add(style_func)
+        except TypeError:  # not weak-referenceable, or unhashable: validated upon each use
+            pass
+
+    def _forget(self, style_name):
+        """ Discard the memoized merges of the style stored as `style_name`, if any."""
+        style_func = self._store.get(style_name)
+        if style_name in self._pure:
+            self._pure.discard(style_name)
+            _forget_style(style_func)
 
     def __getitem__(self, item):
-        """ Given a valid style-ID, retrieve a stored style. If a valid function (callable) is
-        supplied, return it in place.
+        """ Given a valid style-ID, retrieve a stored style; a style that is declared as an entry point
+        is loaded and stored upon its first look up. If a valid function (callable) is supplied, return it
+        in place.
 
         Parameters
         ----------
         item : Union[Any, Callable[Optional[str], Optional[str]], Optional[str]]
             A valid style-ID or style-function."""
         try:
-            return self._store[item]
+            style_func = self._store[item]
         except KeyError:
+            if self._load_entry_point(item):
+                return self[item]
             try:
-                _check_style_function(item)
+                self._validate(item)
                 return item
             except (TypeError, ValueError):
                 raise TypeError(
                     "Either a valid style name or style-function must be specified"
                 )
+        return style_func
+
+    def _load_entry_point(self, style_name):
+        """ Store the style declared as the entry point `style_name` of `entry_point_group`, if any.
+
+        Returns
+        -------
+        bool
+            Whether the style was loaded."""
+        if not isinstance(style_name, _basestring):
+            return False
+        if self._entry_points is None:
+            self._entry_points = _style_entry_points(self.entry_point_group)
+        entry_point = self._entry_points.get(style_name)
+        if entry_point is None:
+            return False
+        self.add(style_name, entry_point.load())
+        return True
 
     def keys(self):
         """  D.keys() -> a set-like object providing a view on D's keys"""
@@ -94,6 +257,8 @@ class _Store(object):
         """ D.pop(k[,d]) -> v, remove specified key and return the corresponding value.
         If key is not found, d is returned if given, otherwise KeyError is raised. """
         if len(args) < 3:
+            if args:
+                self._forget(args[0])
             return self._store.pop(*args)
         else:
             raise TypeError(
@@ -117,10 +282,15 @@ class _Store(object):
         """ D.items() -> a set-like object providing a view on D's items"""
         return self._store.items()
 
-store = _Store([(key, getattr(_style_store, key)) for key in _style_store.__all__])
+store = _Store()
+for _key in _style_store.__all__:
+    # the built-in styles are not validated by a call, which would import their parsers
+    store._validated.add(getattr(_style_store, _key))
+    store.add(_key, getattr(_style_store, _key), pure=True)
+del _key
 
 
-def add_style(style_name, style_func):
+def add_style(style_name, style_func, pure=False, bind_parent=None, merge_sections=None):
     """ Make available a new function for merging a 'parent' and 'child' docstring.
 
     Parameters
@@ -128,8 +298,23 @@ def add_style(style_name, style_func):
     style_name : Any
         The identifier of the style being logged
     style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
-        The style function that merges two docstrings into a single docstring."""
-    store[style_name] = style_func
+        The style function that merges two docstrings into a single docstring.
+    pure: bool, optional (default: False)
+        Whether the output of `style_func` depends only on the two docstrings that it is
+        passed. The merges of pure styles are memoized by `custom_inherit.merge_cache`
+        and by the persistent cache, once those are enabled.
+    bind_parent : Optional[Callable[[Optional[str]], Callable[[Optional[str]], Optional[str]]]]
+        A function that, given a parent docstring, returns a function merging a child docstring
+        with it, as `style_func` does; `doc_inherit` uses it to parse a parent docstring once.
+    merge_sections : Optional[Callable[[Optional[str], Optional[str]], Optional[Sequence[str]]]]
+        A function that merges two docstrings as `style_func` does, but returns the sections of the
+        merged docstring; `DocInheritMeta(..., share_sections=True)` uses it to share them.
+
+    Notes
+    -----
+    The hooks are registered for `style_func` itself: a function that wraps it (e.g. via
+    `functools.wraps`) does not inherit them."""
+    store.add(style_name, style_func, pure=pure, bind_parent=bind_parent, merge_sections=merge_sections)
 
 
 def remove_style(style):
@@ -143,7 +328,18 @@ def remove_style(style):
         store.pop(style)
 
 
-def DocInheritMeta(style="parent", abstract_base_class=False, include_special_methods=False):
+# (merge function, abstract_base_class, include_special_methods, lazy, dedupe, share_sections) -> metaclass
+_metaclass_cache = dict()
+
+
+def DocInheritMeta(
+    style="parent",
+    abstract_base_class=False,
+    include_special_methods=False,
+    lazy=False,
+    dedupe=False,
+    share_sections=False,
+):
     """ A metaclass that merges the respective docstrings of a parent class and of its child, along with their
     properties, methods (including classmethod, staticmethod, decorated methods).
 
@@ -163,22 +359,76 @@ def DocInheritMeta(style="parent", abstract_base_class=False, include_special_me
         Wether special methods of class (i.e. starting en ending with "__") are included in the docstring
         inheritance process.
 
+    lazy: bool, optional (default: False)
+        If True, the docstrings of a class and of its attributes are not merged when the class
+        is created, but only upon the first look up of the class' `__doc__`, or of one of its
+        merged attributes (on the class, on a subclass or on an instance) - e.g. via `help`,
+        `inspect.getdoc`, `pydoc` or Sphinx. The merged docstrings are then memoized. This keeps
+        the cost of defining the classes close to that of `type.__new__`. Until the merge, these
+        attributes are held by stand-in descriptors, which then put the attributes back: the look
+        ups of the merged classes are not slowed down.
+
+    dedupe: bool, optional (default: False)
+        If True, the classes and attributes whose merged docstrings are equal - e.g. the methods of
+        sibling classes that inherit the same parent docstring - share a single string object instead of
+        holding a copy each. The metaclass finds them through a table of the (at most 4096) docstrings
+        that it merged most recently, which holds them until it is cleared by `custom_inherit.clear_dedupe`
+        (e.g. once the package defining the classes is imported), or until the metaclass is freed.
+
+    share_sections: bool, optional (default: False)
+        If True, and the style registers a `merge_sections` hook (as do the built-in styles, except
+        "parent"), the merged docstring of each class is held as a tuple of its sections rather than as a
+        string, and rendered upon each access of the class' `__doc__`. Equal sections (e.g. the Parameters
+        and Raises sections that a hierarchy inherits from its root) are deduplicated through the table of
+        the metaclass (see `dedupe`), and equal tuples of sections are shared, so that the classes reference
+        a single copy of the texts that they have in common. The docstrings of the attributes remain strings
+        (see `dedupe`), as do the class docstrings merged by a style that is memoized by
+        `custom_inherit.merge_cache`.
 
     Returns
     -------
-    custom_inherit.DocInheritorBase"""
+    custom_inherit.DocInheritorBase
+
+    Notes
+    -----
+    The metaclasses are cached: calls with the same arguments (where `style` is resolved to its
+    style function) return the same metaclass, so that class hierarchies created in different
+    modules can be combined. `DocInheritMeta.cache_clear()` empties this cache."""
 
     merge_func = store[style]
-    metaclass = type(_DocInheritorBase.__name__, _DocInheritorBase.__bases__, dict(_DocInheritorBase.__dict__))
+    key = (
+        merge_func,
+        bool(abstract_base_class),
+        bool(include_special_methods),
+        bool(lazy),
+        bool(dedupe),
+        bool(share_sections),
+    )
+    try:
+        return _metaclass_cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable style function
+        key = None
+
+    namespace = dict(_DocInheritorBase.__dict__)
+    metaclass = type(_DocInheritorBase.__name__, _DocInheritorBase.__bases__, namespace)
     metaclass.include_special_methods = include_special_methods
+    metaclass.lazy = lazy
+    metaclass.dedupe = dedupe
+    metaclass.share_sections = share_sections
     metaclass.class_doc_inherit = staticmethod(merge_func)
     metaclass.attr_doc_inherit = staticmethod(merge_func)
 
-    return (
-        metaclass
-        if not abstract_base_class
-        else type("abc" + metaclass.__name__, (_ABCMeta, metaclass), {})
-    )
+    if abstract_base_class:
+        metaclass = type("abc" + metaclass.__name__, (_ABCMeta, metaclass), {})
+
+    if key is None:
+        return metaclass
+    return _metaclass_cache.setdefault(key, metaclass)
+
+
+DocInheritMeta.cache_clear = _metaclass_cache.clear
 
 
 def doc_inherit(parent, style="parent"):
@@ -203,7 +453,190 @@ def doc_inherit(parent, style="parent"):
     `doc_inherit` should always be used as the inner-most decorator when being used in
     conjunction with other decorators, such as `@property`, `@staticmethod`, etc."""
 
-    merge_func = store[style]
-    decorator = _DocInheritDecorator
-    decorator.doc_merger = staticmethod(merge_func)
-    return decorator(parent)
+    return _DocInheritDecorator(parent, store[style])
+
+
+def inherit_docstrings(parents=None, style="parent", include_special_methods=False):
+    """ Returns a class decorator that merges the docstrings of the decorated class, and of its
+    methods and properties, with those of `parents`, based on the specified style.
+
+    This performs the merge of `DocInheritMeta` in a single pass over the class' attributes, without
+    requiring the class to be created by a specific metaclass.
+
+    Parameters
+    ----------
+    parents : Union[None, type, Sequence[type]], optional (default: None)
+        The class(es) whose docstrings are inherited, in order of precedence. By default, the
+        decorated class' own bases.
+
+    style : Union[Any, Callable[[str, str], str]], optional (default: "parent")
+        A valid inheritance-scheme style ID or function that merges two docstrings.
+
+    include_special_methods : bool, optional (default: False)
+        Whether special methods (e.g. __init__) inherit their docstrings.
+
+    Returns
+    -------
+    Callable[[type], type]
+        The decorator, which returns the decorated class itself.
+
+    Notes
+    -----
+    Subclasses of the decorated class are not affected by the decorator; they can be decorated in turn."""
+    mcs = DocInheritMeta(style=style, include_special_methods=include_special_methods)
+
+    def decorator(cls):
+        return _retrofit_docstrings(cls, mcs, parents)
+
+    return decorator
+
+
+def apply_to_module(module, style="parent", include_special_methods=False):
+    """ Merges the docstrings of the classes defined in `module`, and of their methods and properties,
+    with those of their bases, based on the specified style.
+
+    Each class is merged once, after its parents, so that it merges with their already-merged docstrings.
+    Classes whose docstrings have already been merged (e.g. by a `DocInheritMeta` metaclass) are skipped.
+
+    Parameters
+    ----------
+    module : Union[str, types.ModuleType]
+        The module, or the name of the module.
+
+    style : Union[Any, Callable[[str, str], str]], optional (default: "parent")
+        A valid inheritance-scheme style ID or function that merges two docstrings.
+
+    include_special_methods : bool, optional (default: False)
+        Whether special methods (e.g. __init__) inherit their docstrings.
+
+    Returns
+    -------
+    List[type]
+        The classes whose docstrings were merged, in the order in which they were merged."""
+    if isinstance(module, _basestring):
+        module = _import_module(module)
+    mcs = DocInheritMeta(style=style, include_special_methods=include_special_methods)
+    classes = (
+        member
+        for member in list(vars(module).values())
+        if isinstance(member, type) and member.__module__ == module.__name__
+    )
+    return _retrofit_classes(classes, mcs)
+
+
+def apply_to_tree(root_cls, style="parent", include_special_methods=False):
+    """ Merges the docstrings of the (direct and indirect) subclasses of `root_cls`, and of their methods
+    and properties, with those of their bases, based on the specified style.
+
+    Each class is merged once, after its parents, so that it merges with their already-merged docstrings.
+    Classes whose docstrings have already been merged (e.g. by a `DocInheritMeta` metaclass) are skipped;
+    `root_cls` itself is not merged.
+
+    Parameters
+    ----------
+    root_cls : type
+        The root of the class hierarchy.
+
+    style : Union[Any, Callable[[str, str], str]], optional (default: "parent")
+        A valid inheritance-scheme style ID or function that merges two docstrings.
+
+    include_special_methods : bool, optional (default: False)
+        Whether special methods (e.g. __init__) inherit their docstrings.
+
+    Returns
+    -------
+    List[type]
+        The classes whose docstrings were merged, in the order in which they were merged."""
+    mcs = DocInheritMeta(style=style, include_special_methods=include_special_methods)
+    return _retrofit_classes(_subclasses(root_cls), mcs)
+
+
+def getdoc(obj, style="parent", include_special_methods=False):
+    """ Returns the docstring of a class, method or property, merged with those of its ancestors based on
+    the specified style, upon request: i.e. the docstring that it would have if its class had been created by
+    `DocInheritMeta(style, include_special_methods=include_special_methods)`.
+
+    Like `inspect.getdoc`, the docstring is cleaned up with `inspect.cleandoc`. The merged docstrings are
+    memoized for as long as their class exists. The docstrings of classes that are merged already (e.g. by
+    a `DocInheritMeta` metaclass) are returned as they are. Other objects, and objects whose merged docstring is
+    None, are handed to `inspect.getdoc`.
+
+    Parameters
+    ----------
+    obj : Any
+        A class, or a method (or function, classmethod, staticmethod) or property defined in a class.
+        The class of a function or property is found via its qualified name, as by `inspect.getdoc`.
+
+    style : Union[Any, Callable[[str, str], str]], optional (default: "parent")
+        A valid inheritance-scheme style ID or function that merges two docstrings.
+
+    include_special_methods : bool, optional (default: False)
+        Whether special methods (e.g. __init__) inherit their docstrings.
+
+    Returns
+    -------
+    Optional[str]"""
+    from ._getdoc import getdoc as _getdoc
+
+    return _getdoc(obj, DocInheritMeta(style=style, include_special_methods=include_special_methods))
+
+
+def clear_dedupe(metaclass=None, freeze=False):
+    """ Release the docstrings held by the deduplication table of `metaclass` (see `DocInheritMeta`'s
+    `dedupe`), or by those of all of the metaclasses, e.g. once the classes have been imported. The
+    docstrings remain shared by the classes that reference them, and are freed along with them; the
+    docstrings merged afterwards are deduplicated among themselves only.
+
+    Until then, a table holds the 4096 docstrings most recently merged by its metaclass: the older ones
+    are released as newer ones are merged (and are no longer deduplicated), and the table is released
+    along with its metaclass.
+
+    Parameters
+    ----------
+    metaclass : Optional[type]
+        A metaclass returned by `DocInheritMeta`; all of the metaclasses if None.
+    freeze : bool, optional (default: False)
+        If True, the metaclass no longer deduplicates the docstrings that it merges from now on."""
+    _clear_dedupe(metaclass, freeze)
+
+
+def stats():
+    """ Returns a snapshot of the statistics of the docstring merges, gathered while the instrumentation is
+    enabled (see `custom_inherit.instrumentation`): the number, cumulative and maximum durations of the merges
+    of class docstrings, of attribute docstrings and of decorated functions, the number and duration of the
+    merges per style, the number of slow merges, and the hit rates of the caches.
+
+    Returns
+    -------
+    dict
+        See `custom_inherit.instrumentation.stats`."""
+    return instrumentation.stats()
+
+
+def memory_report(root, top=10):
+    """ Reports the memory retained by the docstrings produced by merging within `root`, compared with the
+    original docstrings of the children that they replaced (which remain referenced by the functions' code
+    objects), per module and per class, along with the largest duplicates among the merged docstrings, the
+    memory held by the caches of custom_inherit and, if `tracemalloc` is tracing, by its modules. Sizes are
+    measured with `sys.getsizeof`.
+
+    The docstrings of classes created in lazy mode that have not been accessed yet are not merged, and
+    thus not accounted for.
+
+    Parameters
+    ----------
+    root : Union[type, types.ModuleType, str]
+        A class, whose docstrings and those of all of its subclasses are accounted for; or a module (or the
+        name of an imported module), whose classes and functions are accounted for.
+
+    top : Optional[int], optional (default: 10)
+        The number of duplicate docstrings to report; all of them if None.
+
+    Returns
+    -------
+    custom_inherit._memory_report.MemoryReport
+        A named tuple of the totals, by module and by class, of the duplicates and of the caches, which
+        renders as a table when printed."""
+    from ._memory_report import memory_report as _memory_report
+
+    return _memory_report(root, top)
@@ -0,0 +1,86 @@
+""" Command-line interface of custom_inherit.
+
+    python -m custom_inherit build <package> [--output PATH] [--check]
+    python -m custom_inherit audit <module> [--submodules] [--top N]"""
+
+from __future__ import absolute_import
+
+import argparse
+import sys
+
+
+def _build(args):
+    from ._compiled_docs import build, check
+
+    if args.check:
+        missing, unused = check(args.package, args.output)
+        if missing or unused:
+            print(
+                "{}: the compiled docstrings are stale ({} merges missing or changed, "
+                "{} unused); rebuild them with: python -m custom_inherit build {}".format(
+                    args.package, missing, unused, args.package
+                )
+            )
+            return 1
+        print("{}: the compiled docstrings are up to date".format(args.package))
+        return 0
+
+    path, count = build(args.package, args.output)
+    print("{}: compiled {} merged docstrings into {}".format(args.package, count, path))
+    return 0
+
+
+def _audit(args):
+    from ._audit import audit, format_report
+
+    if args.top is not None and args.top < 1:
+        raise SystemExit("--top must be a positive integer")
+    sys.path.insert(0, "")  # as `python -m` does, so that the modules of the working directory can be audited
+    print(format_report(audit(args.module, args.submodules), args.top))
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m custom_inherit")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    build = commands.add_parser(
+        "build",
+        help="compile the merged docstrings of a package ahead of time",
+        description="Import a package, and all of its submodules, and record the docstrings merged "
+        "with pure styles into a sidecar file within the package. A package that calls "
+        "`custom_inherit.load_compiled_docs(__name__)` then serves those merges without parsing.",
+    )
+    build.add_argument("package", help="the name of the package to compile")
+    build.add_argument("-o", "--output", help="the path of the compiled docstrings")
+    build.add_argument(
+        "--check",
+        action="store_true",
+        help="do not write anything, but exit with status 1 if the compiled docstrings are stale",
+    )
+    build.set_defaults(handler=_build)
+
+    audit = commands.add_parser(
+        "audit",
+        help="report the time spent merging docstrings while importing a module",
+        description="Import a module and report the docstring merges that it performs (via its "
+        "metaclasses and decorators), as a tree of modules and classes ranked by merge time, along "
+        "with the number of merges, the styles used and the size of the docstrings produced. The "
+        "docstrings of classes created in lazy mode are only merged upon access, and thus not reported.",
+    )
+    audit.add_argument("module", help="the name of the module to audit")
+    audit.add_argument(
+        "--submodules", action="store_true", help="also import all of the submodules of the package"
+    )
+    audit.add_argument(
+        "--top", type=int, help="show at most this many modules, and classes per module (default: all)"
+    )
+    audit.set_defaults(handler=_audit)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
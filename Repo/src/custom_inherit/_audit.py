@@ -0,0 +1,148 @@
+from __future__ import absolute_import
+
+import importlib
+import sys
+from collections import namedtuple
+
+from . import instrumentation
+from ._compiled_docs import _import_submodules
+
+""" Exposes the audit of the docstring merges that importing a module performs, by module and by class."""
+
+__all__ = ["Entry", "audit", "format_report"]
+
+
+# The merges attributed to a module, or to a class (or, for decorated functions, to the name of their class,
+# or to "<functions>" for the module-level ones): their cumulative duration, number, styles (by name), and
+# the size (in UTF-8 bytes) of the docstrings that they produced. `children` holds the entries of a module's
+# classes.
+Entry = namedtuple("Entry", ["name", "seconds", "merges", "styles", "size", "children"])
+
+# Python 2 encodes lone surrogates to UTF-8 without an error handler.
+_errors = "surrogatepass" if sys.version_info[0] > 2 else "strict"
+
+
+def _utf8_size(doc):
+    if isinstance(doc, bytes):  # Python 2 str
+        return len(doc)
+    return len(doc.encode("utf-8", _errors)) if doc is not None else 0
+
+
+class _Collector(object):
+    """ Listens to the merges (see custom_inherit.instrumentation), and totals them per module and per owner."""
+
+    def __init__(self):
+        # module -> owner -> [seconds, merges, set of styles, {attribute name: size of the produced docstring}]
+        self.modules = dict()
+
+    def __call__(self, event, doc):
+        owner = event.owner
+        if owner is None:
+            owner = "<functions>"
+        elif not isinstance(owner, str):
+            owner = getattr(owner, "__qualname__", owner.__name__)  # Python 2: no qualified names
+        owners = self.modules.setdefault(event.module or "<unknown>", dict())
+        totals = owners.get(owner)
+        if totals is None:
+            totals = owners[owner] = [0.0, 0, set(), dict()]
+        totals[0] += event.elapsed_ns / 1e9
+        totals[1] += 1
+        totals[2].add(instrumentation._style_name(event.style))
+        # the docstring of a class is merged once per ancestor: only the last merge is kept
+        totals[3][event.name] = _utf8_size(doc)
+
+    def entries(self):
+        """ The entries of the modules, with those of their classes, ranked by decreasing merge time."""
+        modules = []
+        for module, owners in self.modules.items():
+            children = sorted(
+                (
+                    Entry(owner, seconds, merges, tuple(sorted(styles)), sum(sizes.values()), ())
+                    for owner, (seconds, merges, styles, sizes) in owners.items()
+                ),
+                key=lambda entry: -entry.seconds,
+            )
+            modules.append(
+                Entry(
+                    module,
+                    sum(child.seconds for child in children),
+                    sum(child.merges for child in children),
+                    tuple(sorted(set(style for child in children for style in child.styles))),
+                    sum(child.size for child in children),
+                    tuple(children),
+                )
+            )
+        return sorted(modules, key=lambda entry: -entry.seconds)
+
+
+def audit(module_name, submodules=False):
+    """ Import a module, timing the docstring merges that it performs.
+
+    Only the merges performed while importing are accounted for: those of classes created in lazy mode
+    are not, unless their docstrings are accessed upon import.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module, which should not have been imported yet.
+    submodules : bool, optional (default: False)
+        Whether to also import all of the submodules of the package `module_name`.
+
+    Returns
+    -------
+    List[Entry]
+        The modules that performed merges, ranked by decreasing merge time."""
+    collector = _Collector()
+    instrumentation._add_listener(collector)
+    try:
+        package = importlib.import_module(module_name)
+        if submodules:
+            _import_submodules(package)
+    finally:
+        instrumentation._remove_listener(collector)
+    return collector.entries()
+
+
+def format_report(entries, top=None):
+    """ Render the entries returned by `audit` as a tree of modules and classes.
+
+    Parameters
+    ----------
+    entries : List[Entry]
+    top : Optional[int]
+        The maximum number of modules, and of classes per module, to show; all of them if None.
+
+    Returns
+    -------
+    str"""
+    total = Entry(
+        "total",
+        sum(entry.seconds for entry in entries),
+        sum(entry.merges for entry in entries),
+        (),
+        sum(entry.size for entry in entries),
+        (),
+    )
+    lines = [
+        "{:>10} | {:>7} | {:>9} | {:<20} | {}".format("time (ms)", "merges", "bytes", "styles", "module / class"),
+        _format_line(total, 0),
+    ]
+    for module in entries[:top]:
+        lines.append(_format_line(module, 1))
+        for child in module.children[:top]:
+            lines.append(_format_line(child, 2))
+        if top is not None and len(module.children) > top:
+            lines.append(_format_more(len(module.children) - top, "classes", 2))
+    if top is not None and len(entries) > top:
+        lines.append(_format_more(len(entries) - top, "modules", 1))
+    return "\n".join(lines)
+
+
+def _format_more(count, what, depth):
+    return "{:>10} | {:>7} | {:>9} | {:<20} | {}... {} more {}".format("", "", "", "", "  " * depth, count, what)
+
+
+def _format_line(entry, depth):
+    return "{:>10.2f} | {:>7} | {:>9} | {:<20} | {}{}".format(
+        entry.seconds * 1e3, entry.merges, entry.size, ",".join(entry.styles), "  " * depth, entry.name
+    )
@@ -0,0 +1,165 @@
+from __future__ import absolute_import
+
+import importlib
+import marshal
+import os
+import sys
+
+from . import _merge_cache
+from ._metaclass_base import _resolve_all_lazy
+
+""" Exposes the ahead-of-time compilation of the merged docstrings of a package.
+
+    Compiling a package imports it, along with all of its submodules, and records every merge
+    performed - by the metaclasses and the decorators - with a pure style. The merged docstrings
+    are written to a sidecar file within the package, which the package loads at import time
+    (via `load_compiled_docs`) so that the merges are served without parsing any docstring."""
+
+__all__ = ["ARTIFACT_NAME", "artifact_path", "build", "check", "load_compiled_docs"]
+
+
+ARTIFACT_NAME = "_custom_inherit_docs.marshal"
+
+
+def _version():
+    from . import __version__
+
+    return __version__
+
+
+def _module(package):
+    return sys.modules[package] if isinstance(package, str) else package
+
+
+def artifact_path(package):
+    """ The path of the compiled docstrings of `package`.
+
+    Parameters
+    ----------
+    package : Union[str, ModuleType]
+        The (name of the) imported package.
+
+    Returns
+    -------
+    str"""
+    return os.path.join(os.path.dirname(os.path.abspath(_module(package).__file__)), ARTIFACT_NAME)
+
+
+def _read(path):
+    """ The merges stored in the compiled docstrings at `path`, or None if they cannot be
+    read or were compiled by another version of custom_inherit."""
+    try:
+        with open(path, "rb") as f:
+            artifact = marshal.load(f)
+    except (OSError, IOError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(artifact, dict) or artifact.get("version") != _version():
+        return None
+    return artifact.get("merges")
+
+
+def load_compiled_docs(package):
+    """ Serve the merges of pure styles from the docstrings compiled ahead of time for `package`
+    (see `python -m custom_inherit build --help`).
+
+    This should be called at the top of the package's `__init__.py`, before any class is defined:
+
+        import custom_inherit
+        custom_inherit.load_compiled_docs(__name__)
+
+    Parameters
+    ----------
+    package : Union[str, ModuleType]
+        The (name of the) package.
+
+    Returns
+    -------
+    bool
+        Whether the compiled docstrings were loaded. This is a no-op returning False while the
+        package is being compiled, or if the compiled docstrings are missing or out of date
+        with respect to the version of custom_inherit."""
+    if _merge_cache.recorded_docs is not None:
+        return False
+    merges = _read(artifact_path(package))
+    if merges is None:
+        return False
+    _merge_cache.compiled_docs.update(merges)
+    return True
+
+
+def _import_submodules(package):
+    """ Import all of the submodules of the imported `package`, skipping (with a warning) those that fail."""
+    import pkgutil
+
+    for module_info in pkgutil.walk_packages(
+        getattr(package, "__path__", []), package.__name__ + ".", onerror=lambda name: None
+    ):
+        try:
+            importlib.import_module(module_info[1])
+        except Exception as err:
+            sys.stderr.write("custom_inherit: skipping {}: {!r}\n".format(module_info[1], err))
+
+
+def _record(package_name):
+    """ Import the package and all of its submodules, recording the merges that they perform.
+
+    Returns
+    -------
+    Tuple[ModuleType, Dict[bytes, Optional[str]]]"""
+    recorded = dict()
+    _merge_cache.recorded_docs = recorded
+    try:
+        package = importlib.import_module(package_name)
+        _import_submodules(package)
+        _resolve_all_lazy()
+    finally:
+        _merge_cache.recorded_docs = None
+    return package, recorded
+
+
+def build(package_name, output=None):
+    """ Compile the merged docstrings of a package.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, which must not have been imported yet.
+    output : Optional[str]
+        The path of the compiled docstrings; defaults to `artifact_path(package_name)`.
+
+    Returns
+    -------
+    Tuple[str, int]
+        The path of the compiled docstrings, and the number of merges that they hold."""
+    package, merges = _record(package_name)
+    path = output if output is not None else artifact_path(package)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        marshal.dump({"version": _version(), "merges": merges}, f)
+    getattr(os, "replace", os.rename)(tmp_path, path)  # Python 2: os.rename, which does not replace on Windows
+    return path, len(merges)
+
+
+def check(package_name, path=None):
+    """ Compare the compiled docstrings of a package with the merges that it performs.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, which must not have been imported yet.
+    path : Optional[str]
+        The path of the compiled docstrings; defaults to `artifact_path(package_name)`.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The number of merges that are missing from (or differ in) the compiled docstrings, and the
+        number of compiled merges that are no longer performed. The compiled docstrings are stale
+        unless both are zero. If they cannot be read, all of the merges are reported as missing."""
+    package, merges = _record(package_name)
+    compiled = _read(path if path is not None else artifact_path(package))
+    if compiled is None:
+        return len(merges) or 1, 0
+    missing = sum(1 for key, doc in merges.items() if key not in compiled or compiled[key] != doc)
+    unused = sum(1 for key in compiled if key not in merges)
+    return missing, unused
@@ -1,3 +1,7 @@
+from functools import partial
+
+from . import _merge_cache, _style_store, instrumentation
+
 try:
     basestring
 except NameError:
@@ -20,18 +24,33 @@ class DocInheritDecorator(object):
     Notes
     -----
     When utilized as the inner-most decorator, this decorator can be used on functions decorated functions,
-    methods, properties, static methods, class methods, and their abstract counterparts."""
+    methods, properties, static methods, class methods, and their abstract counterparts.
 
-    def __init__(self, prnt_doc):
+    If `doc_merger` has a registered `bind_parent` hook (see custom_inherit._style_store), the parent
+    docstring is prepared by it once, and reused for every function that is decorated by the instance.
+    The merges of a pure style are memoized instead if a cache of merged docstrings is enabled when
+    the instance is created (see custom_inherit._merge_cache.merger)."""
+
+    def __init__(self, prnt_doc, doc_merger=None):
         """
         Parameters
         ----------
         prnt_doc : Union[str, Any]
             The docstring, or object of which the docstring is utilized as the
-            parent docstring during the docstring merge."""
+            parent docstring during the docstring merge.
+        doc_merger : Optional[Callable[[Optional[str], Optional[str]], Optional[str]]]
+            Merges the parent and child docstrings, for this instance only. Defaults to
+            DocInheritDecorator.doc_merger."""
         self.prnt_doc = (
             prnt_doc if isinstance(prnt_doc, basestring) else prnt_doc.__doc__
         )
+        if doc_merger is not None:
+            self.doc_merger = doc_merger
+        merge = _merge_cache.merger(self.doc_merger)
+        bind_parent = _style_store.bind_parent_of(merge)
+        self._merge_with_parent = (
+            bind_parent(self.prnt_doc) if bind_parent is not None else partial(merge, self.prnt_doc)
+        )
 
     def __call__(self, func):
         """
@@ -45,7 +64,14 @@ class DocInheritDecorator(object):
         FunctionType
             The decorated function/method/property whose docstring is given by
             DocInheritDecorator.doc_merger(prnt_attr_doc, child_doc)"""
-        func.__doc__ = self.doc_merger(self.prnt_doc, func.__doc__)
+        if instrumentation._active:
+            qualname = getattr(func, "__qualname__", "").rpartition(".")
+            func.__doc__ = instrumentation._timed(
+                instrumentation.DECORATOR_MERGE, getattr(func, "__module__", None), qualname[0] or None,
+                qualname[2] or None, self.doc_merger, self.prnt_doc, func.__doc__, self._merge_with_parent,
+            )
+        else:
+            func.__doc__ = self._merge_with_parent(func.__doc__)
         return func
 
     @staticmethod
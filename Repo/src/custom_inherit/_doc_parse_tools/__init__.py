@@ -1,13 +1,54 @@
 from __future__ import absolute_import
 
-from .napoleon_parse_tools import (merge_google_napoleon_docs,
-                                   merge_numpy_napoleon_docs)
-from .numpy_parse_tools import merge_numpy_docs
-from .rest_parse_tools import merge_rest_docs
+from importlib import import_module
+
+""" The docstring parsers, and the merge functions built on them. The parser modules are imported upon
+    the first call of one of their functions."""
 
 __all__ = [
     "merge_numpy_docs",
     "merge_rest_docs",
     "merge_numpy_napoleon_docs",
     "merge_google_napoleon_docs",
+    "bind_numpy_docs",
+    "bind_rest_docs",
+    "bind_numpy_napoleon_docs",
+    "bind_google_napoleon_docs",
+    "merge_numpy_sections",
+    "merge_rest_sections",
+    "merge_numpy_napoleon_sections",
+    "merge_google_napoleon_sections",
 ]
+
+_MODULES = {
+    "merge_numpy_docs": "numpy_parse_tools",
+    "merge_rest_docs": "rest_parse_tools",
+    "merge_numpy_napoleon_docs": "napoleon_parse_tools",
+    "merge_google_napoleon_docs": "napoleon_parse_tools",
+    "bind_numpy_docs": "numpy_parse_tools",
+    "bind_rest_docs": "rest_parse_tools",
+    "bind_numpy_napoleon_docs": "napoleon_parse_tools",
+    "bind_google_napoleon_docs": "napoleon_parse_tools",
+    "merge_numpy_sections": "numpy_parse_tools",
+    "merge_rest_sections": "rest_parse_tools",
+    "merge_numpy_napoleon_sections": "napoleon_parse_tools",
+    "merge_google_napoleon_sections": "napoleon_parse_tools",
+}
+
+
+def _forward(name):
+    """ A function that imports the parser module defining `name` upon its first call, replaces itself
+    by that module's function within this package, and forwards the call to it. (A module-level
+    __getattr__ would defer the import as well, but requires Python 3.7.)"""
+
+    def forward(*args, **kwargs):
+        func = globals()[name] = getattr(import_module("." + _MODULES[name], __name__), name)
+        return func(*args, **kwargs)
+
+    forward.__name__ = name
+    return forward
+
+
+for _name in __all__:
+    globals()[_name] = _forward(_name)
+del _name
@@ -1,13 +1,52 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
-from inspect import cleandoc
 
 from . import section_items
+from .parse_cache import cached_parser
+from .section_tokenizer import SectionGrammar, split_sections
 
 __all__ = ["merge_google_napoleon_docs", "merge_numpy_napoleon_docs"]
 
 
+_NAPOLEON_SECTIONS = (
+    "Short Summary",
+    "Attributes",
+    "Methods",
+    "Warning",
+    "Note",
+    "Parameters",
+    "Other Parameters",
+    "Keyword Arguments",
+    "Returns",
+    "Yields",
+    "Raises",
+    "Warns",
+    "See Also",
+    "References",
+    "Todo",
+    "Example",
+    "Examples",
+)
+
+_NAPOLEON_ALIASES = {
+    "Args": "Parameters",
+    "Arguments": "Parameters",
+    "Keyword Args": "Keyword Arguments",
+    "Return": "Returns",
+    "Warnings": "Warning",
+    "Yield": "Yields",
+}
+
+_NAPOLEON_GRAMMARS = {
+    "numpy": SectionGrammar(_NAPOLEON_SECTIONS, _NAPOLEON_ALIASES),
+    "google": SectionGrammar(
+        _NAPOLEON_SECTIONS, _NAPOLEON_ALIASES, colon_suffix=True, underlined=False
+    ),
+}
+
+
+@cached_parser
 def parse_napoleon_doc(doc, style):
     """ Extract the text from the various sections of a numpy-formatted docstring.
 
@@ -22,38 +61,13 @@ def parse_napoleon_doc(doc, style):
     Returns
     -------
     OrderedDict[str, Union[None,str]]
-        The extracted numpy-styled docstring sections."""
+        The extracted numpy-styled docstring sections.
 
-    napoleon_sections = [
-        "Short Summary",
-        "Attributes",
-        "Methods",
-        "Warning",
-        "Note",
-        "Parameters",
-        "Other Parameters",
-        "Keyword Arguments",
-        "Returns",
-        "Yields",
-        "Raises",
-        "Warns",
-        "See Also",
-        "References",
-        "Todo",
-        "Example",
-        "Examples",
-    ]
+    Notes
+    -----
+    The parsed sections are cached and shared among callers: they must not be mutated."""
 
-    aliases = {
-        "Args": "Parameters",
-        "Arguments": "Parameters",
-        "Keyword Args": "Keyword Arguments",
-        "Return": "Returns",
-        "Warnings": "Warning",
-        "Yield": "Yields",
-    }
-
-    doc_sections = OrderedDict([(key, None) for key in napoleon_sections])
+    doc_sections = OrderedDict.fromkeys(_NAPOLEON_SECTIONS)
 
     section_items.set_defaults(doc_sections)
 
@@ -62,32 +76,7 @@ def parse_napoleon_doc(doc, style):
 
     assert style in ("google", "numpy")
 
-    doc = cleandoc(doc)
-    lines = iter(doc.splitlines())
-
-    key = "Short Summary"
-    body = []
-    while True:
-        try:
-            line = next(lines).rstrip()
-            header = (
-                line
-                if style == "numpy"
-                else (line[:-1] if line.endswith(":") else line)
-            )
-            if header and (header in doc_sections or header in aliases):
-                doc_sections[aliases.get(key, key)] = (
-                    "\n".join(body).rstrip() if body else None
-                )
-                body = []
-                key = header
-                if style == "numpy":
-                    next(lines)  # skip section delimiter
-            else:
-                body.append(line)
-        except StopIteration:
-            doc_sections[aliases.get(key, key)] = "\n".join(body)
-            break
+    doc_sections.update(split_sections(doc, _NAPOLEON_GRAMMARS[style]))
 
     section_items.parse(doc_sections)
 
@@ -156,26 +145,42 @@ def merge_all_sections(prnt_sctns, child_sctns, style, merge_within_sections=Fal
     Returns
     -------
     str
-        Output docstring of the merged docstrings."""
+        Output docstring of the merged docstrings.
+
+    Notes
+    -----
+    The parsed sections are not mutated."""
+    doc = merged_sections(prnt_sctns, child_sctns, style, merge_within_sections=merge_within_sections)
+    return "\n\n".join(doc) if doc else None
+
+
+def merged_sections(prnt_sctns, child_sctns, style, merge_within_sections=False):
+    """ Merge the doc-sections of the parent's and child's attribute, as `merge_all_sections` does, but
+    without joining them.
+
+    Returns
+    -------
+    List[str]
+        The sections of the merged docstring (header included), which are separated by a blank line
+        in the merged docstring."""
     doc = []
 
     prnt_only_raises = prnt_sctns["Raises"] and not (
         prnt_sctns["Returns"] or prnt_sctns["Yields"]
     )
-    if prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"]):
-        prnt_sctns["Raises"] = None
+    drop_prnt_raises = prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"])
 
     for key in prnt_sctns:
         sect = merge_section(
             key,
-            prnt_sctns[key],
+            None if (drop_prnt_raises and key == "Raises") else prnt_sctns[key],
             child_sctns[key],
             style,
             merge_within_sections=merge_within_sections
         )
         if sect is not None:
             doc.append(sect)
-    return "\n\n".join(doc) if doc else None
+    return doc
 
 
 def merge_numpy_napoleon_docs(prnt_doc=None, child_doc=None, merge_within_sections=False):
@@ -240,3 +245,79 @@ def merge_google_napoleon_docs(prnt_doc=None, child_doc=None, merge_within_secti
         style,
         merge_within_sections=merge_within_sections
     )
+
+
+def merge_numpy_napoleon_sections(prnt_doc=None, child_doc=None, merge_within_sections=False):
+    """ Merge two numpy-style docstrings, as `merge_numpy_napoleon_docs` does, into the sections of the
+    merged docstring rather than into a single string.
+
+    Returns
+    -------
+    Union[List[str], None]
+        The sections of the merged docstring, which `"\\n\\n".join` into it."""
+    return _merge_napoleon_sections(prnt_doc, child_doc, "numpy", merge_within_sections)
+
+
+def merge_google_napoleon_sections(prnt_doc=None, child_doc=None, merge_within_sections=False):
+    """ Merge two google-style docstrings, as `merge_google_napoleon_docs` does, into the sections of the
+    merged docstring rather than into a single string.
+
+    Returns
+    -------
+    Union[List[str], None]
+        The sections of the merged docstring, which `"\\n\\n".join` into it."""
+    return _merge_napoleon_sections(prnt_doc, child_doc, "google", merge_within_sections)
+
+
+def _merge_napoleon_sections(prnt_doc, child_doc, style, merge_within_sections):
+    sections = merged_sections(
+        parse_napoleon_doc(prnt_doc, style),
+        parse_napoleon_doc(child_doc, style),
+        style,
+        merge_within_sections=merge_within_sections
+    )
+    return sections if sections else None
+
+
+def _bind_napoleon_docs(prnt_doc, style, merge_within_sections):
+    prnt_sctns = parse_napoleon_doc(prnt_doc, style)
+
+    def merge_with_parent(child_doc):
+        return merge_all_sections(
+            prnt_sctns,
+            parse_napoleon_doc(child_doc, style),
+            style,
+            merge_within_sections=merge_within_sections
+        )
+
+    return merge_with_parent
+
+
+def bind_numpy_napoleon_docs(prnt_doc=None, merge_within_sections=False):
+    """ Parse a numpy-style parent docstring once, for it to be merged with several child docstrings.
+
+    Parameters
+    ----------
+    prnt_doc: Optional[str]
+        The docstring from the parent.
+
+    Returns
+    -------
+    Callable[[Optional[str]], Union[str, None]]
+        Merges a child docstring with the parent's, as `merge_numpy_napoleon_docs(prnt_doc, child_doc)` does."""
+    return _bind_napoleon_docs(prnt_doc, "numpy", merge_within_sections)
+
+
+def bind_google_napoleon_docs(prnt_doc=None, merge_within_sections=False):
+    """ Parse a google-style parent docstring once, for it to be merged with several child docstrings.
+
+    Parameters
+    ----------
+    prnt_doc: Optional[str]
+        The docstring from the parent.
+
+    Returns
+    -------
+    Callable[[Optional[str]], Union[str, None]]
+        Merges a child docstring with the parent's, as `merge_google_napoleon_docs(prnt_doc, child_doc)` does."""
+    return _bind_napoleon_docs(prnt_doc, "google", merge_within_sections)
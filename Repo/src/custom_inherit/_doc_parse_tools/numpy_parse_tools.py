@@ -1,13 +1,35 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
-from inspect import cleandoc
 
 from . import section_items
+from .parse_cache import cached_parser
+from .section_tokenizer import SectionGrammar, split_sections
 
 __all__ = ["merge_numpy_docs"]
 
 
+_NUMPY_GRAMMAR = SectionGrammar(
+    [
+        "Short Summary",
+        "Deprecation Warning",
+        "Attributes",
+        "Methods",
+        "Extended Summary",
+        "Parameters",
+        "Returns",
+        "Yields",
+        "Other Parameters",
+        "Raises",
+        "See Also",
+        "Notes",
+        "References",
+        "Examples",
+    ]
+)
+
+
+@cached_parser
 def parse_numpy_doc(doc):
     """ Extract the text from the various sections of a numpy-formatted docstring.
 
@@ -18,50 +40,20 @@ def parse_numpy_doc(doc):
     Returns
     -------
     OrderedDict[str, Union[None,str]]
-        The extracted numpy-styled docstring sections."""
-
-    doc_sections = OrderedDict(
-        [
-            ("Short Summary", None),
-            ("Deprecation Warning", None),
-            ("Attributes", None),
-            ("Methods", None),
-            ("Extended Summary", None),
-            ("Parameters", None),
-            ("Returns", None),
-            ("Yields", None),
-            ("Other Parameters", None),
-            ("Raises", None),
-            ("See Also", None),
-            ("Notes", None),
-            ("References", None),
-            ("Examples", None),
-        ]
-    )
+        The extracted numpy-styled docstring sections.
+
+    Notes
+    -----
+    The parsed sections are cached and shared among callers: they must not be mutated."""
+
+    doc_sections = OrderedDict.fromkeys(_NUMPY_GRAMMAR.sections)
 
     section_items.set_defaults(doc_sections)
 
     if not doc:
         return doc_sections
 
-    doc = cleandoc(doc)
-    lines = iter(doc.splitlines())
-
-    key = "Short Summary"
-    body = []
-    while True:
-        try:
-            line = next(lines).rstrip()
-            if line in doc_sections:
-                doc_sections[key] = "\n".join(body).rstrip() if body else None
-                body = []
-                key = line
-                next(lines)  # skip section delimiter
-            else:
-                body.append(line)
-        except StopIteration:
-            doc_sections[key] = "\n".join(body)
-            break
+    doc_sections.update(split_sections(doc, _NUMPY_GRAMMAR))
 
     section_items.parse(doc_sections)
 
@@ -126,25 +118,41 @@ def merge_all_sections(prnt_sctns, child_sctns, merge_within_sections=False):
     Returns
     -------
     str
-        Output docstring of the merged docstrings."""
+        Output docstring of the merged docstrings.
+
+    Notes
+    -----
+    The parsed sections are not mutated."""
+    doc = merged_sections(prnt_sctns, child_sctns, merge_within_sections=merge_within_sections)
+    return "\n\n".join(doc) if doc else None
+
+
+def merged_sections(prnt_sctns, child_sctns, merge_within_sections=False):
+    """ Merge the doc-sections of the parent's and child's attribute, as `merge_all_sections` does, but
+    without joining them.
+
+    Returns
+    -------
+    List[str]
+        The sections of the merged docstring (header included), which are separated by a blank line
+        in the merged docstring."""
     doc = []
 
     prnt_only_raises = prnt_sctns["Raises"] and not (
         prnt_sctns["Returns"] or prnt_sctns["Yields"]
     )
-    if prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"]):
-        prnt_sctns["Raises"] = None
+    drop_prnt_raises = prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"])
 
     for key in prnt_sctns:
         sect = merge_section(
             key,
-            prnt_sctns[key],
+            None if (drop_prnt_raises and key == "Raises") else prnt_sctns[key],
             child_sctns[key],
             merge_within_sections=merge_within_sections
         )
         if sect is not None:
             doc.append(sect)
-    return "\n\n".join(doc) if doc else None
+    return doc
 
 
 def merge_numpy_docs(prnt_doc=None, child_doc=None, merge_within_sections=False):
@@ -174,3 +182,43 @@ def merge_numpy_docs(prnt_doc=None, child_doc=None, merge_within_sections=False)
         parse_numpy_doc(child_doc),
         merge_within_sections=merge_within_sections
     )
+
+
+def merge_numpy_sections(prnt_doc=None, child_doc=None, merge_within_sections=False):
+    """ Merge two numpy-style docstrings, as `merge_numpy_docs` does, into the sections of the merged
+    docstring rather than into a single string.
+
+    Returns
+    -------
+    Union[List[str], None]
+        The sections of the merged docstring, which `"\\n\\n".join` into it."""
+    sections = merged_sections(
+        parse_numpy_doc(prnt_doc),
+        parse_numpy_doc(child_doc),
+        merge_within_sections=merge_within_sections
+    )
+    return sections if sections else None
+
+
+def bind_numpy_docs(prnt_doc=None, merge_within_sections=False):
+    """ Parse a numpy-style parent docstring once, for it to be merged with several child docstrings.
+
+    Parameters
+    ----------
+    prnt_doc: Optional[str]
+        The docstring from the parent.
+
+    Returns
+    -------
+    Callable[[Optional[str]], Union[str, None]]
+        Merges a child docstring with the parent's, as `merge_numpy_docs(prnt_doc, child_doc)` does."""
+    prnt_sctns = parse_numpy_doc(prnt_doc)
+
+    def merge_with_parent(child_doc):
+        return merge_all_sections(
+            prnt_sctns,
+            parse_numpy_doc(child_doc),
+            merge_within_sections=merge_within_sections
+        )
+
+    return merge_with_parent
@@ -0,0 +1,44 @@
+from __future__ import absolute_import
+
+from functools import wraps
+
+from .._lru_cache import LRUCache
+
+""" Exposes the cache of parsed docstrings shared by the docstring parsers."""
+
+__all__ = ["cached_parser", "parse_cache"]
+
+
+# (parser, type of the docstring, docstring, *options) -> parsed docstring sections. The type tells apart the
+# equal str and unicode docstrings of Python 2, whose sections must keep the type of the docstring.
+parse_cache = LRUCache(maxsize=2048)
+
+_missing = object()
+
+
+def cached_parser(parser):
+    """ Decorate a docstring parser so that its results are memoized in `parse_cache`.
+
+    The parsed sections are shared by all of the callers that parse the same docstring;
+    they must thus be treated as read-only.
+
+    Parameters
+    ----------
+    parser : Callable[..., Any]
+        A function that parses a docstring, which is supplied as its first positional argument,
+        along with any hashable positional options.
+
+    Returns
+    -------
+    Callable[..., Any]"""
+
+    @wraps(parser)
+    def cached(*args):
+        key = (parser, type(args[0])) + args
+        sections = parse_cache.get(key, _missing)
+        if sections is _missing:
+            sections = parser(*args)
+            parse_cache[key] = sections
+        return sections
+
+    return cached
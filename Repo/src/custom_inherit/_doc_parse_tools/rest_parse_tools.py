@@ -4,6 +4,8 @@ from collections import OrderedDict
 from inspect import cleandoc
 from string import punctuation
 
+from .parse_cache import cached_parser
+
 __all__ = ["merge_rest_docs"]
 
 
@@ -12,6 +14,13 @@ def is_delimiter(line):
     return bool(line) and line[0] in punctuation and line[0] * len(line) == line
 
 
+class Section(object):
+    def __init__(self, header=None, body=None):
+        self.header = header  # str
+        self.body = body  # str
+
+
+@cached_parser
 def parse_rest_doc(doc):
     """ Extract the headers, delimiters, and text from reST-formatted docstrings.
 
@@ -21,12 +30,11 @@ def parse_rest_doc(doc):
 
     Returns
     -------
-    Dict[str, Section] """
+    Dict[str, Section]
 
-    class Section(object):
-        def __init__(self, header=None, body=None):
-            self.header = header  # str
-            self.body = body  # str
+    Notes
+    -----
+    The parsed sections are cached and shared among callers: they must not be mutated."""
 
     doc_sections = OrderedDict([("", Section(header=""))])
     if not doc:
@@ -74,8 +82,50 @@ def parse_rest_doc(doc):
 
 def merge_rest_docs(prnt_doc=None, child_doc=None):
     """ See custom_inherit.style_store.reST for details. """
+    return _merge_rest_sections(parse_rest_doc(prnt_doc), parse_rest_doc(child_doc))
+
+
+def bind_rest_docs(prnt_doc=None):
+    """ Parse a reST-style parent docstring once, for it to be merged with several child docstrings.
+
+    Returns a function that merges a child docstring with the parent's, as
+    `merge_rest_docs(prnt_doc, child_doc)` does."""
     prnt_sections = parse_rest_doc(prnt_doc)
-    child_sections = parse_rest_doc(child_doc)
+
+    def merge_with_parent(child_doc):
+        return _merge_rest_sections(prnt_sections, parse_rest_doc(child_doc))
+
+    return merge_with_parent
+
+
+def merge_rest_sections(prnt_doc=None, child_doc=None):
+    """ Merge two reST-style docstrings, as `merge_rest_docs` does, into the sections of the merged
+    docstring rather than into a single string.
+
+    Returns
+    -------
+    List[str]
+        The sections of the merged docstring, which `"\\n\\n".join` into it."""
+    sections = [
+        "\n".join((x.header, x.body))
+        for x in _merged_rest_sections(parse_rest_doc(prnt_doc), parse_rest_doc(child_doc)).values()
+    ]
+    # as the merged docstring, the sections are stripped of their leading whitespace
+    while sections and not sections[0].strip():
+        del sections[0]
+    if sections:
+        sections[0] = sections[0].lstrip()
+    return sections
+
+
+def _merge_rest_sections(prnt_sections, child_sections):
+    return "\n\n".join(
+        ("\n".join((x.header, x.body)) for x in _merged_rest_sections(prnt_sections, child_sections).values())
+    ).lstrip()
+
+
+def _merged_rest_sections(prnt_sections, child_sections):
+    prnt_sections = OrderedDict(prnt_sections)
 
     header = prnt_sections[""]
     prnt_sections.update(child_sections)
@@ -83,7 +133,4 @@ def merge_rest_docs(prnt_doc=None, child_doc=None):
         prnt_sections[""] = header
         if not header.body:
             prnt_sections.popitem(last=False)
-
-    return "\n\n".join(
-        ("\n".join((x.header, x.body)) for x in prnt_sections.values())
-    ).lstrip()
+    return prnt_sections
@@ -12,9 +12,11 @@ except ImportError:
         return ''.join(padding+line for line in text.splitlines(True))
 
 
-_RE_PATTERN_ITEMS = re.compile(
-    r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", flags=re.DOTALL
-)
+_RE_WORD = re.compile(r"\w")
+
+_RE_ITEM_NAME = re.compile(r"\**\w+")
+
+_RE_NEXT_ITEM_NAME = re.compile(r"\n(\**\w+)")
 
 _STYLE_TO_PADDING = {
     "numpy": "",
@@ -45,6 +47,44 @@ def _render(body, style):
     return "\n".join(section)
 
 
+def _split_items(section_content):
+    r"""Split the content of a section into its items.
+
+    An item starts with an identifier, optionally prefixed by stars (e.g. "x", "*args"), at the
+    beginning of a line, and its description runs until the next such line. The content that
+    precedes the first word character of the section is skipped.
+
+    This yields the same items as ``re.findall(r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", section_content,
+    flags=re.DOTALL)``, but in time linear in the length of the section.
+
+    Parameters
+    ----------
+    section_content: str
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        The (name, description) pairs of the items.
+    """
+    first_word = _RE_WORD.search(section_content)
+    if first_word is None:
+        return []
+    start = first_word.start()
+    while start and section_content[start - 1] == "*":
+        start -= 1
+    # a trailing newline is not part of the last description
+    end = len(section_content) - 1 if section_content.endswith("\n") else len(section_content)
+
+    name = _RE_ITEM_NAME.match(section_content, start)
+    items = []
+    item_name, description_start = name.group(), name.end()
+    for name in _RE_NEXT_ITEM_NAME.finditer(section_content, description_start, end):
+        items.append((item_name, section_content[description_start:name.start()]))
+        item_name, description_start = name.group(1), name.end()
+    items.append((item_name, section_content[description_start:end]))
+    return items
+
+
 def set_defaults(doc_sections):
     """Set the defaults for the sections with items in place.
 
@@ -66,7 +106,7 @@ def parse(doc_sections):
     for section_name in SECTION_NAMES:
         section_content = doc_sections[section_name]
         if section_content:
-            doc_sections[section_name] = OrderedDict(_RE_PATTERN_ITEMS.findall(inspect.cleandoc(section_content)))
+            doc_sections[section_name] = OrderedDict(_split_items(inspect.cleandoc(section_content)))
 
 
 def merge(prnt_sec, child_sec, merge_within_sections, style):
@@ -0,0 +1,124 @@
+"""This module splits numpy- and napoleon-formatted docstrings into their sections."""
+
+from inspect import cleandoc
+
+__all__ = ["SectionGrammar", "clean_lines", "split_sections"]
+
+# The line boundaries, other than "\n", recognized by str.splitlines
+_OTHER_LINE_BREAKS = (u"\r", u"\x0b", u"\x0c", u"\x1c", u"\x1d", u"\x1e", u"\x85", u"\u2028", u"\u2029")
+
+# Those recognized by the splitlines of the byte strings (i.e. the str of Python 2)
+_OTHER_BYTE_LINE_BREAKS = (b"\r",)
+
+
+class SectionGrammar(object):
+    """The sections of a docstring style, along with the table of the header lines that
+    open each of them. Built once per style, and shared by every call to `split_sections`.
+
+    Attributes
+    ----------
+    sections: Tuple[str, ...]
+        The names of the sections, in the order in which they are rendered. The first one
+        holds the text that precedes the first header.
+    headers: Dict[str, str]
+        Maps each header line (right-stripped) to the name of the section that it opens.
+    underlined: bool
+        Whether headers are followed by a delimiter line (e.g. "-----"), which is skipped.
+    """
+
+    __slots__ = ("sections", "headers", "underlined")
+
+    def __init__(self, sections, aliases=None, colon_suffix=False, underlined=True):
+        """
+        Parameters
+        ----------
+        sections: Iterable[str]
+            The names of the sections, in order.
+        aliases: Optional[Dict[str, str]]
+            Maps alternative headers to the names of their sections.
+        colon_suffix: bool
+            Whether headers may be suffixed by a colon (e.g. "Args:").
+        underlined: bool
+            Whether headers are followed by a delimiter line.
+        """
+        self.sections = tuple(sections)
+        headers = dict((name, name) for name in self.sections)
+        headers.update(aliases or {})
+        if colon_suffix:
+            headers.update([(header + ":", name) for header, name in headers.items()])
+        self.headers = headers
+        self.underlined = underlined
+
+
+def clean_lines(doc):
+    """The lines of `inspect.cleandoc(doc)`, right-stripped, computed in a single pass over
+    the lines of `doc` instead of joining and re-splitting them.
+
+    Parameters
+    ----------
+    doc: str
+
+    Returns
+    -------
+    List[str]
+    """
+    line_breaks = _OTHER_LINE_BREAKS if isinstance(doc, type(u"")) else _OTHER_BYTE_LINE_BREAKS
+    if any(line_break in doc for line_break in line_breaks):
+        return [line.rstrip() for line in cleandoc(doc).splitlines()]
+
+    lines = doc.expandtabs().split("\n")
+    indents = [len(line) - len(line.lstrip()) for line in lines[1:] if line.lstrip()]
+    margin = min(indents) if indents else 0
+
+    # remove any trailing or leading blank lines: those that the removal of the indentation empties
+    end = len(lines)
+    while end > 1 and len(lines[end - 1]) <= margin:
+        end -= 1
+    first = lines[0].lstrip()
+    start = 1
+    if not first:
+        while start < end and len(lines[start]) <= margin:
+            start += 1
+    cleaned = [line[margin:].rstrip() for line in lines[start:end]]
+    if first:
+        cleaned.insert(0, first.rstrip())
+    return cleaned
+
+
+def split_sections(doc, grammar):
+    """Split a docstring into its sections, in a single pass over its lines.
+
+    Parameters
+    ----------
+    doc: str
+        The docstring; its indentation is removed via `inspect.cleandoc`.
+    grammar: SectionGrammar
+
+    Returns
+    -------
+    List[Tuple[str, Optional[str]]]
+        The (section name, section body) pairs, in the order in which they appear. The body
+        of a section is None if it is empty, except for the last section of the docstring,
+        whose body is not right-stripped.
+    """
+    headers = grammar.headers
+    underlined = grammar.underlined
+
+    sections = []
+    key = grammar.sections[0]
+    body = []
+    skip = False
+    for line in clean_lines(doc):
+        if skip:  # section delimiter
+            skip = False
+            continue
+        section = headers.get(line)
+        if section is None:
+            body.append(line)
+        else:
+            sections.append((key, "\n".join(body).rstrip() if body else None))
+            key = section
+            body = []
+            skip = underlined
+    sections.append((key, "\n".join(body)))
+    return sections
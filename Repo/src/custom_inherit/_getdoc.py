@@ -0,0 +1,143 @@
+from __future__ import absolute_import
+
+import sys
+from inspect import cleandoc, getdoc as _inspect_getdoc, isclass, isfunction, ismethod
+from weakref import WeakKeyDictionary
+
+from . import _merge_cache
+from ._metaclass_base import _ATTR_DOCS, _HEAPTYPE, _attr_doc, _is_inheritable, _resolve_lazy
+
+""" On-demand docstring inheritance: the docstrings that a metaclass would merge, computed upon request."""
+
+__all__ = ["getdoc"]
+
+
+# class -> {(metaclass, attribute name, or None for the class' docstring): merged docstring}
+_merged_docs = WeakKeyDictionary()
+
+
+def _is_merged(cls):
+    """ True if the docstrings of `cls` are final: they were merged by a metaclass (or a decorator),
+    or they cannot be set (built-in classes)."""
+    return _ATTR_DOCS in vars(cls) or not type.__getattribute__(cls, "__flags__") & _HEAPTYPE
+
+
+def _cached(cls, key, merge):
+    try:
+        docs = _merged_docs[cls]
+    except KeyError:
+        docs = _merged_docs.setdefault(cls, {})
+    try:
+        return docs[key]
+    except KeyError:
+        return docs.setdefault(key, merge())
+
+
+def _class_doc(cls, mcs):
+    """ The docstring of `cls`, as if it, and each of its ancestors, had been created by `mcs`."""
+    if _is_merged(cls):
+        return cls.__doc__
+
+    def merge():
+        class_doc = vars(cls).get("__doc__")
+        merged = set()
+        for mro_cls in type.__getattribute__(cls, "__mro__")[1:]:
+            if mro_cls in merged:
+                continue
+            if not type.__getattribute__(mro_cls, "__flags__") & _HEAPTYPE:
+                prnt_cls_doc = mro_cls.__doc__
+            elif merged.isdisjoint(mro_cls.__mro__):
+                prnt_cls_doc = _class_doc(mro_cls, mcs)
+                merged.update(mro_cls.__mro__)
+            else:  # part of its mro is accounted for already (see _merge_class_doc)
+                prnt_cls_doc = vars(mro_cls).get(_ATTR_DOCS, vars(mro_cls)).get("__doc__")
+            if prnt_cls_doc == "The most base type":
+                prnt_cls_doc = None
+            class_doc = _merge_cache.merger(mcs.class_doc_inherit)(prnt_cls_doc, class_doc)
+        return class_doc
+
+    return _cached(cls, (mcs, None), merge)
+
+
+def _member_doc(cls, name, mcs):
+    """ The docstring of the attribute `name` defined by `cls`, as if `cls`, and each of its ancestors,
+    had been created by `mcs`."""
+    attribute = vars(cls)[name]
+    if _is_merged(cls) or not _is_inheritable(mcs, name, attribute):
+        return _attr_doc(attribute)
+
+    def merge():
+        for mro_cls in type.__getattribute__(cls, "__mro__")[1:]:
+            if name in vars(mro_cls):
+                prnt_attr_doc = _member_doc(mro_cls, name, mcs)
+                if prnt_attr_doc is not None:
+                    return _merge_cache.merger(mcs.attr_doc_inherit)(prnt_attr_doc, _attr_doc(attribute))
+        return _attr_doc(attribute)
+
+    return _cached(cls, (mcs, name), merge)
+
+
+def _find_class(func):
+    """ The class in which the function `func` is defined, found from its qualified name
+    (as does `inspect.getdoc`), or None."""
+    owner = sys.modules.get(func.__module__)
+    try:
+        for name in func.__qualname__.split(".")[:-1]:
+            owner = getattr(owner, name)
+    except AttributeError:  # e.g. defined in a function's <locals>
+        return None
+    return owner if isclass(owner) else None
+
+
+def _find_member(obj):
+    """ The (class, attribute name) under which the method, or property, `obj` is defined, or None."""
+    if ismethod(obj):
+        func = obj.__func__
+        owner = obj.__self__ if isclass(obj.__self__) else type(obj.__self__)
+    elif isinstance(obj, property):
+        func = obj.fget
+        owner = _find_class(func) if func is not None else None
+    elif isfunction(obj):
+        func = obj
+        owner = _find_class(func)
+    else:
+        return None
+    if owner is None:
+        return None
+
+    name = func.__name__
+    for cls in type.__getattribute__(owner, "__mro__"):
+        attribute = vars(cls).get(name)
+        if attribute is obj or attribute is func or getattr(attribute, "__func__", None) is func:
+            return cls, name
+    return None
+
+
+def getdoc(obj, mcs):
+    """ The docstring of `obj`, merged as the metaclass `mcs` would have merged it, and cleaned up as
+    by `inspect.getdoc`.
+
+    The docstrings of classes, and of their methods and properties, are merged along the mro of the
+    (owner) class upon request, and memoized for as long as the class exists; those of classes that
+    have already been merged are returned as they are. Other objects, and objects whose merged docstring
+    is None, are handed to `inspect.getdoc`.
+
+    Parameters
+    ----------
+    obj : Any
+    mcs : custom_inherit.DocInheritorBase
+
+    Returns
+    -------
+    Optional[str]"""
+    if isclass(obj):
+        _resolve_lazy(obj)
+        doc = _class_doc(obj, mcs)
+    else:
+        member = _find_member(obj)
+        if member is None:
+            return _inspect_getdoc(obj)
+        _resolve_lazy(member[0])
+        doc = _member_doc(member[0], member[1], mcs)
+    # like inspect.getdoc, an undocumented method falls back to the docstring that it overrides
+    return cleandoc(doc) if isinstance(doc, str) else _inspect_getdoc(obj)
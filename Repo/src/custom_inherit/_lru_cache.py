@@ -0,0 +1,113 @@
+from __future__ import absolute_import
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+""" Exposes the bounded least-recently-used cache backing the caches of custom_inherit."""
+
+__all__ = ["CacheInfo", "LRUCache"]
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class LRUCache(object):
+    """ A thread-safe, bounded, mapping that discards its least-recently-used entries
+    once it holds `maxsize` of them.
+
+    Hits, misses and evictions are counted; see `LRUCache.info`."""
+
+    def __init__(self, maxsize=1024):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional (default: 1024)
+            The maximum number of entries held by the cache. Zero disables the cache."""
+        self._lock = Lock()
+        self._data = OrderedDict()
+        self._maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.maxsize = maxsize
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, self.info())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def maxsize(self):
+        """ The maximum number of entries held by the cache. Shrinking it evicts the
+        least-recently-used entries in excess."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        maxsize = int(maxsize)
+        if maxsize < 0:
+            raise ValueError("`maxsize` must be a non-negative integer, got {}".format(maxsize))
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _evict(self):
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """ Return the value stored for `key`, marking it as the most-recently-used entry,
+        or `default` if `key` is not cached."""
+        with self._lock:
+            try:
+                # re-inserted as the most-recently-used entry (OrderedDict.move_to_end is Python 3 only)
+                value = self._data[key] = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._data.pop(key, None)
+            self._data[key] = value
+            self._evict()
+
+    def prune(self, predicate):
+        """ Discard the entries whose key satisfies `predicate`.
+
+        Parameters
+        ----------
+        predicate : Callable[[Hashable], bool]"""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def values(self):
+        """ A snapshot of the cached values, from the least- to the most-recently-used one."""
+        with self._lock:
+            return list(self._data.values())
+
+    def info(self):
+        """ Report the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            The named tuple (hits, misses, evictions, maxsize, currsize)."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self._maxsize, len(self._data))
+
+    def clear(self):
+        """ Discard all of the cached entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,323 @@
+from __future__ import absolute_import
+
+import os
+import sys
+from collections import namedtuple
+from types import FunctionType, ModuleType
+
+from . import _merge_cache
+from ._doc_parse_tools.parse_cache import parse_cache
+from ._metaclass_base import _ATTR_DOCS, _dedupe_tables, _shared_docs, _SharedDoc, _subclasses
+
+""" Exposes the report of the memory retained by merged docstrings, and by the caches of custom_inherit."""
+
+__all__ = ["CacheUsage", "DocsUsage", "Duplicate", "MemoryReport", "memory_report"]
+
+
+# The docstrings produced anew by merging (rather than shared with an ancestor), and the original docstrings of
+# the children that they replaced, which remain referenced by the code objects of the functions: their number,
+# and size in bytes (`sys.getsizeof`). A class docstring held as shared sections (see `DocInheritMeta`'s
+# `share_sections`) accounts for its tuple of sections, the sections being accounted for as a cache.
+DocsUsage = namedtuple("DocsUsage", ["merged_count", "merged_bytes", "original_count", "original_bytes"])
+
+# Distinct, but equal, merged docstrings: the size of one copy, their number of copies, the bytes that
+# sharing a single copy would save, the docstring, and the names of the objects documented by the copies.
+Duplicate = namedtuple("Duplicate", ["size", "copies", "wasted_bytes", "doc", "owners"])
+
+# A cache of custom_inherit: its number of entries, and size in bytes (including the strings that it
+# holds, which may be shared with the docstrings of classes and functions).
+CacheUsage = namedtuple("CacheUsage", ["entries", "bytes"])
+
+_EMPTY_USAGE = DocsUsage(0, 0, 0, 0)
+
+# Python >= 3.14 flags the code objects of the functions with a docstring, rather than storing None
+# as the first constant of those without one.
+_CO_HAS_DOCSTRING = 0x4000000 if sys.version_info >= (3, 14) else None
+
+
+class MemoryReport(
+    namedtuple("MemoryReport", ["total", "modules", "classes", "duplicates", "caches", "traced_bytes"])
+):
+    """ The memory retained by merged docstrings (see `custom_inherit.memory_report`).
+
+    Attributes
+    ----------
+    total : DocsUsage
+    modules : Dict[str, DocsUsage]
+        By module name, ranked by decreasing size of the merged docstrings.
+    classes : Dict[str, Dict[str, DocsUsage]]
+        By module name, then by qualified class name, ranked by decreasing size of the merged docstrings.
+    duplicates : List[Duplicate]
+        Ranked by decreasing wasted bytes.
+    caches : Dict[str, CacheUsage]
+    traced_bytes : Optional[int]
+        The memory allocated by the modules of custom_inherit that is still held, as traced by
+        `tracemalloc` - None unless `tracemalloc` is tracing."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        lines = ["{:>10} {:>12} {:>10} {:>12}  {}".format("merged", "merged (B)", "original", "original (B)", "")]
+        lines.append(_format_usage(self.total, "total"))
+        for module, usage in self.modules.items():
+            lines.append(_format_usage(usage, "  " + module))
+            for name, class_usage in self.classes.get(module, {}).items():
+                lines.append(_format_usage(class_usage, "    " + name))
+        if self.duplicates:
+            lines += ["", "{:>10} {:>7} {:>12}  {}".format("size (B)", "copies", "wasted (B)", "duplicate docstring")]
+            for duplicate in self.duplicates:
+                owners = ", ".join(duplicate.owners[:3]) + (", ..." if len(duplicate.owners) > 3 else "")
+                preview = duplicate.doc.strip().split("\n", 1)[0][:60]
+                lines.append(
+                    "{:>10} {:>7} {:>12}  {!r} ({})".format(
+                        duplicate.size, duplicate.copies, duplicate.wasted_bytes, preview, owners
+                    )
+                )
+        lines += ["", "{:>10} {:>12}  {}".format("entries", "size (B)", "cache")]
+        for name, usage in self.caches.items():
+            lines.append("{:>10} {:>12}  {}".format(usage.entries, usage.bytes, name))
+        if self.traced_bytes is not None:
+            lines += ["", "held by custom_inherit, as traced by tracemalloc: {} B".format(self.traced_bytes)]
+        return "\n".join(lines)
+
+
+def _format_usage(usage, name):
+    return "{:>10} {:>12} {:>10} {:>12}  {}".format(
+        usage.merged_count, usage.merged_bytes, usage.original_count, usage.original_bytes, name
+    )
+
+
+def _qualname(cls):
+    return getattr(cls, "__qualname__", cls.__name__)  # Python 2: no qualified names
+
+
+def _size(doc):
+    if isinstance(doc, _SharedDoc):
+        return sys.getsizeof(doc) + sys.getsizeof(doc.sections)
+    return sys.getsizeof(doc)
+
+
+def _add(usage, merged, original):
+    """ Account for a merged docstring (a str, or a _SharedDoc), and for the original docstring (a str,
+    or None if it is unknown or was not retained) that it replaced."""
+    return DocsUsage(
+        usage.merged_count + 1,
+        usage.merged_bytes + _size(merged),
+        usage.original_count + (original is not None),
+        usage.original_bytes + (sys.getsizeof(original) if original is not None else 0),
+    )
+
+
+def _code_doc(func):
+    """ The docstring of the function `func` as written in its source, which its code object retains."""
+    code = getattr(func, "__code__", None)
+    if code is None or func.__name__ == "<lambda>":
+        return None
+    if _CO_HAS_DOCSTRING is not None and not code.co_flags & _CO_HAS_DOCSTRING:
+        return None
+    doc = code.co_consts[0] if code.co_consts else None
+    return doc if isinstance(doc, str) else None
+
+
+def _original_doc(func):
+    """ The docstring of the function `func` before any merge: the one written in its source or, for a
+    wrapper (e.g. made by `functools.wraps`), the one copied from the function that it wraps."""
+    wrapped = getattr(func, "__wrapped__", None)
+    if wrapped is not None:
+        return getattr(wrapped, "__doc__", None)
+    return _code_doc(func)
+
+
+def _function(attribute):
+    """ The function of a class attribute (a function, a static or class method, or the getter of a
+    property), or None."""
+    if isinstance(attribute, (staticmethod, classmethod)):
+        attribute = attribute.__func__
+    elif isinstance(attribute, property):
+        attribute = attribute.fget
+    return attribute if isinstance(attribute, FunctionType) else None
+
+
+def _inherited(cls, name, doc):
+    """ Whether `doc` is the very docstring of the attribute `name` (or of the class, if None) of an
+    ancestor of `cls`, i.e. it is shared rather than produced anew by a merge."""
+    for mro_cls in type.__getattribute__(cls, "__mro__")[1:]:
+        if name is None:
+            if vars(mro_cls).get("__doc__") is doc:
+                return True
+        elif name in vars(mro_cls):
+            attribute = vars(mro_cls)[name]
+            func = _function(attribute)
+            if (attribute.__doc__ if isinstance(attribute, property) else getattr(func, "__doc__", None)) is doc:
+                return True
+    return False
+
+
+def _merged_docs(cls):
+    """ Yield the (name, merged docstring, original docstring) of the docstrings of `cls`, and of its
+    attributes, that were produced by merging; the name is None for the class' docstring.
+
+    A docstring that differs from the original one (see `_original_doc`), but is not the very docstring
+    of an ancestor, was produced by a merge."""
+    if _ATTR_DOCS in vars(cls):
+        doc = vars(cls).get("__doc__")
+        if isinstance(doc, (str, _SharedDoc)) and not _inherited(cls, None, doc):
+            yield None, doc, None
+    for name, attribute in list(vars(cls).items()):
+        func = _function(attribute)
+        if func is None:
+            continue
+        doc = attribute.__doc__ if isinstance(attribute, property) else func.__doc__
+        original = _original_doc(func)
+        if isinstance(doc, str) and doc is not original and not _inherited(cls, name, doc):
+            yield name, doc, original
+
+
+def _module_functions(module):
+    for name, member in list(vars(module).items()):
+        if isinstance(member, FunctionType) and member.__module__ == module.__name__:
+            original = _original_doc(member)
+            if isinstance(member.__doc__, str) and member.__doc__ is not original:
+                yield name, member.__doc__, original
+
+
+def _deep_size(obj, seen):
+    """ The size of `obj` and of the containers, strings and objects that it references, each counted once."""
+    if id(obj) in seen or obj is None or isinstance(obj, (type, FunctionType, ModuleType)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in list(obj.items()))
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in list(obj))
+    elif hasattr(obj, "__dict__") and not callable(obj):
+        size += _deep_size(vars(obj), seen)
+    return size
+
+
+def _lru_usage(cache):
+    with cache._lock:
+        items = list(cache._data.items())
+    seen = set()
+    return CacheUsage(len(items), sys.getsizeof(cache._data) + sum(_deep_size(item, seen) for item in items))
+
+
+def _caches(classes):
+    caches = {
+        "class index": CacheUsage(
+            sum(1 for cls in classes if _ATTR_DOCS in vars(cls)),
+            sum(sys.getsizeof(vars(cls)[_ATTR_DOCS]) for cls in classes if _ATTR_DOCS in vars(cls)),
+        ),
+        "parse_cache": _lru_usage(parse_cache),
+        "merge_cache": _lru_usage(_merge_cache.merge_cache),
+        "compiled_docs": CacheUsage(len(_merge_cache.compiled_docs), _deep_size(_merge_cache.compiled_docs, set())),
+    }
+    tables = [_lru_usage(table) for table in list(_dedupe_tables.values()) if table is not None]
+    caches["dedupe tables"] = CacheUsage(
+        sum(usage.entries for usage in tables), sum(usage.bytes for usage in tables)
+    )
+    shared_docs = list(_shared_docs.values())
+    sections = {id(section): section for doc in shared_docs for section in doc.sections}
+    caches["shared sections"] = CacheUsage(
+        len(sections), sum(sys.getsizeof(section) for section in sections.values())
+    )
+    getdoc_module = sys.modules.get(__package__ + "._getdoc")
+    if getdoc_module is not None:
+        merged_docs = dict(getdoc_module._merged_docs.items())
+        caches["getdoc"] = CacheUsage(
+            sum(len(docs) for docs in merged_docs.values()),
+            sum(_deep_size(docs, set()) for docs in merged_docs.values()),
+        )
+    persistent = _merge_cache.persistent_cache
+    if persistent is not None:
+        with persistent._lock:
+            pending = dict(persistent._pending)
+        caches["persistent_cache (pending writes)"] = CacheUsage(len(pending), _deep_size(pending, set()))
+    return caches
+
+
+def _traced_bytes():
+    try:
+        import tracemalloc
+    except ImportError:  # Python 2
+        return None
+
+    if not tracemalloc.is_tracing():
+        return None
+    directory = os.path.dirname(os.path.abspath(__file__))
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, os.path.join(directory, "*"))])
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _ranked(usages):
+    return dict(sorted(usages.items(), key=lambda item: (-item[1].merged_bytes, item[0])))
+
+
+def memory_report(root, top=10):
+    """ Report the memory retained by the docstrings merged within `root`.
+
+    Parameters
+    ----------
+    root : Union[type, types.ModuleType, str]
+        A class, whose docstrings and those of all of its subclasses are accounted for; or a module (or the
+        name of an imported module), whose classes and functions are accounted for.
+    top : Optional[int]
+        The number of duplicate docstrings to report; all of them if None.
+
+    Returns
+    -------
+    MemoryReport"""
+    if isinstance(root, str):
+        root = sys.modules[root]
+    if isinstance(root, type):
+        classes = [root] + sorted(_subclasses(root), key=lambda cls: (cls.__module__, _qualname(cls)))
+        functions = []
+    else:
+        classes = [
+            member
+            for member in list(vars(root).values())
+            if isinstance(member, type) and member.__module__ == root.__name__
+        ]
+        functions = [(root.__name__, None, name, doc, original) for name, doc, original in _module_functions(root)]
+
+    # (module name, class qualified name or None, name of the documented object, docstring, original docstring)
+    docs = list(functions)
+    for cls in classes:
+        docs += [
+            (cls.__module__, _qualname(cls), name, doc, original) for name, doc, original in _merged_docs(cls)
+        ]
+
+    total = _EMPTY_USAGE
+    modules = dict()
+    owners = dict()
+    copies = dict()  # docstring -> {id: (size, [names of the objects documented by this copy])}
+    for module, qualname, name, doc, original in docs:
+        total = _add(total, doc, original)
+        modules[module] = _add(modules.get(module, _EMPTY_USAGE), doc, original)
+        full_name = ".".join(part for part in (module, qualname, name) if part)
+        if qualname is not None:
+            module_owners = owners.setdefault(module, dict())
+            module_owners[qualname] = _add(module_owners.get(qualname, _EMPTY_USAGE), doc, original)
+        copies.setdefault(doc, dict()).setdefault(id(doc), (_size(doc), []))[1].append(full_name)
+
+    duplicates = [
+        Duplicate(
+            size=next(iter(objects.values()))[0],
+            copies=len(objects),
+            wasted_bytes=sum(size for size, _ in objects.values()) - next(iter(objects.values()))[0],
+            doc=doc,
+            owners=[name for _, names in objects.values() for name in names],
+        )
+        for doc, objects in copies.items()
+        if len(objects) > 1
+    ]
+    duplicates.sort(key=lambda duplicate: -duplicate.wasted_bytes)
+    return MemoryReport(
+        total,
+        _ranked(modules),
+        {module: _ranked(owners[module]) for module in _ranked(modules) if module in owners},
+        duplicates[:top],
+        _caches(classes),
+        _traced_bytes(),
+    )
@@ -0,0 +1,177 @@
+from __future__ import absolute_import
+
+from functools import wraps
+from threading import local
+
+from ._lru_cache import LRUCache
+
+""" Exposes the opt-in caches of merged docstrings, which memoize pure style functions: an in-memory
+    cache, the docstrings compiled ahead of time for a package, and a persistent on-disk cache; which
+    are consulted in that order."""
+
+__all__ = [
+    "caching_enabled",
+    "disable_persistent_cache",
+    "enable_persistent_cache",
+    "forget_style",
+    "memoize_style",
+    "merge_cache",
+    "merger",
+    "served_count",
+    "set_pure",
+]
+
+
+# (style function, parent docstring, child docstring) -> merged docstring
+# Disabled (maxsize=0) unless opted-in to.
+merge_cache = LRUCache(maxsize=0)
+
+# The enabled custom_inherit._persistent_cache.PersistentCache, if any.
+persistent_cache = None
+
+# merge digest -> merged docstring, loaded from the docstrings compiled ahead of time
+# (see custom_inherit._compiled_docs).
+compiled_docs = dict()
+
+# merge digest -> merged docstring, of the merges recorded while compiling a package; None
+# outside of compilation.
+recorded_docs = None
+
+# The style functions whose output depends only on the docstrings that they are passed (see
+# custom_inherit._Store.add), and thus whose merges can be memoized.
+_pure_styles = set()
+
+# pure style function -> its memoized counterpart (see `memoize_style`)
+_memoized_styles = dict()
+
+_missing = object()
+
+# The number of merges served by the caches, per thread; see `served_count`.
+_served = local()
+
+
+def served_count():
+    """ The number of merges that the caches have served (rather than performed) in the current thread."""
+    return getattr(_served, "count", 0)
+
+
+def caching_enabled():
+    """ Whether any of the caches of merged docstrings is enabled."""
+    return (
+        bool(merge_cache.maxsize)
+        or persistent_cache is not None
+        or bool(compiled_docs)
+        or recorded_docs is not None
+    )
+
+
+def enable_persistent_cache(directory):
+    """ Persist the merged docstrings of pure styles on disk, so that subsequent processes
+    load them instead of merging the docstrings anew.
+
+    This applies to the classes and decorated functions created after the cache is enabled.
+
+    Parameters
+    ----------
+    directory : str
+        The directory holding the cache file, which is shared by the processes using it."""
+    global persistent_cache
+    from ._persistent_cache import PersistentCache
+
+    disable_persistent_cache()
+    persistent_cache = PersistentCache(directory)
+
+
+def disable_persistent_cache():
+    """ Write the pending merges to the persistent cache, if it is enabled, and disable it."""
+    global persistent_cache
+    if persistent_cache is not None:
+        persistent_cache.close()
+        persistent_cache = None
+
+
+def set_pure(style_func):
+    """ Register `style_func` as a pure style, whose merges are memoized (see `merger`)."""
+    _pure_styles.add(style_func)
+
+
+def forget_style(style_func):
+    """ Unregister the pure style `style_func`, and discard its memoized merges."""
+    _pure_styles.discard(style_func)
+    _memoized_styles.pop(style_func, None)
+    merge_cache.prune(lambda key: key[0] is style_func)
+
+
+def merger(style_func):
+    """ The function that performs the merges of `style_func`: its memoized counterpart if it is a pure
+    style and a cache of merged docstrings is enabled, otherwise `style_func` itself.
+
+    The metaclasses and decorators look it up upon merging, so that the styles themselves (and thus,
+    the metaclasses built for them) do not depend on whether the caches are enabled."""
+    try:
+        if style_func not in _pure_styles or not caching_enabled():
+            return style_func
+    except TypeError:  # unhashable
+        return style_func
+    try:
+        return _memoized_styles[style_func]
+    except KeyError:
+        return _memoized_styles.setdefault(style_func, memoize_style(style_func))
+
+
+def memoize_style(style_func):
+    """ Wrap a pure style function so that its merged docstrings are memoized in `merge_cache`
+    and in the persistent cache, if enabled, or served from the compiled docstrings.
+
+    While a package is being compiled, the merges are performed anew and recorded instead.
+
+    Parameters
+    ----------
+    style_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+        A style function whose output depends only on the parent and child docstrings.
+
+    Returns
+    -------
+    Callable[[Optional[str], Optional[str]], Optional[str]]"""
+
+    # the hooks of the style (see custom_inherit._style_store) are not registered for the wrapper:
+    # merges prepared by `bind_parent` would bypass the caches
+    @wraps(style_func, updated=())
+    def memoized(prnt_doc, child_doc):
+        recorded = recorded_docs
+        if recorded is not None:
+            from ._merge_key import merge_key
+
+            doc = style_func(prnt_doc, child_doc)
+            digest = merge_key(style_func, prnt_doc, child_doc)
+            if digest is not None:
+                recorded[digest] = doc
+            return doc
+
+        key = (style_func, prnt_doc, child_doc)
+        doc = merge_cache.get(key, _missing) if merge_cache.maxsize else _missing
+        if doc is not _missing:
+            _served.count = getattr(_served, "count", 0) + 1
+            return doc
+
+        persistent = persistent_cache
+        if compiled_docs or persistent is not None:
+            from ._merge_key import merge_key  # imported upon use: hashlib is slow to import
+
+            digest = merge_key(style_func, prnt_doc, child_doc)
+            doc = compiled_docs.get(digest, _missing) if digest is not None else _missing
+            if doc is _missing and persistent is not None and digest is not None:
+                doc = persistent.get(digest, _missing)
+                if doc is _missing:
+                    doc = style_func(prnt_doc, child_doc)
+                    persistent[digest] = doc
+                    merge_cache[key] = doc
+                    return doc
+            if doc is not _missing:
+                _served.count = getattr(_served, "count", 0) + 1
+        if doc is _missing:
+            doc = style_func(prnt_doc, child_doc)
+        merge_cache[key] = doc
+        return doc
+
+    return memoized
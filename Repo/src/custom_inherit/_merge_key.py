@@ -0,0 +1,133 @@
+from __future__ import absolute_import
+
+import hashlib
+import sys
+from functools import partial
+from types import BuiltinFunctionType, CodeType, FunctionType
+
+""" Exposes the digest that identifies a merge across processes, which keys the persistent
+    cache and the compiled docstrings."""
+
+__all__ = ["merge_key"]
+
+
+# style function -> encoded identity, or None if it cannot be derived
+_style_ids = dict()
+
+_version = []
+
+# The types of the values that are identified by their repr.
+_literals = (type(None), bool, int, type(1 << 64), float, complex, str, bytes, type(u""))
+
+# Python 2 encodes lone surrogates to UTF-8 without an error handler.
+_errors = "surrogatepass" if sys.version_info[0] > 2 else "strict"
+
+# Python < 3.6 provides no BLAKE2 hash.
+_hash = partial(hashlib.blake2b, digest_size=20) if hasattr(hashlib, "blake2b") else hashlib.sha1
+
+
+class _Unidentifiable(Exception):
+    """ Raised when the identity of a value cannot be derived from its definition."""
+
+
+def _code_identity(code, seen):
+    consts = ", ".join(_identity(const, seen) for const in code.co_consts)
+    return "code({}, {!r}, {!r}, [{}])".format(
+        code.co_flags, code.co_code, code.co_names, consts
+    )
+
+
+def _identity(value, seen):
+    """ A string identifying `value` by its definition: the bytecode, constants, defaults and
+    closure of a function, the function and arguments of a partial, and the repr of a literal.
+
+    Raises
+    ------
+    _Unidentifiable
+        If the behavior of `value` may depend on state that is not part of its definition."""
+    if isinstance(value, _literals):
+        return type(value).__name__ + repr(value)
+    if isinstance(value, (tuple, frozenset)):
+        items = [_identity(item, seen) for item in value]
+        if isinstance(value, frozenset):
+            items.sort()
+        return "{}({})".format(type(value).__name__, ", ".join(items))
+    if isinstance(value, CodeType):
+        return _code_identity(value, seen)
+    if isinstance(value, BuiltinFunctionType):
+        return "builtin({}.{})".format(getattr(value, "__module__", ""), value.__name__)
+
+    if id(value) in seen:  # e.g. a recursive closure
+        return "recursion"
+    seen = seen | {id(value)}
+    if type(value) is partial:
+        return "partial({}, {}, {})".format(
+            _identity(value.func, seen),
+            _identity(value.args, seen),
+            _identity(tuple(sorted((value.keywords or {}).items())), seen),
+        )
+    if isinstance(value, FunctionType):
+        name = "{}.{}".format(value.__module__, getattr(value, "__qualname__", value.__name__))
+        closure = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        kwdefaults = getattr(value, "__kwdefaults__", None) or {}
+        return "{}:{}:{}:{}:{}".format(
+            name,
+            _code_identity(value.__code__, seen),
+            _identity(value.__defaults__ or (), seen),
+            _identity(tuple(sorted(kwdefaults.items())), seen),
+            _identity(closure, seen),
+        )
+    raise _Unidentifiable(value)
+
+
+def _style_identity(style_func):
+    """ A string identifying a style function across processes, so that editing the function
+    invalidates its cached merges; or None if its identity cannot be derived (e.g. a callable
+    instance, or a closure over a mutable object), in which case its merges are not persisted.
+
+    The identity of a function comprises its qualified name, its bytecode and constants (those of
+    its nested functions included), its defaults and the contents of its closure; that of a partial
+    comprises its function and arguments. The globals that a function refers to are only identified
+    by their names."""
+    try:
+        return _identity(style_func, frozenset())
+    except (_Unidentifiable, ValueError):  # ValueError: an empty closure cell
+        return None
+
+
+def _encode(doc):
+    if doc is None:
+        return b"\x00"
+    data = doc.encode("utf-8", _errors) if isinstance(doc, type(u"")) else doc
+    return b"\x01" + str(len(data)).encode("ascii") + b":" + data
+
+
+def merge_key(style_func, prnt_doc, child_doc):
+    """ The digest identifying the merge of `prnt_doc` and `child_doc` by `style_func`, for the
+    running version of custom_inherit.
+
+    Parameters
+    ----------
+    style_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+    prnt_doc : Optional[str]
+    child_doc : Optional[str]
+
+    Returns
+    -------
+    Optional[bytes]
+        None if the identity of `style_func` cannot be derived: its merges cannot be persisted."""
+    if not _version:
+        from . import __version__
+
+        _version.append(_encode(__version__))
+    try:
+        style_id = _style_ids[style_func]
+    except KeyError:
+        style_id = _style_identity(style_func)
+        style_id = _style_ids.setdefault(style_func, style_id and _encode(style_id))
+    if style_id is None:
+        return None
+    digest = _hash()
+    for part in (_version[0], style_id, _encode(prnt_doc), _encode(child_doc)):
+        digest.update(part)
+    return digest.digest()
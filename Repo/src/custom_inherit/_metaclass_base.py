@@ -1,7 +1,13 @@
 from __future__ import absolute_import
 
 from abc import abstractproperty
-from types import FunctionType, MethodType
+from functools import partial
+from threading import RLock
+from types import BuiltinFunctionType, FunctionType, MethodType
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from . import _merge_cache, _style_store, instrumentation
+from ._lru_cache import LRUCache
 
 """ Exposes abstract base meta class to be inherited by inheritance-style meta classes.
 
@@ -14,79 +20,508 @@ from types import FunctionType, MethodType
 __all__ = ["DocInheritorBase"]
 
 
+# Classes created in lazy mode whose docstrings have not been merged yet (mapped to None).
+_lazy_pending = WeakKeyDictionary()
+
+_lazy_lock = RLock()
+
+# The names of the attributes that `type.__new__` treats specially, and that thus are not wrapped.
+_LAZY_EXCLUDED = frozenset(["__new__", "__init_subclass__", "__class_getitem__"])
+
+
+class _LazyDoc(object):
+    """ Stands in for the `__doc__` of a class created in lazy mode, so that accessing
+    the docstring of the class (or of one of its instances) merges it on demand."""
+
+    __slots__ = ("doc",)
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, instance, owner):
+        _resolve_lazy(owner)
+        doc = vars(owner)["__doc__"]
+        if doc is self:
+            return self.doc
+        # the merged docstring is a _SharedDoc if the class shares its sections
+        return doc.render() if isinstance(doc, _SharedDoc) else doc
+
+
+class _LazyAttr(object):
+    """ Stands in for an attribute, whose docstring is to be merged, of a class created in lazy mode, so
+    that looking the attribute up on the class (or on one of its instances, or subclasses) merges the
+    docstrings of the class on demand.
+
+    Merging the docstrings of the class puts the attribute itself back in its place, so that the
+    later look ups do not go through this wrapper."""
+
+    __slots__ = ("attribute", "owner")
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+        self.owner = None  # the class, once created
+
+    def __get__(self, instance, owner):
+        if owner is None:
+            owner = type(instance)
+        # the class-creation machinery (e.g. abc.ABCMeta, which looks up the abstract methods of the bases
+        # on the new class) does not trigger the merge
+        if instance is not None or not _being_created(owner):
+            _resolve_lazy(owner)
+        return self.attribute.__get__(instance, owner)
+
+    @property
+    def __doc__(self):
+        if self.owner is not None:
+            _resolve_lazy(self.owner)
+        return _attr_doc(self.attribute)
+
+    @property
+    def __isabstractmethod__(self):
+        return getattr(self.attribute, "__isabstractmethod__", False)
+
+
+class _LazyDataAttr(_LazyAttr):
+    """ A `_LazyAttr` standing in for a property."""
+
+    __slots__ = ()
+
+    def __set__(self, instance, value):
+        _resolve_lazy(type(instance))
+        self.attribute.__set__(instance, value)
+
+    def __delete__(self, instance):
+        _resolve_lazy(type(instance))
+        self.attribute.__delete__(instance)
+
+
+def _wrap_lazy(mcs, class_dict):
+    """ Replace, in `class_dict`, the docstring of the class and its attributes whose docstrings are to be
+    merged by the lazy metaclass `mcs` by stand-ins that merge them on demand."""
+    class_dict["__doc__"] = _LazyDoc(class_dict.get("__doc__", None))
+    for attr, attribute in list(class_dict.items()):
+        if attr not in _LAZY_EXCLUDED and _is_inheritable(mcs, attr, attribute):
+            class_dict[attr] = (_LazyDataAttr if isinstance(attribute, property) else _LazyAttr)(attribute)
+
+
+def _unwrap_lazy(cls):
+    """ Put back the attributes of `cls` that `_wrap_lazy` replaced, and return the class' own docstring."""
+    for attr, attribute in list(vars(cls).items()):
+        if isinstance(attribute, _LazyAttr):
+            type.__setattr__(cls, attr, attribute.attribute)
+    doc = vars(cls).get("__doc__")
+    return doc.doc if isinstance(doc, _LazyDoc) else doc
+
+
+class _SharedDoc(object):
+    """ Stands in for the merged `__doc__` of a class created with `share_sections`: the docstring is
+    held as the tuple of its sections, and rendered (joined) upon each access.
+
+    The sections are deduplicated, and equal tuples of sections share a single `_SharedDoc` (see
+    `_shared_doc`), so that the classes of a hierarchy reference the section texts that they
+    have in common rather than holding a copy each."""
+
+    __slots__ = ("sections", "__weakref__")
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    def __get__(self, instance, owner):
+        return self.render()
+
+    def render(self):
+        return "\n\n".join(self.sections)
+
+
+# The deduplicating metaclasses -> their deduplication table (an LRUCache mapping each merged docstring to
+# its first occurrence), or None once frozen (see `_clear_dedupe`). Unlike `sys.intern`, whose strings are
+# immortal as of Python 3.12, the tables hold their strings only until they are cleared, or until they are
+# evicted as the least-recently-used of more than `_DEDUPE_MAXSIZE` docstrings; a table is released along
+# with its metaclass.
+_dedupe_tables = WeakKeyDictionary()
+
+_DEDUPE_MAXSIZE = 4096
+
+
+def _dedupe(mcs, doc):
+    """ The first occurrence of the string `doc` among those deduplicated by the metaclass `mcs`."""
+    try:
+        table = _dedupe_tables[mcs]
+    except KeyError:
+        table = _dedupe_tables.setdefault(mcs, LRUCache(_DEDUPE_MAXSIZE))
+    if table is None:
+        return doc
+    first = table.get(doc)
+    if first is None:
+        table[doc] = first = doc
+    return first
+
+
+def _clear_dedupe(mcs=None, freeze=False):
+    """ Empty the deduplication table of the metaclass `mcs` (of every metaclass if None); if `freeze` is True,
+    the metaclass no longer deduplicates the docstrings that it merges from now on."""
+    for meta in [mcs] if mcs is not None else list(_dedupe_tables.keys()):
+        _dedupe_tables[meta] = None if freeze else LRUCache(_DEDUPE_MAXSIZE)
+
+
+# (metaclass, tuple of the sections of a merged class docstring) -> the `_SharedDoc` holding them. Like the
+# sections, the `_SharedDoc`s are shared per metaclass, so that they hold the strings of its table.
+_shared_docs = WeakValueDictionary()
+
+
+def _shared_doc(mcs, sections):
+    """ The `_SharedDoc` of the docstring made of `sections` (a sequence of strings), whose sections are
+    deduplicated by the metaclass `mcs` (see `_dedupe`)."""
+    sections = tuple(_dedupe(mcs, section) for section in sections)
+    key = (mcs, sections)
+    doc = _shared_docs.get(key)
+    if doc is None:
+        doc = _shared_docs.setdefault(key, _SharedDoc(sections))
+    return doc
+
+
+class _SectionsMerge(object):
+    """ Merges class docstrings per the `merge_sections` of a style (see custom_inherit._style_store),
+    keeping the sections of the last merged docstring."""
+
+    __slots__ = ("merge_sections", "sections")
+
+    def __init__(self, merge_sections):
+        self.merge_sections = merge_sections
+        self.sections = None
+
+    def __call__(self, prnt_doc, child_doc):
+        self.sections = self.merge_sections(prnt_doc, child_doc)
+        return "\n\n".join(self.sections) if self.sections is not None else None
+
+
+def _is_inheritable(mcs, attr, attribute):
+    """ True if `attribute` is a class attribute whose docstring is merged by the metaclass."""
+    if attr.startswith("__") and attr.endswith("__") and not mcs.include_special_methods:
+        return False
+    return isinstance(
+        attribute, (FunctionType, MethodType, classmethod, staticmethod, property)
+    )
+
+
+# Name of the class attribute that marks each class whose docstrings have been merged, and holds its own
+# docstring as written in its definition (i.e. before the merge) under "__doc__". The docstrings of the
+# attributes are not recorded: the children read the current ones from the __dict__ of their ancestors.
+_ATTR_DOCS = "_custom_inherit_docs"
+
+# i.e. types.MethodWrapperType, which Python < 3.7 does not expose
+_MethodWrapperType = type(object().__str__)
+
+
+def _attr_doc(attribute):
+    """ The docstring of a class attribute, as found in the class' __dict__ (i.e. without
+    invoking the descriptor protocol), or None if the attribute does not carry a docstring."""
+    if isinstance(attribute, (staticmethod, classmethod)):
+        attribute = attribute.__func__
+    elif not (
+        hasattr(type(attribute), "__get__")
+        or isinstance(attribute, (BuiltinFunctionType, MethodType, _MethodWrapperType))  # i.e. inspect.isroutine
+    ):
+        return None
+    return getattr(attribute, "__doc__", None)
+
+
+def _inherited_attr_doc(ancestor_dicts, attr):
+    """ The docstring of the nearest definition of the attribute `attr` along the __dict__ of the
+    ancestors, `ancestor_dicts` (ordered as along the mro), that has one, or None.
+
+    The docstrings are read from the ancestors' __dict__ upon each call (without invoking the descriptor
+    protocol), so that docstrings set after an ancestor was created are accounted for."""
+    for ancestor_dict in ancestor_dicts:
+        attribute = ancestor_dict.get(attr)
+        if attribute is not None:
+            doc = _attr_doc(attribute)
+            if doc is not None:
+                return doc
+    return None
+
+
+def _merge_class_doc(mcs, ancestors, class_doc, cls=None):
+    """ Merge the docstring `class_doc` of a class (`cls`, if known) with those of its `ancestors`, ordered
+    as along its mro.
+
+    The mro of the class is walked once, with each next docstring serving as the 'parent',
+    and the accumulated docstring serving as the 'child'. The docstring of an ancestor whose
+    docstring was itself merged already accounts for that ancestor's own mro, which is thus
+    skipped: a class deriving from such a parent costs a single merge. If part of that mro was
+    accounted for already (e.g. the root of a diamond), only the ancestor's own docstring is
+    merged, so that each ancestor contributes once.
+
+    If `mcs.share_sections` is True and the style registers a `merge_sections` hook, the merged docstring is
+    returned as a `_SharedDoc` (unless the style is memoized, see `_merge_cache.merger`)."""
+    merged = set()
+    instrumented = instrumentation._active
+    merge = _merge_cache.merger(mcs.class_doc_inherit)
+    merge_sections = None
+    if getattr(mcs, "share_sections", False):
+        merge_sections = _style_store.merge_sections_of(merge)
+    if merge_sections is not None:
+        merge = _SectionsMerge(merge_sections)
+    for mro_cls in ancestors:
+        if mro_cls in merged:
+            continue
+        if _ATTR_DOCS not in vars(mro_cls):
+            prnt_cls_doc = mro_cls.__doc__
+        elif merged.isdisjoint(mro_cls.__mro__):
+            prnt_cls_doc = mro_cls.__doc__
+            merged.update(mro_cls.__mro__)
+        else:
+            prnt_cls_doc = vars(mro_cls)[_ATTR_DOCS].get("__doc__")
+        if prnt_cls_doc is not None:
+            if prnt_cls_doc == "The most base type":
+                prnt_cls_doc = None
+        if instrumented:
+            class_doc = instrumentation._timed(
+                instrumentation.CLASS_MERGE, getattr(cls, "__module__", None), cls, None,
+                mcs.class_doc_inherit, prnt_cls_doc, class_doc, partial(merge, prnt_cls_doc),
+            )
+        else:
+            class_doc = merge(prnt_cls_doc, class_doc)
+    if merge_sections is not None and merge.sections is not None:
+        return _shared_doc(mcs, merge.sections)
+    return class_doc
+
+
+def _inherit_docstrings(cls, class_doc, mcs=None, ancestors=None):
+    """ Merge the docstrings of the newly-created class `cls`, whose own docstring
+    is `class_doc`, and of its attributes with those of its ancestors.
+
+    The merge is performed by the metaclass `mcs` (the class' own metaclass by default), along
+    `ancestors` (the class' mro by default); `mcs` need only provide the `class_doc_inherit`,
+    `attr_doc_inherit` and `include_special_methods` attributes of `DocInheritorBase`. If `mcs.dedupe`
+    is True, the merged docstrings are deduplicated (see `_dedupe`); if `mcs.share_sections` is True,
+    the merged class docstring is held as its shared sections (see `_SharedDoc`)."""
+    if mcs is None:
+        mcs = type(cls)
+    if ancestors is None:
+        ancestors = type.__getattribute__(cls, "__mro__")[1:]
+    class_dict = vars(cls)
+    dedupe = getattr(mcs, "dedupe", False)
+    own_doc = class_doc
+    class_doc = _merge_class_doc(mcs, ancestors, class_doc, cls)
+    if dedupe and type(class_doc) is str:
+        class_doc = _dedupe(mcs, class_doc)
+    try:
+        type.__setattr__(cls, "__doc__", class_doc)
+    # the __doc__ of the classes whose metaclass is `type` is read-only in Python 2
+    except (TypeError, AttributeError):
+        pass
+
+    # a parent docstring shared by several attributes is prepared (e.g. parsed) once, if the style supports
+    # it and is not memoized (the merges prepared by it would bypass the caches)
+    attr_doc_inherit = mcs.attr_doc_inherit
+    merge = _merge_cache.merger(attr_doc_inherit)
+    bind_parent = _style_store.bind_parent_of(merge)
+    bound_merges = {}
+    instrumented = instrumentation._active
+    ancestor_dicts = [vars(mro_cls) for mro_cls in ancestors]
+
+    # inherit docstring for method, static-method, class-method, abstract-method, decorated-method, and property
+    for attr, attribute in list(class_dict.items()):
+        if not _is_inheritable(mcs, attr, attribute):
+            continue
+
+        is_static_or_class = isinstance(attribute, (staticmethod, classmethod))
+        child_attr = attribute if not is_static_or_class else attribute.__func__
+
+        prnt_attr_doc = _inherited_attr_doc(ancestor_dicts, attr)
+        if prnt_attr_doc is None:
+            continue
+
+        merge_with_parent = None
+        if bind_parent is not None:
+            merge_with_parent = bound_merges.get(prnt_attr_doc)
+            if merge_with_parent is None:
+                merge_with_parent = bound_merges[prnt_attr_doc] = bind_parent(prnt_attr_doc)
+        if instrumented:
+            doc = instrumentation._timed(
+                instrumentation.ATTR_MERGE, cls.__module__, cls, attr, attr_doc_inherit,
+                prnt_attr_doc, child_attr.__doc__, merge_with_parent or partial(merge, prnt_attr_doc),
+            )
+        elif merge_with_parent is None:
+            doc = merge(prnt_attr_doc, child_attr.__doc__)
+        else:
+            doc = merge_with_parent(child_attr.__doc__)
+        if dedupe and type(doc) is str:
+            doc = _dedupe(mcs, doc)
+        try:
+            child_attr.__doc__ = doc
+        # property.__doc__ is read-only in Python 2 (TypeError), 3.3 - 3.4 (AttributeError)
+        except (TypeError, AttributeError) as err:
+            if type(child_attr) in (property, abstractproperty):
+                new_prop = property(
+                    fget=child_attr.fget,
+                    fset=child_attr.fset,
+                    fdel=child_attr.fdel,
+                    doc=doc,
+                )
+                if isinstance(child_attr, abstractproperty):
+                    new_prop = abstractproperty(new_prop)
+                type.__setattr__(cls, attr, new_prop)
+            else:
+                raise type(err)(err)
+
+    type.__setattr__(cls, _ATTR_DOCS, {"__doc__": own_doc})
+
+
+def _linearize(parents):
+    """ The C3 linearization of `parents`: the mro that a class deriving from them would have,
+    except for the class itself."""
+    sequences = [list(parent.__mro__) for parent in parents] + [list(parents)]
+    ancestors = []
+    while True:
+        sequences = [seq for seq in sequences if seq]
+        if not sequences:
+            return tuple(ancestors)
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            raise TypeError(
+                "Cannot create a consistent method resolution order (MRO) for bases "
+                + ", ".join(parent.__name__ for parent in parents)
+            )
+        ancestors.append(head)
+        for seq in sequences:
+            if seq[0] is head:
+                del seq[0]
+
+
+def _retrofit_docstrings(cls, mcs, parents=None):
+    """ Merge the docstrings of the existing class `cls`, and of its attributes, with those of
+    `parents` (a class or a sequence of classes; the class' bases by default), as the metaclass
+    `mcs` would have upon creating the class."""
+    if parents is None:
+        parents = cls.__bases__
+        ancestors = type.__getattribute__(cls, "__mro__")[1:]
+    else:
+        parents = (parents,) if isinstance(parents, type) else tuple(parents)
+        ancestors = _linearize(parents)
+    for parent in parents:
+        _resolve_lazy(parent)
+    class_doc = vars(cls).get("__doc__")
+    if isinstance(class_doc, _SharedDoc):
+        class_doc = class_doc.render()
+    _inherit_docstrings(cls, class_doc, mcs, ancestors)
+    return cls
+
+
+# Py_TPFLAGS_HEAPTYPE: set for the classes created by class statements, whose attributes can be set
+_HEAPTYPE = 1 << 9
+
+
+def _retrofit_classes(classes, mcs):
+    """ Merge the docstrings of each of `classes` with those of its bases, as the metaclass `mcs`
+    would have upon creating them.
+
+    The classes are merged ancestors first, so that each one merges with the already-merged
+    docstrings of its parents. The classes whose docstrings are already merged (by a metaclass,
+    or previously), or pending a lazy merge, as well as the built-in classes, are skipped.
+
+    Returns
+    -------
+    List[type]
+        The classes that were merged, in order."""
+    retrofitted = []
+    for cls in sorted(set(classes), key=lambda cls: len(type.__getattribute__(cls, "__mro__"))):
+        if (
+            not type.__getattribute__(cls, "__flags__") & _HEAPTYPE
+            or _ATTR_DOCS in vars(cls)
+            or cls in _lazy_pending
+        ):
+            continue
+        _retrofit_docstrings(cls, mcs)
+        retrofitted.append(cls)
+    return retrofitted
+
+
+def _subclasses(root_cls):
+    """ All of the (direct and indirect) subclasses of `root_cls`."""
+    subclasses = set()
+    stack = [root_cls]
+    while stack:
+        for subclass in type.__subclasses__(stack.pop()):
+            if subclass not in subclasses:
+                subclasses.add(subclass)
+                stack.append(subclass)
+    return subclasses
+
+
+def _being_created(cls):
+    """ Whether the class `cls`, of a lazy metaclass, is being created: it is neither pending a merge,
+    which it is once fully built (see `DocInheritorBase.__init__`), nor merged."""
+    return (
+        getattr(type(cls), "lazy", False)
+        and _ATTR_DOCS not in vars(cls)
+        and cls not in _lazy_pending
+    )
+
+
+def _resolve_lazy(cls):
+    """ Merge the docstrings of `cls`, and of its ancestors, that were created in lazy mode and
+    have not been merged yet."""
+    with _lazy_lock:
+        if not _lazy_pending:
+            return
+        # ancestors first: a child merges with the already-merged docstrings of its parents
+        for mro_cls in reversed(type.__getattribute__(cls, "__mro__")):
+            if _lazy_pending.pop(mro_cls, _lazy_pending) is not _lazy_pending:
+                _inherit_docstrings(mro_cls, _unwrap_lazy(mro_cls))
+
+
+def _resolve_all_lazy():
+    """ Merge the docstrings of all of the classes created in lazy mode that are still pending."""
+    for cls in list(_lazy_pending.keys()):
+        _resolve_lazy(cls)
+
+
 class DocInheritorBase(type):
     """ A metaclass that merges the respective docstrings of a parent class and of its child, along with their
     properties, methods (including classmethod, staticmethod, decorated methods).
 
     This merge-style must be implemented via the static methods `class_doc_inherit`
-    and `attr_doc_inherit`, which are set within `custom_inherit.DocInheritMeta`."""
+    and `attr_doc_inherit`, which are set within `custom_inherit.DocInheritMeta`.
+
+    If `lazy` is True, the docstrings are not merged upon class creation, but upon the first
+    look up of the class' docstring or of one of its merged attributes (see `_LazyAttr`).
+
+    If `dedupe` is True, equal merged docstrings share a single string, through a bounded table held per
+    metaclass until it is cleared (see `custom_inherit.clear_dedupe`).
+
+    If `share_sections` is True, and the style registers a `merge_sections` hook, the merged docstring of a
+    class is held as a tuple of sections, deduplicated as by `dedupe`, shared with the other classes,
+    and rendered upon access."""
 
     include_special_methods = False
+    lazy = False
+    dedupe = False
+    share_sections = False
 
     def __new__(mcs, class_name, class_bases, class_dict):
-        # inherit class docstring: the docstring is constructed by traversing
-        # the mro for the class and merging their docstrings, with each next
-        # docstring as serving as the 'parent', and the accumulated docstring
-        # serving as the 'child'
-        this_doc = class_dict.get("__doc__", None)
-        for mro_cls in (mro_cls for base in class_bases for mro_cls in base.mro()):
-            prnt_cls_doc = mro_cls.__doc__
-            if prnt_cls_doc is not None:
-                if prnt_cls_doc == "The most base type":
-                    prnt_cls_doc = None
-            this_doc = mcs.class_doc_inherit(prnt_cls_doc, this_doc)
-
-        class_dict["__doc__"] = this_doc
-
-        # inherit docstring for method, static-method, class-method, abstract-method, decorated-method, and property
-        for attr, attribute in class_dict.items():
-            is_doc_type = isinstance(
-                attribute,
-                (FunctionType, MethodType, classmethod, staticmethod, property),
-            )
-            if (
-                (attr.startswith("__") and attr.endswith("__") and not mcs.include_special_methods) or
-                not is_doc_type
-            ):
-                continue
-
-            is_static_or_class = isinstance(attribute, (staticmethod, classmethod))
-            child_attr = attribute if not is_static_or_class else attribute.__func__
-
-            prnt_attr_doc = None
-            for mro_cls in (
-                mro_cls
-                for base in class_bases
-                for mro_cls in base.mro()
-                if hasattr(mro_cls, attr)
-            ):
-                prnt_attr_doc = getattr(mro_cls, attr).__doc__
-
-                if prnt_attr_doc is not None:
-                    break
-
-            if prnt_attr_doc is None:
-                continue
-
-            doc = mcs.attr_doc_inherit(prnt_attr_doc, child_attr.__doc__)
-            try:
-                child_attr.__doc__ = doc
-            # property.__doc__ is read-only in Python 2 (TypeError), 3.3 - 3.4 (AttributeError)
-            except (TypeError, AttributeError) as err:
-                if type(child_attr) in (property, abstractproperty):
-                    new_prop = property(
-                        fget=child_attr.fget,
-                        fset=child_attr.fset,
-                        fdel=child_attr.fdel,
-                        doc=doc,
-                    )
-                    if isinstance(child_attr, abstractproperty):
-                        new_prop = abstractproperty(new_prop)
-                    class_dict[attr] = new_prop
-                else:
-                    raise type(err)(err)
-
-        return type.__new__(mcs, class_name, class_bases, class_dict)
+        if mcs.lazy:
+            _wrap_lazy(mcs, class_dict)
+            return type.__new__(mcs, class_name, class_bases, class_dict)
+        class_doc = class_dict.get("__doc__", None)
+        cls = type.__new__(mcs, class_name, class_bases, class_dict)
+        _inherit_docstrings(cls, class_doc)
+        return cls
+
+    def __init__(cls, class_name, class_bases, class_dict):
+        type.__init__(cls, class_name, class_bases, class_dict)
+        if type(cls).lazy:
+            # registered only once the class is fully built (e.g. by abc.ABCMeta), so
+            # that the class-creation machinery does not trigger the merge
+            with _lazy_lock:
+                for attribute in vars(cls).values():
+                    if isinstance(attribute, _LazyAttr):
+                        attribute.owner = cls
+                _lazy_pending[cls] = None
 
     @staticmethod
     def class_doc_inherit(prnt_cls_doc, child_doc):
@@ -0,0 +1,135 @@
+from __future__ import absolute_import
+
+import atexit
+import os
+import sqlite3
+from threading import Lock
+
+from ._merge_key import merge_key
+
+""" Exposes the on-disk cache of merged docstrings, which persists merges across processes.
+
+    The cache is a single SQLite database per cache directory, which is memory-mapped for reading
+    and written to in write-ahead-log mode, so that several processes can share it concurrently."""
+
+__all__ = ["PersistentCache"]
+
+
+class PersistentCache(object):
+    """ A mapping from the (style, parent docstring, child docstring) of a merge to its
+    merged docstring, persisted in `<directory>/merged_docstrings.sqlite3`.
+
+    Entries are keyed by `custom_inherit._merge_key.merge_key`: a hash of the style's identity,
+    of both docstrings and of the version of custom_inherit. Writes are buffered, and flushed
+    every `flush_every` writes and at exit. Errors raised by the database (e.g. a read-only or
+    locked file) are never propagated: the corresponding look ups simply miss. Instead, they are
+    counted by `errors`, and the first one is logged as a warning by the "custom_inherit" logger."""
+
+    filename = "merged_docstrings.sqlite3"
+
+    def __init__(self, directory, flush_every=512):
+        """
+        Parameters
+        ----------
+        directory : str
+            The directory holding the cache; it is created if needed.
+        flush_every : int, optional (default: 512)
+            The number of buffered writes that triggers a write to the disk."""
+        directory = os.path.expanduser(directory)
+        self.path = os.path.join(directory, self.filename)
+        self.flush_every = flush_every
+        self._pending = dict()
+        self._lock = Lock()
+        self._db = None
+        self.errors = 0
+
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA mmap_size=268435456")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS merges (key BLOB PRIMARY KEY, doc TEXT) WITHOUT ROWID"
+            )
+            db.commit()
+        except (OSError, sqlite3.Error):
+            self._error("open")
+            return
+        self._db = db
+        atexit.register(self.close)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.path)
+
+    @staticmethod
+    def key(style_func, prnt_doc, child_doc):
+        """ The digest keying the merge of `prnt_doc` and `child_doc` by `style_func`.
+
+        Returns
+        -------
+        Optional[bytes]
+            None if the identity of `style_func` cannot be derived, in which case its merges
+            are not persisted."""
+        return merge_key(style_func, prnt_doc, child_doc)
+
+    def _error(self, action):
+        """ Account for the error, being handled, raised upon the `action` of the database."""
+        self.errors += 1
+        if self.errors == 1:
+            import logging
+
+            logging.getLogger("custom_inherit").warning(
+                "failed to %s the docstring cache %s; further errors are only counted", action, self.path,
+                exc_info=True,
+            )
+
+    def get(self, key, default=None):
+        """ The merged docstring stored for `key`, or `default`."""
+        with self._lock:
+            try:
+                return self._pending[key]
+            except KeyError:
+                pass
+            if self._db is None:
+                return default
+            try:
+                row = self._db.execute("SELECT doc FROM merges WHERE key = ?", (sqlite3.Binary(key),)).fetchone()
+            except sqlite3.Error:
+                self._error("read")
+                return default
+        return default if row is None else row[0]
+
+    def __setitem__(self, key, doc):
+        with self._lock:
+            if self._db is None:
+                return
+            self._pending[key] = doc
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def flush(self):
+        """ Write the buffered merges to the disk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending or self._db is None:
+            return
+        # the keys are bound as blobs: the bytes of Python 2 (i.e. str) would be bound as text
+        rows = [(sqlite3.Binary(key), doc) for key, doc in self._pending.items()]
+        self._pending.clear()
+        try:
+            with self._db:
+                self._db.executemany("INSERT OR IGNORE INTO merges (key, doc) VALUES (?, ?)", rows)
+        except sqlite3.Error:
+            self._error("write")
+
+    def close(self):
+        """ Flush the buffered merges and close the database."""
+        with self._lock:
+            self._flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
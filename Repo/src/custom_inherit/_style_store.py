@@ -1,7 +1,8 @@
 from __future__ import absolute_import
 
-from ._doc_parse_tools import (merge_google_napoleon_docs, merge_numpy_docs,
-                               merge_numpy_napoleon_docs, merge_rest_docs)
+from functools import partial
+
+from . import _doc_parse_tools
 
 """ Docstring inheritance-style implementations.
 
@@ -21,11 +22,87 @@ from ._doc_parse_tools import (merge_google_napoleon_docs, merge_numpy_docs,
                         The merged docstring that will be utilized.'''
                 return final_docstring
 
-    and log this using `custom_inherit.add_style(your_style)`. To permanently save your function,
+    A style may also register hooks (see `register_hooks`, or `custom_inherit.add_style`):
+
+    - `bind_parent`: a function that, given the parent's docstring, returns a function that merges a child's
+      docstring with it (i.e. `bind_parent(prnt_doc)(child_doc)` equals `your_style(prnt_doc, child_doc)`).
+      `custom_inherit.doc_inherit` uses it to prepare the parent's docstring once (e.g. parse it) for all of
+      the functions that it decorates.
+    - `merge_sections`: a function that merges the docstrings as the style does, but returns the sections of
+      the merged docstring (a sequence of strings, or None), which `"\\n\\n".join` into it.
+      `DocInheritMeta(..., share_sections=True)` uses it to share equal sections between the docstrings of
+      classes.
+
+    The hooks are registered for the style function itself, rather than stored as its attributes, so that
+    a function wrapping a style (e.g. via `functools.wraps`, which copies the attributes of the wrapped
+    function) does not inherit hooks that ignore its own behavior.
+
+    Log your style using `custom_inherit.add_style(your_style)`. To permanently save your function,
     define your function within custom_inherit/_style_store.py, and log it in custom_inherit.style_store.__all__.
     Your style will then be available as 'your_style' (i.e. whatever you named the function).
 """
 
+
+def _parse_tool(name):
+    """ A function that forwards its calls to `custom_inherit._doc_parse_tools.<name>`, so that
+    the parsers are only imported once a style that needs them is first used."""
+
+    def forward(*args, **kwargs):
+        return getattr(_doc_parse_tools, name)(*args, **kwargs)
+
+    forward.__name__ = forward.__qualname__ = name
+    return forward
+
+
+merge_numpy_docs = _parse_tool("merge_numpy_docs")
+merge_rest_docs = _parse_tool("merge_rest_docs")
+merge_numpy_napoleon_docs = _parse_tool("merge_numpy_napoleon_docs")
+merge_google_napoleon_docs = _parse_tool("merge_google_napoleon_docs")
+bind_numpy_docs = _parse_tool("bind_numpy_docs")
+bind_rest_docs = _parse_tool("bind_rest_docs")
+bind_numpy_napoleon_docs = _parse_tool("bind_numpy_napoleon_docs")
+bind_google_napoleon_docs = _parse_tool("bind_google_napoleon_docs")
+merge_numpy_sections = _parse_tool("merge_numpy_sections")
+merge_rest_sections = _parse_tool("merge_rest_sections")
+merge_numpy_napoleon_sections = _parse_tool("merge_numpy_napoleon_sections")
+merge_google_napoleon_sections = _parse_tool("merge_google_napoleon_sections")
+
+# style function -> its `bind_parent` hook, and its `merge_sections` hook (see `register_hooks`)
+_bind_parents = dict()
+_section_mergers = dict()
+
+
+def register_hooks(style_func, bind_parent=None, merge_sections=None):
+    """ Register the hooks of `style_func` (see above); a hook that is None is unregistered.
+
+    Parameters
+    ----------
+    style_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+    bind_parent : Optional[Callable[[Optional[str]], Callable[[Optional[str]], Optional[str]]]]
+    merge_sections : Optional[Callable[[Optional[str], Optional[str]], Optional[Sequence[str]]]]"""
+    for hooks, hook in ((_bind_parents, bind_parent), (_section_mergers, merge_sections)):
+        if hook is None:
+            hooks.pop(style_func, None)
+        else:
+            hooks[style_func] = hook
+
+
+def bind_parent_of(style_func):
+    """ The `bind_parent` hook registered for `style_func` itself, if any."""
+    try:
+        return _bind_parents.get(style_func)
+    except TypeError:  # unhashable
+        return None
+
+
+def merge_sections_of(style_func):
+    """ The `merge_sections` hook registered for `style_func` itself, if any."""
+    try:
+        return _section_mergers.get(style_func)
+    except TypeError:  # unhashable
+        return None
+
+
 # All built-in styles must be logged in the __all__ field.
 __all__ = [
     "parent",
@@ -506,3 +583,33 @@ def numpy_with_merge(prnt_doc, child_doc):
                 7'''
     """
     return merge_numpy_docs(prnt_doc, child_doc, merge_within_sections=True)
+
+
+def _bind_parent_keeps_child(prnt_doc):
+    return lambda child_doc: child_doc if child_doc is not None else prnt_doc
+
+
+register_hooks(parent, bind_parent=_bind_parent_keeps_child)
+register_hooks(numpy, bind_parent=bind_numpy_docs, merge_sections=merge_numpy_sections)
+register_hooks(reST, bind_parent=bind_rest_docs, merge_sections=merge_rest_sections)
+register_hooks(
+    numpy_napoleon, bind_parent=bind_numpy_napoleon_docs, merge_sections=merge_numpy_napoleon_sections
+)
+register_hooks(
+    google, bind_parent=bind_google_napoleon_docs, merge_sections=merge_google_napoleon_sections
+)
+register_hooks(
+    google_with_merge,
+    bind_parent=partial(bind_google_napoleon_docs, merge_within_sections=True),
+    merge_sections=partial(merge_google_napoleon_sections, merge_within_sections=True),
+)
+register_hooks(
+    numpy_napoleon_with_merge,
+    bind_parent=partial(bind_numpy_napoleon_docs, merge_within_sections=True),
+    merge_sections=partial(merge_numpy_napoleon_sections, merge_within_sections=True),
+)
+register_hooks(
+    numpy_with_merge,
+    bind_parent=partial(bind_numpy_docs, merge_within_sections=True),
+    merge_sections=partial(merge_numpy_sections, merge_within_sections=True),
+)
@@ -0,0 +1,93 @@
+from __future__ import absolute_import
+
+from threading import Lock
+
+from . import instrumentation
+from .instrumentation import MergeEvent
+
+""" Exposes the registry of the callbacks that are notified of each docstring merge, e.g. to feed
+    metrics or tracing spans.
+
+    The callbacks are called with a `MergeEvent`, from the metaclasses and from the decorators, right
+    after each merge. While no callback is registered (and the instrumentation is disabled), the merges
+    only check a module flag."""
+
+__all__ = ["MergeEvent", "clear", "on_merge", "remove"]
+
+
+_callbacks = []
+_lock = Lock()
+
+
+def _dispatch(event, doc):
+    """ The listener of the merges (see custom_inherit.instrumentation), registered while there are callbacks."""
+    for callback in list(_callbacks):
+        try:
+            callback(event)
+        except Exception:
+            import logging
+
+            logging.getLogger("custom_inherit").exception("error in the merge hook %r", callback)
+
+
+def on_merge(callback):
+    """ Register `callback` to be called with the `MergeEvent` of each docstring merge, from now on.
+
+    The event is a named tuple of:
+
+    - kind: "class_doc_inherit", "attr_doc_inherit" or "DocInheritDecorator.__call__".
+    - module: the name of the module in which the docstring's owner is defined.
+    - owner: the class whose docstring (or attribute's docstring) is merged, or the qualified name of
+      the class (if any) in which a decorated function is defined.
+    - name: the name of the attribute, or None for the docstring of a class.
+    - style: the style function.
+    - parent_size, child_size, output_size: the lengths of the docstrings (0 for None).
+    - elapsed_ns: the duration of the merge, in nanoseconds.
+    - cached: whether a cache of merged docstrings served the merge.
+
+    Exceptions raised by a callback are logged (by the "custom_inherit" logger) rather than propagated.
+    This can be used as a decorator.
+
+    Parameters
+    ----------
+    callback : Callable[[MergeEvent], Any]
+
+    Returns
+    -------
+    Callable[[MergeEvent], Any]
+        The callback itself."""
+    if not callable(callback):
+        raise TypeError("`callback` must be callable, got {!r}".format(callback))
+    with _lock:
+        _callbacks.append(callback)
+        if len(_callbacks) == 1:
+            instrumentation._add_listener(_dispatch)
+    return callback
+
+
+def remove(callback):
+    """ Unregister `callback`, registered via `on_merge`.
+
+    Parameters
+    ----------
+    callback : Callable[[MergeEvent], Any]
+
+    Raises
+    ------
+    ValueError
+        If `callback` is not registered."""
+    with _lock:
+        try:
+            _callbacks.remove(callback)
+        except ValueError:
+            raise ValueError("{!r} is not a registered callback".format(callback))
+        if not _callbacks:
+            instrumentation._remove_listener(_dispatch)
+
+
+def clear():
+    """ Unregister all of the callbacks registered via `on_merge`."""
+    with _lock:
+        if _callbacks:
+            del _callbacks[:]
+            instrumentation._remove_listener(_dispatch)
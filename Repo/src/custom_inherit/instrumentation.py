@@ -0,0 +1,268 @@
+from __future__ import absolute_import
+
+import os
+from collections import namedtuple
+from threading import Lock
+
+from . import _merge_cache
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # Python < 3.7
+    try:
+        from time import perf_counter
+    except ImportError:  # Python 2: the wall clock, at a lower resolution
+        from time import time as perf_counter
+
+    def perf_counter_ns():
+        return int(perf_counter() * 1e9)
+
+""" Opt-in instrumentation of the docstring merges: counters and timers per kind of merge and per
+    style, the hit rates of the caches, and a log of the slow merges.
+
+    The instrumentation is disabled by default, in which case (unless hooks are registered, see
+    custom_inherit.hooks) the merges only check a module flag;
+    it is enabled by `enable()`, or by setting the environment variable CUSTOM_INHERIT_INSTRUMENTATION
+    (to any value but "" or "0") before importing custom_inherit. CUSTOM_INHERIT_SLOW_MERGE_MS then
+    sets the threshold of the slow-merge log, in milliseconds."""
+
+__all__ = [
+    "CLASS_MERGE", "ATTR_MERGE", "DECORATOR_MERGE", "MergeEvent", "disable", "enable", "is_enabled", "reset", "stats",
+]
+
+
+# the kinds of merges, as recorded
+CLASS_MERGE = "class_doc_inherit"
+ATTR_MERGE = "attr_doc_inherit"
+DECORATOR_MERGE = "DocInheritDecorator.__call__"
+
+# A merge, as recorded: its kind (one of the above); the name of the module and the owner - a class, or
+# the qualified name of the class (if any) of a decorated function - of the merged docstring; the name of
+# the attribute (None for a class' docstring); the style function; the lengths of the parent, child and
+# merged docstrings (0 for None); its duration in nanoseconds; and whether a cache of merged docstrings
+# served it.
+MergeEvent = namedtuple(
+    "MergeEvent",
+    ["kind", "module", "owner", "name", "style", "parent_size", "child_size", "output_size", "elapsed_ns", "cached"],
+)
+
+# Read by the merging code before each merge: the merges are timed and recorded only if it is True,
+# i.e. if the instrumentation is enabled or if listeners are registered.
+_active = False
+_enabled = False
+
+# Called with the MergeEvent and the merged docstring of each recorded merge (see `_add_listener`).
+_listeners = []
+
+_lock = Lock()
+_slow_threshold = 1e-3  # seconds
+_timers = dict()  # kind -> [count, total seconds, max seconds]
+_styles = dict()  # style name -> [count, total seconds]
+_slow_merges = 0
+_cache_baselines = dict()  # cache name -> (hits, misses) upon enabling, or resetting, the instrumentation
+
+
+def _caches():
+    from ._doc_parse_tools.parse_cache import parse_cache
+    from ._merge_cache import merge_cache
+
+    return {"parse_cache": parse_cache, "merge_cache": merge_cache}
+
+
+def _style_name(style_func):
+    """ A readable name of the style function `style_func`."""
+    func = getattr(style_func, "func", style_func)  # a functools.partial
+    return getattr(func, "__name__", None) or repr(func)
+
+
+def is_enabled():
+    """ Whether the merges are instrumented."""
+    return _enabled
+
+
+def _update_active():
+    global _active
+    _active = _enabled or bool(_listeners)
+
+
+def _add_listener(listener):
+    """ Call `listener(event, doc)` with the MergeEvent and the merged docstring of each merge, from now on,
+    whether or not the instrumentation is enabled."""
+    with _lock:
+        _listeners.append(listener)
+        _update_active()
+
+
+def _remove_listener(listener):
+    """ Stop calling `listener`; raise ValueError if it is not registered."""
+    with _lock:
+        _listeners.remove(listener)
+        _update_active()
+
+
+def enable(slow_threshold=None):
+    """ Instrument the docstring merges, from now on.
+
+    Parameters
+    ----------
+    slow_threshold : Optional[float]
+        The duration, in seconds, above which a single merge is logged as slow (as a warning of
+        the "custom_inherit" logger). Defaults to the current threshold (initially 1 ms)."""
+    global _enabled, _slow_threshold
+    with _lock:
+        if slow_threshold is not None:
+            _slow_threshold = float(slow_threshold)
+        if not _enabled:
+            _reset()
+            _enabled = True
+            _update_active()
+
+
+def disable():
+    """ Stop instrumenting the docstring merges. The statistics gathered so far are kept."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        _update_active()
+
+
+def reset():
+    """ Discard the statistics gathered so far."""
+    with _lock:
+        _reset()
+
+
+def _reset():
+    global _slow_merges
+    _timers.clear()
+    _styles.clear()
+    _slow_merges = 0
+    _cache_baselines.clear()
+    for name, cache in _caches().items():
+        info = cache.info()
+        _cache_baselines[name] = (info.hits, info.misses)
+
+
+def _qualified_name(module, owner, name):
+    if owner is not None and not isinstance(owner, str):
+        owner = getattr(owner, "__qualname__", owner.__name__)  # Python 2: no qualified names
+    return ".".join(part for part in (module, owner, name) if part) or "<unknown>"
+
+
+def _record(event, doc):
+    """ Record a merge, described by a MergeEvent, in the statistics if the instrumentation is enabled,
+    and hand it to the listeners, along with the merged docstring `doc`."""
+    if _enabled:
+        _record_stats(event)
+    for listener in list(_listeners):
+        try:
+            listener(event, doc)
+        except Exception:
+            import logging
+
+            logging.getLogger("custom_inherit").exception("error in the merge listener %r", listener)
+
+
+def _record_stats(event):
+    global _slow_merges
+    kind = event.kind
+    seconds = event.elapsed_ns / 1e9
+    style = _style_name(event.style)
+    with _lock:
+        timer = _timers.get(kind)
+        if timer is None:
+            timer = _timers[kind] = [0, 0.0, 0.0]
+        timer[0] += 1
+        timer[1] += seconds
+        if seconds > timer[2]:
+            timer[2] = seconds
+        style_timer = _styles.get(style)
+        if style_timer is None:
+            style_timer = _styles[style] = [0, 0.0]
+        style_timer[0] += 1
+        style_timer[1] += seconds
+        slow = seconds > _slow_threshold
+        if slow:
+            _slow_merges += 1
+
+    if slow:
+        import logging
+
+        logging.getLogger("custom_inherit").warning(
+            "slow docstring merge (%.1f ms, style %s): %s",
+            seconds * 1e3,
+            style,
+            _qualified_name(event.module, event.owner, event.name),
+        )
+
+
+def _size(doc):
+    return len(doc) if doc is not None else 0
+
+
+def _timed(kind, module, owner, name, style_func, prnt_doc, child_doc, merge_with_parent=None):
+    """ Merge `prnt_doc` and `child_doc` per `style_func` - or via `merge_with_parent(child_doc)`, if given,
+    which `style_func` prepared for `prnt_doc` - recording it as a merge (see `MergeEvent` and `_record`),
+    and return the merged docstring."""
+    served = _merge_cache.served_count()
+    start = perf_counter_ns()
+    if merge_with_parent is None:
+        doc = style_func(prnt_doc, child_doc)
+    else:
+        doc = merge_with_parent(child_doc)
+    elapsed_ns = perf_counter_ns() - start
+    _record(
+        MergeEvent(
+            kind, module, owner, name, style_func, _size(prnt_doc), _size(child_doc), _size(doc), elapsed_ns,
+            _merge_cache.served_count() != served,
+        ),
+        doc,
+    )
+    return doc
+
+
+def stats():
+    """ A snapshot of the statistics gathered since the instrumentation was enabled (or reset).
+
+    Returns
+    -------
+    dict
+        - "enabled": whether the merges are currently instrumented.
+        - "merges": for each kind of merge ("class_doc_inherit", "attr_doc_inherit" and
+          "DocInheritDecorator.__call__"), a dict of its "count", "total_seconds" and "max_seconds".
+        - "styles": for each style (by name), a dict of its "count" and "total_seconds".
+        - "slow_merges": the number of merges slower than the slow-merge threshold.
+        - "slow_threshold": the slow-merge threshold, in seconds.
+        - "caches": for the caches of parsed docstrings ("parse_cache") and of merged docstrings
+          ("merge_cache"), a dict of their "hits", "misses" and "hit_rate" (None without lookups)."""
+    caches = {}
+    with _lock:
+        merges = {
+            kind: {"count": count, "total_seconds": total, "max_seconds": maximum}
+            for kind, (count, total, maximum) in _timers.items()
+        }
+        styles = {style: {"count": count, "total_seconds": total} for style, (count, total) in _styles.items()}
+        for name, cache in _caches().items():
+            info = cache.info()
+            hits, misses = _cache_baselines.get(name, (0, 0))
+            # a cleared cache restarts its counts
+            hits = info.hits - hits if info.hits >= hits else info.hits
+            misses = info.misses - misses if info.misses >= misses else info.misses
+            caches[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": float(hits) / (hits + misses) if hits + misses else None,
+            }
+        return {
+            "enabled": _enabled,
+            "merges": merges,
+            "styles": styles,
+            "slow_merges": _slow_merges,
+            "slow_threshold": _slow_threshold,
+            "caches": caches,
+        }
+
+
+if os.environ.get("CUSTOM_INHERIT_INSTRUMENTATION", "0") not in ("", "0"):
+    _threshold_ms = os.environ.get("CUSTOM_INHERIT_SLOW_MERGE_MS")
+    enable(float(_threshold_ms) / 1e3 if _threshold_ms else None)
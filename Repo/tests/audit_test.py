@@ -0,0 +1,106 @@
+""" Tests the audit of the docstring merges performed upon import """
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import custom_inherit
+from custom_inherit import instrumentation
+from custom_inherit._audit import audit, format_report
+
+BASE = '''
+from custom_inherit import DocInheritMeta, doc_inherit
+
+
+class Parent(metaclass=DocInheritMeta(style="numpy")):
+    """Parent. é"""
+
+    def method(self):
+        """Method."""
+
+    def other(self):
+        """Other."""
+
+
+@doc_inherit(Parent.method, style="google")
+def func():
+    """Func."""
+'''
+
+CHILDREN = '''
+from .base import Parent
+
+
+class Kid(Parent):
+    def method(self):
+        pass
+
+
+class Lazy(Parent):
+    pass
+'''
+
+
+@pytest.fixture
+def package(tmp_path):
+    root = tmp_path / "audit_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("from . import base\n")
+    (root / "base.py").write_text(textwrap.dedent(BASE), encoding="utf-8")
+    (root / "children.py").write_text(textwrap.dedent(CHILDREN))
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield "audit_pkg"
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [name for name in sys.modules if name.split(".")[0] == "audit_pkg"]:
+            del sys.modules[name]
+
+
+def test_audit(package):
+    entries = audit(package)
+    assert [entry.name for entry in entries] == ["audit_pkg.base"]
+    (base,) = entries
+    # Parent merges its docstring with object's; func is decorated
+    assert base.merges == 2
+    assert base.styles == ("google", "numpy")
+    assert sorted(child.name for child in base.children) == ["<functions>", "Parent"]
+    functions = [child for child in base.children if child.name == "<functions>"][0]
+    assert functions.size == len(u"Func.".encode("utf-8"))
+    assert not instrumentation.is_enabled()
+
+
+def test_audit_submodules(package):
+    entries = {entry.name: entry for entry in audit(package, submodules=True)}
+    assert sorted(entries) == ["audit_pkg.base", "audit_pkg.children"]
+    children = {child.name: child for child in entries["audit_pkg.children"].children}
+    # Kid merges with Parent (which accounts for object), and its method
+    assert children["Kid"].merges == 2
+    assert children["Kid"].size == len(u"Parent. é".encode("utf-8")) + len(u"Method.".encode("utf-8"))
+    assert children["Lazy"].merges == 1
+
+    report = format_report(sorted(entries.values(), key=lambda entry: -entry.seconds), top=1)
+    lines = report.splitlines()
+    assert "module / class" in lines[0]
+    assert lines[1].split("|")[1].strip() == str(sum(entry.merges for entry in entries.values()))
+    assert lines[-1].endswith("... 1 more modules")
+
+
+def test_cli(package, tmp_path):
+    src = os.path.dirname(os.path.dirname(os.path.abspath(custom_inherit.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])))
+    out = subprocess.check_output(
+        [sys.executable, "-m", "custom_inherit", "audit", package, "--submodules"],
+        cwd=str(tmp_path),
+        env=env,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    lines = out.splitlines()
+    assert lines[0].split("|")[-1].strip() == "module / class"
+    names = [line.split("|")[-1].strip() for line in lines[1:]]
+    assert names[0] == "total"
+    assert set(names[1:]) == {"audit_pkg.base", "Parent", "<functions>", "audit_pkg.children", "Kid", "Lazy"}
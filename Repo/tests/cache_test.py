@@ -0,0 +1,270 @@
+""" Tests behavior of the caches of custom_inherit """
+
+from pytest import raises
+from six import add_metaclass
+
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit
+from custom_inherit._merge_cache import merger
+from custom_inherit._doc_parse_tools.napoleon_parse_tools import parse_napoleon_doc
+from custom_inherit._doc_parse_tools.numpy_parse_tools import parse_numpy_doc
+from custom_inherit._doc_parse_tools.rest_parse_tools import parse_rest_doc
+from custom_inherit._lru_cache import CacheInfo, LRUCache
+
+
+def test_LRUCache():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "b" is now the least-recently-used entry
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("b", None) is None
+    assert cache.info() == CacheInfo(hits=1, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    cache.maxsize = 1
+    assert "a" not in cache and "c" in cache
+    assert cache.info().evictions == 2
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=1, currsize=0)
+
+    cache.maxsize = 0
+    cache["a"] = 1
+    assert not len(cache)
+
+    with raises(ValueError):
+        cache.maxsize = -1
+
+
+def test_parse_cache():
+    doc = """Summary.
+
+    Parameters
+    ----------
+    x : int
+
+    Raises
+    ------
+    ValueError
+    """
+    custom_inherit.parse_cache.clear()
+    for parse in (parse_numpy_doc, lambda doc: parse_napoleon_doc(doc, "numpy"), parse_rest_doc):
+        sections = parse(doc)
+        assert parse(doc) is sections
+    info = custom_inherit.parse_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (3, 3, 3)
+
+
+def test_merge_does_not_mutate_parsed_parent():
+    prnt = """Summary.
+
+    Raises
+    ------
+    NotImplementedError
+    """
+    child = """
+    Returns
+    -------
+    int
+    """
+    for style in ("numpy", "numpy_napoleon", "google", "reST"):
+        merge = custom_inherit.store[style]
+        parent_only = merge(prnt, None)
+        merge(prnt, child)
+        assert merge(prnt, None) == parent_only
+        assert "NotImplementedError" in parent_only
+
+
+def test_merge_cache():
+    calls = []
+
+    def pure_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc if child_doc is not None else prnt_doc
+
+    def other_style(prnt_doc, child_doc):
+        return "other"
+
+    merge_cache = custom_inherit.merge_cache
+    assert not merge_cache.maxsize  # opt-in
+
+    def impure_style(prnt_doc, child_doc):
+        return pure_style(prnt_doc, child_doc)
+
+    custom_inherit.add_style("pure_style", pure_style, pure=True)
+    custom_inherit.add_style("impure_style", impure_style)
+    try:
+        assert merger(pure_style) is pure_style
+        meta = DocInheritMeta(style="pure_style")
+
+        merge_cache.maxsize = 16
+        # the styles, and thus the metaclasses, are unchanged
+        assert custom_inherit.store["pure_style"] is pure_style
+        assert DocInheritMeta(style="pure_style") is meta
+        memoized = merger(pure_style)
+        assert memoized is not pure_style
+        assert merger(pure_style) is memoized
+        assert merger(impure_style) is impure_style
+
+        del calls[:]
+        assert memoized("parent", None) == "parent"
+        assert memoized("parent", None) == "parent"
+        assert len(calls) == 1
+        assert merge_cache.info().hits == 1
+
+        # the merges of the metaclasses, and of the decorators, are memoized
+        for _ in range(2):
+
+            @add_metaclass(meta)
+            class Parent(object):
+                def method(self):
+                    """method"""
+
+            class Kid(Parent):
+                def method(self):
+                    pass
+
+            @doc_inherit(Parent.method, style="pure_style")
+            def func():
+                pass
+
+        assert calls.count(("method", None)) == 1
+        assert Kid.method.__doc__ == func.__doc__ == "method"
+
+        # replacing the style invalidates its memoized merges
+        custom_inherit.add_style("pure_style", other_style, pure=True)
+        assert not merge_cache.info().currsize
+        assert merger(custom_inherit.store["pure_style"])("parent", None) == "other"
+    finally:
+        merge_cache.maxsize = 0
+        merge_cache.clear()
+        custom_inherit.remove_style("pure_style")
+        custom_inherit.remove_style("impure_style")
+
+    # the hierarchies created before and after enabling the cache can be combined
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class Early(object):
+        pass
+
+    merge_cache.maxsize = 16
+    try:
+
+        @add_metaclass(DocInheritMeta(style="numpy"))
+        class Late(object):
+            pass
+
+        class Both(Early, Late):
+            pass
+
+    finally:
+        merge_cache.maxsize = 0
+        merge_cache.clear()
+
+
+# the merges performed by `persisted_style`
+calls = []
+
+
+def persisted_style(prnt_doc, child_doc):
+    calls.append((prnt_doc, child_doc))
+    return None if prnt_doc is None else prnt_doc + "!"
+
+
+def test_persistent_cache(tmp_path):
+    from custom_inherit._persistent_cache import PersistentCache
+
+    pure_style = persisted_style
+    custom_inherit.add_style("pure_style", pure_style, pure=True)
+    try:
+        custom_inherit.enable_persistent_cache(str(tmp_path))
+        merge = merger(pure_style)
+        del calls[:]
+        assert merge("parent", "child") == "parent!"
+        assert merge(None, "child") is None
+        assert len(calls) == 2
+
+        # a warm start: the merges are loaded from the disk
+        custom_inherit.disable_persistent_cache()
+        custom_inherit.enable_persistent_cache(str(tmp_path))
+        merge = merger(pure_style)
+        assert merge("parent", "child") == "parent!"
+        assert merge(None, "child") is None
+        assert merge("parent", None) == "parent!"
+        assert len(calls) == 3
+    finally:
+        custom_inherit.disable_persistent_cache()
+        custom_inherit.remove_style("pure_style")
+
+    # several writers sharing the same file
+    first, second = PersistentCache(str(tmp_path)), PersistentCache(str(tmp_path))
+    key = first.key(pure_style, "a", "b")
+    assert key == second.key(pure_style, "a", "b")
+    assert key != first.key(pure_style, "a", None)
+    first[key] = "merged"
+    second[key] = "merged"
+    first.close()
+    second.close()
+    assert PersistentCache(str(tmp_path)).get(key) == "merged"
+
+
+def test_persistent_cache_errors(tmp_path, caplog):
+    from custom_inherit._persistent_cache import PersistentCache
+
+    # the cache directory cannot be created, as a file of the same name exists
+    path = tmp_path / "file"
+    path.write_text(u"")
+    cache = PersistentCache(str(path / "cache"))
+    assert cache.errors == 1
+    assert "failed to open the docstring cache" in caplog.text
+
+    key = cache.key(persisted_style, "a", "b")
+    cache[key] = "merged"
+    assert cache.get(key, "missed") == "missed"
+
+
+def test_style_identity():
+    from functools import partial
+
+    from custom_inherit._merge_key import _style_identity, merge_key
+
+    def make_style(suffix):
+        def style(prnt_doc, child_doc):
+            return prnt_doc + suffix
+
+        return style
+
+    def exclaim(prnt_doc, child_doc):
+        return prnt_doc + "!"
+
+    def ask(prnt_doc, child_doc):
+        return prnt_doc + "?"
+
+    first_lambda = lambda prnt_doc, child_doc: prnt_doc + "!"  # noqa: E731
+    second_lambda = lambda prnt_doc, child_doc: prnt_doc + "?"  # noqa: E731
+
+    def tagged(tag, prnt_doc, child_doc):
+        return prnt_doc + tag
+
+    # functions differing only by their constants, by their closures or by their arguments
+    assert _style_identity(exclaim) != _style_identity(ask)
+    assert _style_identity(first_lambda) != _style_identity(second_lambda)
+    assert _style_identity(make_style("!")) != _style_identity(make_style("?"))
+    assert _style_identity(make_style("!")) == _style_identity(make_style("!"))
+    assert _style_identity(partial(tagged, "!")) != _style_identity(partial(tagged, "?"))
+    assert _style_identity(partial(tagged, tag="!")) != _style_identity(partial(tagged, tag="?"))
+
+    # the merges of a style whose identity cannot be derived are not persisted
+    class Style(object):
+        def __call__(self, prnt_doc, child_doc):
+            return prnt_doc
+
+    def make_stateful_style(state):
+        def style(prnt_doc, child_doc):
+            return prnt_doc + state[0]
+
+        return style
+
+    for style in (Style(), make_stateful_style(["!"])):
+        assert _style_identity(style) is None
+        assert merge_key(style, "parent", "child") is None
@@ -0,0 +1,95 @@
+""" Tests the ahead-of-time compilation of merged docstrings """
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import custom_inherit
+
+MODULE = '''
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit
+
+custom_inherit.load_compiled_docs(__package__)
+
+
+class Parent(metaclass=DocInheritMeta(style="numpy")):
+    """Parent.
+
+    Parameters
+    ----------
+    x : int
+    """
+
+    def method(self):
+        """Method.
+
+        Returns
+        -------
+        int
+        """
+
+
+class Kid(Parent):
+    def method(self):
+        """{kid_doc}"""
+
+
+@doc_inherit(Parent.method, style="google")
+def func():
+    pass
+'''
+
+
+def _write_package(root, kid_doc="Kid method."):
+    package = os.path.join(str(root), "aot_pkg")
+    if not os.path.isdir(package):
+        os.makedirs(package)
+    with open(os.path.join(package, "__init__.py"), "w") as f:
+        f.write("")
+    with open(os.path.join(package, "classes.py"), "w") as f:
+        f.write(textwrap.dedent(MODULE).format(kid_doc=kid_doc))
+
+
+def _run(root, *args):
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.abspath(custom_inherit.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join((str(root), src, env.get("PYTHONPATH", "")))
+    return subprocess.run(
+        (sys.executable,) + args,
+        cwd=str(root),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+
+
+def test_build_check_and_load(tmp_path):
+    _write_package(tmp_path)
+
+    # the package's __init__ is empty: the artifact lives next to the submodule's package
+    out = _run(tmp_path, "-m", "custom_inherit", "build", "aot_pkg")
+    assert out.returncode == 0, out.stdout
+    assert os.path.isfile(os.path.join(str(tmp_path), "aot_pkg", "_custom_inherit_docs.marshal"))
+
+    out = _run(tmp_path, "-m", "custom_inherit", "build", "aot_pkg", "--check")
+    assert out.returncode == 0, out.stdout
+
+    # the compiled docstrings are served without parsing
+    out = _run(
+        tmp_path,
+        "-c",
+        "from inspect import getdoc; import custom_inherit; custom_inherit.parse_cache.clear(); "
+        "import aot_pkg.classes as m; "
+        "assert custom_inherit.parse_cache.info().misses == 0, custom_inherit.parse_cache.info(); "
+        "assert 'Returns' in getdoc(m.Kid.method), getdoc(m.Kid.method); "
+        "assert 'Returns' in getdoc(m.func), getdoc(m.func)",
+    )
+    assert out.returncode == 0, out.stdout
+
+    _write_package(tmp_path, kid_doc="Changed.")
+    out = _run(tmp_path, "-m", "custom_inherit", "build", "aot_pkg", "--check")
+    assert out.returncode == 1, out.stdout
+    assert "stale" in out.stdout
@@ -4,7 +4,7 @@ from types import FunctionType, MethodType
 
 from six import add_metaclass
 
-from custom_inherit import doc_inherit
+from custom_inherit import doc_inherit, parse_cache
 
 try:
     from inspect import signature
@@ -100,3 +100,308 @@ def test_abstract_method():
 def test_abstract_property():
     assert "absproperty" in Kid.__abstractmethods__
     assert getdoc(Kid.absproperty) == "valid"
+
+
+def test_merger_per_instance():
+    numpy_decorator = doc_inherit("Parent\n\nNotes\n-----\nparent notes", style="numpy")
+    parent_decorator = doc_inherit("parent", style="parent")
+
+    def f():
+        """Child"""
+
+    def g():
+        pass
+
+    assert getdoc(numpy_decorator(f)) == "Child\n\nNotes\n-----\nparent notes"
+    assert getdoc(parent_decorator(g)) == "parent"
+
+
+def test_parent_parsed_once():
+    parse_cache.clear()
+    decorator = doc_inherit("Parent\n\nParameters\n----------\nx : int", style="numpy")
+
+    funcs = []
+    for i in range(10):
+        def f():
+            pass
+        f.__doc__ = "Child {}".format(i)
+        funcs.append(decorator(f))
+
+    # the parent and each child are parsed once: the parent's parse is not looked up again
+    assert parse_cache.info().misses == 11
+    assert parse_cache.info().hits == 0
+    assert getdoc(funcs[3]) == "Child 3\n\nParameters\n----------\nx : int"
+
+
+""" Class decorator"""
+
+
+class Base(object):
+    """Base
+
+    Parameters
+    ----------
+    x : int"""
+
+    def method(self):
+        """Base method
+
+        Returns
+        -------
+        int"""
+
+    @classmethod
+    def clsmethod(cls):
+        """Base clsmethod"""
+
+    @staticmethod
+    def stmethod():
+        """Base stmethod"""
+
+    @property
+    def prop(self):
+        """Base prop"""
+
+    @abstractproperty
+    def absprop(self):
+        """Base absprop"""
+
+    def __init__(self):
+        """Base init"""
+
+
+class Mixin(object):
+    def mixed(self):
+        """Mixin mixed"""
+
+
+@add_metaclass(ABCMeta)
+class Foreign(object):
+    """Foreign"""
+
+
+def test_inherit_docstrings():
+    from custom_inherit import inherit_docstrings
+
+    @inherit_docstrings(Base, style="numpy")
+    class Kid(Foreign):
+        """Kid
+
+        Notes
+        -----
+        kid"""
+
+        def method(self):
+            """Kid method"""
+
+        @classmethod
+        def clsmethod(cls):
+            pass
+
+        @staticmethod
+        def stmethod():
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @abstractproperty
+        def absprop(self):
+            pass
+
+        def __init__(self):
+            pass
+
+    assert type(Kid) is ABCMeta
+    assert getdoc(Kid) == "Kid\n\nParameters\n----------\nx : int\n\nNotes\n-----\nkid"
+    assert getdoc(Kid.method) == "Kid method\n\nReturns\n-------\nint"
+    assert isinstance(Kid.__dict__["clsmethod"], classmethod)
+    assert getdoc(Kid.clsmethod) == "Base clsmethod"
+    assert isinstance(Kid.__dict__["stmethod"], staticmethod)
+    assert getdoc(Kid.stmethod) == "Base stmethod"
+    assert isinstance(Kid.prop, property)
+    assert getdoc(Kid.prop) == "Base prop"
+    assert isinstance(Kid.absprop, abstractproperty)
+    assert getdoc(Kid.absprop) == "Base absprop"
+    assert "absprop" in Kid.__abstractmethods__
+    assert Kid.__init__.__doc__ is None
+
+
+def test_inherit_docstrings_parents():
+    from custom_inherit import inherit_docstrings
+
+    @inherit_docstrings((Mixin, Base), include_special_methods=True)
+    class Kid(object):
+        def mixed(self):
+            pass
+
+        def method(self):
+            pass
+
+        def __init__(self):
+            pass
+
+    assert getdoc(Kid.mixed) == "Mixin mixed"
+    assert getdoc(Kid.method) == getdoc(Base.method)
+    assert getdoc(Kid.__init__) == "Base init"
+
+    # the class' own bases, by default
+    @inherit_docstrings()
+    class Kid2(Base, Mixin):
+        def mixed(self):
+            pass
+
+    assert getdoc(Kid2.mixed) == "Mixin mixed"
+
+    # subclasses of a decorated class inherit from it in turn
+    @inherit_docstrings()
+    class GrandKid(Kid2):
+        def mixed(self):
+            pass
+
+    assert getdoc(GrandKid.mixed) == "Mixin mixed"
+
+
+def test_inherit_docstrings_binds_parent_doc_once():
+    from custom_inherit import add_style, inherit_docstrings, remove_style
+
+    bound = []
+
+    def bind_parent(prnt_doc):
+        bound.append(prnt_doc)
+        return lambda child_doc: "{} + {}".format(prnt_doc, child_doc)
+
+    def style(prnt_doc, child_doc):
+        return bind_parent(prnt_doc)(child_doc)
+
+    add_style("binding_style", style, bind_parent=bind_parent)
+    remove_style("binding_style")  # the hook remains registered for `style`
+
+    class Parent(object):
+        def a(self):
+            """parent"""
+
+        b = c = a
+
+    @inherit_docstrings(Parent, style=style)
+    class Kid(object):
+        def a(self):
+            """a"""
+
+        def b(self):
+            """b"""
+
+        def c(self):
+            """c"""
+
+    assert getdoc(Kid.c) == "parent + c"
+    # the docstring shared by the parent's attributes is bound once
+    assert bound.count("parent") == 1
+
+
+def test_wrapped_style_does_not_inherit_hooks():
+    from functools import wraps
+
+    from custom_inherit import DocInheritMeta
+    from custom_inherit._style_store import numpy
+
+    @wraps(numpy)
+    def shout(prnt_doc, child_doc):
+        doc = numpy(prnt_doc, child_doc)
+        return doc and doc.upper()
+
+    def parent():
+        """parent"""
+
+    @doc_inherit(parent, style=shout)
+    def child():
+        pass
+
+    assert child.__doc__ == "PARENT"
+
+    @add_metaclass(DocInheritMeta(style=shout, share_sections=True))
+    class Parent(object):
+        """Parent"""
+
+        def method(self):
+            """method"""
+
+    class Kid(Parent):
+        def method(self):
+            pass
+
+    assert Kid.__doc__ == "PARENT"
+    assert Kid.method.__doc__ == "METHOD"
+
+
+""" Retrofitting modules and class trees"""
+
+
+def test_apply_to_tree():
+    from custom_inherit import DocInheritMeta, apply_to_tree
+
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc if child_doc is not None else prnt_doc
+
+    class Root(object):
+        def method(self):
+            """root"""
+
+    class Kid(Root):
+        def method(self):
+            pass
+
+    class GrandKid(Kid):
+        def method(self):
+            pass
+
+    class Other(Root):
+        pass
+
+    def method(self):
+        pass
+
+    # not via six.add_metaclass, which leaves the replaced class behind as a subclass of Root
+    Merged = DocInheritMeta(style="parent")("Merged", (Root,), dict(method=method))
+
+    # the metaclass validates the style with a probe call
+    DocInheritMeta(style=counting_style)
+    del calls[:]
+
+    merged = apply_to_tree(Root, style=counting_style)
+    assert merged.index(Kid) < merged.index(GrandKid)
+    assert set(merged) == {Kid, GrandKid, Other}
+    assert Merged not in merged
+    assert getdoc(GrandKid.method) == "root"
+    assert Root.method.__doc__ == "root"
+
+    # each method is merged once; GrandKid merges with Kid's merged docstring
+    assert calls.count(("root", None)) == 2
+
+    # classes are merged once
+    assert apply_to_tree(Root, style=counting_style) == []
+
+
+def test_apply_to_module():
+    import types
+
+    from custom_inherit import apply_to_module
+
+    module = types.ModuleType("retrofit_module")
+    exec(
+        "class Parent(object):\n"
+        "    def method(self):\n"
+        "        '''Parent\n\n        Returns\n        -------\n        int'''\n"
+        "class Kid(Parent):\n"
+        "    def method(self):\n"
+        "        '''Kid'''\n",
+        vars(module),
+    )
+    module.Base = Base  # imported classes are not merged
+
+    assert apply_to_module(module, style="numpy") == [module.Parent, module.Kid]
+    assert getdoc(module.Kid.method) == "Kid\n\nReturns\n-------\nint"
@@ -0,0 +1,167 @@
+""" Tests the on-demand merge of custom_inherit.getdoc """
+
+import sys
+import types
+from inspect import getdoc as inspect_getdoc
+
+import pytest
+
+import custom_inherit
+from custom_inherit import DocInheritMeta
+
+class Parent(object):
+    """Parent
+
+    Parameters
+    ----------
+    x : int"""
+
+    def method(self):
+        """Parent method
+
+        Parameters
+        ----------
+        y : int"""
+
+    def undocumented(self):
+        pass
+
+    @classmethod
+    def clsmethod(cls):
+        """Parent clsmethod"""
+
+    @staticmethod
+    def stmethod():
+        """Parent stmethod"""
+
+    @property
+    def prop(self):
+        """Parent prop"""
+
+    def __init__(self):
+        """Parent init"""
+
+
+class Kid(Parent):
+    """Kid
+
+    Notes
+    -----
+    kid"""
+
+    def method(self):
+        """Kid method
+
+        Returns
+        -------
+        int"""
+
+    def undocumented(self):
+        pass
+
+    @classmethod
+    def clsmethod(cls):
+        pass
+
+    @staticmethod
+    def stmethod():
+        pass
+
+    @property
+    def prop(self):
+        pass
+
+    def __init__(self):
+        pass
+
+
+class GrandKid(Kid):
+    def method(self):
+        """GrandKid method"""
+
+
+def _copy(attr, module):
+    """ A copy, in `module`, of the function, or of the method or property wrapping a function, `attr`; merging
+    the docstring of the copy leaves that of `attr` untouched."""
+    if isinstance(attr, (classmethod, staticmethod)):
+        return type(attr)(_copy(attr.__func__, module))
+    if isinstance(attr, property):
+        return property(_copy(attr.fget, module))
+    if isinstance(attr, types.FunctionType):
+        return types.FunctionType(attr.__code__, vars(module), attr.__name__, attr.__defaults__, attr.__closure__)
+    return attr
+
+
+# the hierarchy, as the plain classes of this module (to be found by qualified name), and merged upon creation
+merged = sys.modules["merged_hierarchy"] = types.ModuleType("merged_hierarchy")
+for _cls in (Parent, Kid, GrandKid):
+    _namespace = dict(
+        (name, _copy(attr, merged)) for name, attr in vars(_cls).items() if name not in ("__dict__", "__weakref__")
+    )
+    _namespace["__module__"] = merged.__name__
+    _bases = tuple(getattr(merged, base.__name__, base) for base in _cls.__bases__)
+    setattr(merged, _cls.__name__, DocInheritMeta(style="numpy")(_cls.__name__, _bases, _namespace))
+
+
+@pytest.mark.parametrize("name", ["Parent", "Kid", "GrandKid"])
+@pytest.mark.parametrize("attr", [None, "method", "undocumented", "clsmethod", "stmethod", "prop", "__init__"])
+def test_getdoc_matches_metaclass(name, attr):
+    cls, merged_cls = globals()[name], getattr(merged, name)
+    if attr is None:
+        obj, merged_obj = cls, merged_cls
+    else:
+        obj, merged_obj = getattr(cls, attr), getattr(merged_cls, attr)
+    assert custom_inherit.getdoc(obj, style="numpy") == inspect_getdoc(merged_obj)
+
+
+def test_getdoc():
+    assert custom_inherit.getdoc(GrandKid.method, style="numpy") == (
+        "GrandKid method\n\nParameters\n----------\ny : int\n\nReturns\n-------\nint"
+    )
+    # bound methods, and members looked up on subclasses
+    assert custom_inherit.getdoc(GrandKid().method, style="numpy") == custom_inherit.getdoc(
+        GrandKid.method, style="numpy"
+    )
+    assert custom_inherit.getdoc(GrandKid.clsmethod) == "Parent clsmethod"
+    assert custom_inherit.getdoc(GrandKid.prop) == "Parent prop"
+    assert custom_inherit.getdoc(GrandKid.__init__, include_special_methods=True) == "Parent init"
+
+    # the classes' own docstrings are untouched
+    assert Kid.method.__doc__.startswith("Kid method")
+    assert Kid.prop.__doc__ is None
+
+    # other objects
+    assert custom_inherit.getdoc(custom_inherit) == inspect_getdoc(custom_inherit)
+
+
+def test_getdoc_diamond():
+    class Root(object):
+        """Root.
+
+        Notes
+        -----
+        shared note
+        """
+
+    class A(Root):
+        pass
+
+    class B(Root):
+        pass
+
+    class C(A, B):
+        pass
+
+    assert custom_inherit.getdoc(C, style="numpy_with_merge") == "Root.\n\nNotes\n-----\nshared note"
+
+
+def test_getdoc_memoized():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc if child_doc is not None else prnt_doc
+
+    for _ in range(2):
+        assert custom_inherit.getdoc(GrandKid.stmethod, style=counting_style) == "Parent stmethod"
+    assert calls.count(("Parent stmethod", None)) == 1
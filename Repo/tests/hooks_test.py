@@ -0,0 +1,110 @@
+""" Tests the merge event hooks """
+
+import logging
+
+import pytest
+from six import add_metaclass
+
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit, hooks, instrumentation
+
+
+def join_style(prnt_doc, child_doc):
+    return " | ".join(doc for doc in (prnt_doc, child_doc) if doc)
+
+
+@pytest.fixture
+def events():
+    recorded = []
+    hooks.on_merge(recorded.append)
+    try:
+        yield recorded
+    finally:
+        hooks.clear()
+
+
+def test_metaclass_and_decorator_events(events):
+    @add_metaclass(DocInheritMeta(style=join_style))
+    class Parent(object):
+        """Parent"""
+
+        def method(self):
+            """method"""
+
+    class Child(Parent):
+        def method(self):
+            """child"""
+
+    @doc_inherit(Parent.method, style=join_style)
+    def function():
+        pass
+
+    kinds = [(event.kind, event.owner, event.name) for event in events]
+    assert kinds == [
+        (instrumentation.CLASS_MERGE, Parent, None),
+        (instrumentation.CLASS_MERGE, Child, None),
+        (instrumentation.ATTR_MERGE, Child, "method"),
+        (instrumentation.DECORATOR_MERGE, "test_metaclass_and_decorator_events.<locals>", "function"),
+    ]
+    attr_event = events[2]
+    assert attr_event.module == __name__
+    assert attr_event.style is join_style
+    assert (attr_event.parent_size, attr_event.child_size, attr_event.output_size) == (6, 5, 14)
+    assert attr_event.elapsed_ns >= 0
+    assert not attr_event.cached
+    assert (events[3].child_size, events[3].output_size) == (0, 6)
+
+
+def test_cached_merges(events):
+    custom_inherit.add_style("pure_join_style", join_style, pure=True)
+    custom_inherit.merge_cache.maxsize = 16
+    try:
+        for _ in range(2):
+
+            @add_metaclass(DocInheritMeta(style="pure_join_style"))
+            class Parent(object):
+                def method(self):
+                    """method"""
+
+            class Child(Parent):
+                def method(self):
+                    pass
+
+    finally:
+        custom_inherit.merge_cache.maxsize = 0
+        custom_inherit.merge_cache.clear()
+        custom_inherit.remove_style("pure_join_style")
+    assert [event.cached for event in events if event.kind == instrumentation.ATTR_MERGE] == [False, True]
+
+
+def test_registry():
+    assert not instrumentation._active
+
+    def callback(event):
+        pass
+
+    assert hooks.on_merge(callback) is callback
+    assert instrumentation._active
+    assert not instrumentation.is_enabled()  # the statistics are not gathered
+    hooks.remove(callback)
+    assert not instrumentation._active
+    with pytest.raises(ValueError):
+        hooks.remove(callback)
+    with pytest.raises(TypeError):
+        hooks.on_merge(None)
+
+
+def test_failing_callback_is_logged(events, caplog):
+    def failing(event):
+        raise RuntimeError("failing hook")
+
+    hooks.on_merge(failing)
+    with caplog.at_level(logging.ERROR, logger="custom_inherit"):
+
+        @doc_inherit("parent", style=join_style)
+        def function():
+            """child"""
+
+    assert function.__doc__ == "parent | child"
+    assert len(events) == 1
+    assert any("failing hook" in record.exc_text for record in caplog.records if record.exc_text)
@@ -0,0 +1,55 @@
+""" Tests that importing custom_inherit defers its costly imports until they are needed """
+
+import ast
+import os
+import subprocess
+import sys
+
+import custom_inherit
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(custom_inherit.__file__)))
+
+# modules that `import custom_inherit` must not import
+DEFERRED = [
+    "custom_inherit._doc_parse_tools.napoleon_parse_tools",
+    "custom_inherit._doc_parse_tools.numpy_parse_tools",
+    "custom_inherit._doc_parse_tools.rest_parse_tools",
+    "custom_inherit._getdoc",
+    "custom_inherit._memory_report",
+    "custom_inherit._merge_key",
+    "custom_inherit._persistent_cache",
+    "custom_inherit._version",
+    "hashlib",
+    "importlib.metadata",
+    "inspect",
+    "logging",
+    "pkgutil",
+    "re",
+    "sqlite3",
+    "subprocess",
+    "tracemalloc",
+]
+
+
+def _imported_after(code):
+    """ The deferred modules that are imported after running `code` in a fresh interpreter."""
+    code += "\nimport sys; print([name for name in {!r} if name in sys.modules])".format(DEFERRED)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])))
+    return ast.literal_eval(subprocess.check_output([sys.executable, "-c", code], env=env).decode().splitlines()[-1])
+
+
+def test_import_is_lazy():
+    assert _imported_after("import custom_inherit") == []
+
+
+def test_parsers_imported_upon_use():
+    imported = _imported_after(
+        "import custom_inherit\n"
+        "assert custom_inherit.store['numpy']('Parent\\n\\nNotes\\n-----\\nnote', 'Kid') == 'Kid\\n\\nNotes\\n-----\\nnote'"
+    )
+    assert "custom_inherit._doc_parse_tools.numpy_parse_tools" in imported
+    assert "custom_inherit._doc_parse_tools.rest_parse_tools" not in imported
+
+
+def test_version_resolved_upon_access():
+    assert "custom_inherit._version" in _imported_after("import custom_inherit; custom_inherit.__version__")
@@ -0,0 +1,153 @@
+""" Tests the opt-in instrumentation of the docstring merges """
+
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+from six import add_metaclass
+
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit, instrumentation, stats
+
+
+def join_style(prnt_doc, child_doc):
+    return " | ".join(doc for doc in (prnt_doc, child_doc) if doc)
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.enable(slow_threshold=60)
+    try:
+        yield
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def make_hierarchy():
+    @add_metaclass(DocInheritMeta(style=join_style))
+    class Parent(object):
+        """Parent"""
+
+        def method(self):
+            """method"""
+
+        def other(self):
+            """other"""
+
+    class Child(Parent):
+        def method(self):
+            pass
+
+        def other(self):
+            pass
+
+    return Parent, Child
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    instrumentation.reset()
+    make_hierarchy()
+    snapshot = stats()
+    assert snapshot["enabled"] is False
+    assert snapshot["merges"] == {}
+    assert snapshot["styles"] == {}
+
+
+def test_counts_and_timers(instrumented):
+    Parent, Child = make_hierarchy()
+
+    @doc_inherit(Parent.method, style=join_style)
+    def function():
+        """function"""
+
+    assert Child.method.__doc__ == "method"
+    assert function.__doc__ == "method | function"
+
+    snapshot = stats()
+    merges = snapshot["merges"]
+    # Parent merges with object, Child with Parent; Child merges its two methods
+    assert merges[instrumentation.CLASS_MERGE]["count"] == 2
+    assert merges[instrumentation.ATTR_MERGE]["count"] == 2
+    assert merges[instrumentation.DECORATOR_MERGE]["count"] == 1
+    for timer in merges.values():
+        assert 0 <= timer["max_seconds"] <= timer["total_seconds"]
+    assert list(snapshot["styles"]) == ["join_style"]
+    assert snapshot["styles"]["join_style"]["count"] == 5
+    assert snapshot["slow_merges"] == 0
+
+
+def test_disable_keeps_stats_and_reset_discards_them(instrumented):
+    make_hierarchy()
+    instrumentation.disable()
+    make_hierarchy()
+    assert stats()["merges"][instrumentation.ATTR_MERGE]["count"] == 2
+
+    instrumentation.reset()
+    assert stats()["merges"] == {}
+
+
+def test_builtin_styles_with_bound_parents(instrumented):
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class Parent(object):
+        def method(self):
+            """Parent
+
+            Parameters
+            ----------
+            x : int"""
+
+    class Child(Parent):
+        def method(self):
+            """Child"""
+
+    assert "x : int" in Child.method.__doc__
+    snapshot = stats()
+    assert snapshot["merges"][instrumentation.ATTR_MERGE]["count"] == 1
+    assert snapshot["styles"]["numpy"]["count"] == 3
+
+
+def test_cache_hit_rates(instrumented):
+    parse_cache = custom_inherit.parse_cache
+    maxsize = parse_cache.maxsize
+    parse_cache.maxsize = 16
+    try:
+        numpy = custom_inherit.store["numpy"]
+        numpy("Parent\n\nNotes\n-----\nhit rates", "Child of the hit rates")
+        numpy("Parent\n\nNotes\n-----\nhit rates", "Child of the hit rates")
+    finally:
+        parse_cache.maxsize = maxsize
+    caches = stats()["caches"]
+    assert caches["parse_cache"]["hits"] == 2
+    assert caches["parse_cache"]["misses"] == 2
+    assert caches["parse_cache"]["hit_rate"] == 0.5
+    assert caches["merge_cache"] == {"hits": 0, "misses": 0, "hit_rate": None}
+
+
+def test_slow_merges_are_logged(instrumented, caplog):
+    instrumentation.enable(slow_threshold=0)
+    with caplog.at_level(logging.WARNING, logger="custom_inherit"):
+        make_hierarchy()
+    assert stats()["slow_merges"] == 4
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("style join_style" in message and message.endswith("Child.method") for message in messages)
+    assert any(message.endswith("make_hierarchy.<locals>.Parent") for message in messages)
+
+
+def test_enabled_by_environment():
+    code = (
+        "import custom_inherit\n"
+        "snapshot = custom_inherit.stats()\n"
+        "print(snapshot['enabled'], snapshot['slow_threshold'])"
+    )
+    src = os.path.dirname(os.path.dirname(os.path.abspath(custom_inherit.__file__)))
+    env = dict(
+        os.environ,
+        CUSTOM_INHERIT_INSTRUMENTATION="1",
+        CUSTOM_INHERIT_SLOW_MERGE_MS="5",
+        PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])),
+    )
+    assert subprocess.check_output([sys.executable, "-c", code], env=env).decode().split() == ["True", "0.005"]
@@ -0,0 +1,194 @@
+""" Tests the report of the memory retained by merged docstrings """
+
+import sys
+import types
+
+from six import add_metaclass
+
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit, memory_report
+
+
+def join_style(prnt_doc, child_doc):
+    return " | ".join(doc for doc in (prnt_doc, child_doc) if doc)
+
+
+MODULE = '''
+from six import add_metaclass
+
+from custom_inherit import DocInheritMeta, doc_inherit
+
+
+def join_style(prnt_doc, child_doc):
+    return " | ".join(doc for doc in (prnt_doc, child_doc) if doc)
+
+
+@add_metaclass(DocInheritMeta(style="numpy"))
+class Parent(object):
+    """Parent
+
+    Parameters
+    ----------
+    x : int"""
+
+    def method(self):
+        """method"""
+
+
+class Kid(Parent):
+    def method(self):
+        """kid"""
+
+
+class Sibling(Parent):
+    def method(self):
+        pass
+
+
+@doc_inherit(Parent.method, style=join_style)
+def function():
+    """function"""
+
+
+def undocumented():
+    pass
+'''
+
+
+def make_module():
+    module = types.ModuleType("memory_report_module")
+    sys.modules[module.__name__] = module
+    exec(compile(MODULE, "<memory_report_module>", "exec"), vars(module))
+    return module
+
+
+def test_memory_report_of_a_module():
+    module = make_module()
+    try:
+        report = memory_report(module)
+    finally:
+        del sys.modules[module.__name__]
+
+    # the docstrings of the 3 classes, and of function; Kid.method keeps its own docstring, and
+    # Sibling.method shares that of Parent.method
+    assert report.total.merged_count == 4
+    # the original docstring of function remains referenced by its code object
+    assert report.total.original_count == 1
+    assert report.total.original_bytes == sys.getsizeof("function")
+    assert report.total.merged_bytes == sum(
+        sys.getsizeof(doc)
+        for doc in (
+            module.Parent.__doc__, module.Kid.__doc__, module.Sibling.__doc__,
+            module.function.__doc__,
+        )
+    )
+    assert list(report.modules) == ["memory_report_module"]
+    assert set(report.classes["memory_report_module"]) == {"Parent", "Kid", "Sibling"}
+    assert all(usage.merged_count == 1 for usage in report.classes["memory_report_module"].values())
+
+    # Kid and Sibling hold distinct copies of the merged docstring of Parent
+    (duplicate,) = [duplicate for duplicate in report.duplicates if duplicate.doc == module.Parent.__doc__]
+    assert duplicate.copies == 3
+    assert duplicate.wasted_bytes == 2 * sys.getsizeof(module.Parent.__doc__)
+    assert set(duplicate.owners) == {"memory_report_module." + name for name in ("Parent", "Kid", "Sibling")}
+
+    assert report.caches["class index"].entries == 3
+    assert {"parse_cache", "merge_cache", "compiled_docs"} <= set(report.caches)
+    assert "memory_report_module" in str(report)
+
+
+def test_memory_report_of_a_class():
+    @add_metaclass(DocInheritMeta(style=join_style))
+    class Parent(object):
+        def method(self):
+            """method"""
+
+    class Kid(Parent):
+        def method(self):
+            """kid"""
+
+    class Unrelated(object):
+        @doc_inherit(Parent.method, style=join_style)
+        def method(self):
+            pass
+
+    report = memory_report(Parent)
+    # Unrelated is not a subclass of Parent
+    assert set(report.classes[__name__]) == {Parent.__qualname__, Kid.__qualname__}
+    # Parent's docstring is a copy of object's, which is created anew upon each access
+    assert report.classes[__name__][Parent.__qualname__].merged_bytes == sys.getsizeof(object.__doc__)
+    assert report.classes[__name__][Kid.__qualname__] == (1, sys.getsizeof(Kid.method.__doc__), 1, sys.getsizeof("kid"))
+    assert report.traced_bytes is None or report.traced_bytes >= 0
+
+
+def test_memory_report_of_wrappers():
+    import functools
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @add_metaclass(DocInheritMeta(style=join_style))
+    class Parent(object):
+        @decorator
+        def method(self):
+            """method"""
+
+    class Kid(Parent):
+        @decorator
+        def method(self):
+            """kid"""
+
+    module = types.ModuleType("memory_report_wrappers")
+    module.function = decorator(Parent.method)
+    module.function.__module__ = module.__name__
+
+    # the docstrings copied onto the wrappers by functools.wraps are not merged ones
+    assert memory_report(module).total.merged_count == 0
+    report = memory_report(Parent)
+    # Parent's merged docstring is its class docstring
+    assert report.classes[__name__][Parent.__qualname__].merged_count == 1
+    assert report.classes[__name__][Kid.__qualname__] == (1, sys.getsizeof(Kid.method.__doc__), 1, sys.getsizeof("kid"))
+
+
+def test_memory_report_of_a_lazy_class():
+    @add_metaclass(DocInheritMeta(style=join_style, lazy=True))
+    class Parent(object):
+        def method(self):
+            """method"""
+
+    class Kid(Parent):
+        def method(self):
+            pass
+
+    # the pending docstrings are not merged by the report
+    assert memory_report(Parent).total.merged_count == 0
+    assert custom_inherit.getdoc(Kid.method) == "method"
+
+
+def test_memory_report_of_shared_sections():
+    @add_metaclass(DocInheritMeta(style="numpy", share_sections=True))
+    class Parent(object):
+        """Parent
+
+        Parameters
+        ----------
+        x : int"""
+
+    class Kid(Parent):
+        """Kid"""
+
+    class Sibling(Parent):
+        """Sibling"""
+
+    report = memory_report(Parent)
+    shared = vars(Kid)["__doc__"]
+    assert report.classes[__name__][Kid.__qualname__].merged_bytes == sys.getsizeof(shared) + sys.getsizeof(
+        shared.sections
+    )
+    # the Parameters section is shared rather than duplicated
+    assert not report.duplicates
+    assert report.caches["shared sections"].entries >= 4
@@ -6,7 +6,8 @@ from six import add_metaclass
 import pytest
 
 from custom_inherit import DocInheritMeta
-from custom_inherit._doc_parse_tools.section_items import _RE_PATTERN_ITEMS
+from custom_inherit._doc_parse_tools.section_items import _split_items
+from custom_inherit._metaclass_base import _lazy_pending
 
 try:
     from inspect import signature
@@ -322,4 +323,595 @@ def test_special_method3():
     )
 )
 def test_regex(section_content, expected):
-    assert _RE_PATTERN_ITEMS.findall(section_content) == expected
+    assert _split_items(section_content) == expected
+
+
+""" Lazy option"""
+
+
+def test_lazy_merge_deferred_until_access():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return "merged" if prnt_doc else child_doc
+
+    meta = DocInheritMeta(style=counting_style, lazy=True)
+    del calls[:]  # the style store validates the style by calling it
+
+    @add_metaclass(meta)
+    class Parent(object):
+        """parent"""
+
+        def method(self):
+            """parent method"""
+
+        @property
+        def prop(self):
+            """parent prop"""
+            return None
+
+    class Kid(Parent):
+        def method(self):
+            pass
+
+        @property
+        def prop(self):
+            return None
+
+    assert not calls
+    assert getdoc(Kid.method) == "merged"
+    merges = len(calls)
+    assert merges
+
+    # memoized
+    assert getdoc(Kid) == "merged"
+    assert getdoc(Kid.prop) == "merged"
+    assert getdoc(Kid.method) == "merged"
+    assert len(calls) == merges
+
+
+def test_lazy_matches_eager():
+    def make(lazy):
+        @add_metaclass(DocInheritMeta(style="numpy", lazy=lazy))
+        class Parent(object):
+            """Parent.
+
+            Parameters
+            ----------
+            x : int
+            """
+
+            def method(self, x):
+                """Parent method.
+
+                Parameters
+                ----------
+                x : int
+                """
+
+            @classmethod
+            def clsmthd(cls):
+                """
+                Returns
+                -------
+                int
+                """
+
+            @staticmethod
+            def static():
+                """
+                Raises
+                ------
+                ValueError
+                """
+
+            @property
+            def prop(self):
+                """
+                Returns
+                -------
+                str
+                """
+                return ""
+
+        class Kid(Parent):
+            """Kid."""
+
+            def method(self, x):
+                """Kid method."""
+
+            @classmethod
+            def clsmthd(cls):
+                pass
+
+            @staticmethod
+            def static():
+                pass
+
+            @property
+            def prop(self):
+                return ""
+
+        class GrandKid(Kid):
+            def method(self, x):
+                pass
+
+        return GrandKid
+
+    eager, lazy = make(False), make(True)
+    assert lazy().__doc__ == getdoc(eager)
+    for name in ("method", "clsmthd", "static", "prop"):
+        assert getdoc(getattr(lazy, name)) == getdoc(getattr(eager, name))
+
+
+def test_lazy_instance_access():
+    def join_style(prnt_doc, child_doc):
+        return " | ".join(doc for doc in (prnt_doc, child_doc) if doc)
+
+    @add_metaclass(DocInheritMeta(style=join_style, lazy=True))
+    class Parent(object):
+        def method(self):
+            """parent method"""
+
+        @property
+        def prop(self):
+            """parent prop"""
+            return self._prop
+
+        @prop.setter
+        def prop(self, value):
+            self._prop = value
+
+    class Kid(Parent):
+        def method(self):
+            """kid method"""
+
+        @property
+        def prop(self):
+            return self._prop
+
+        @prop.setter
+        def prop(self, value):
+            self._prop = value
+
+    kid = Kid()
+    assert kid.method.__doc__ == "parent method | kid method"
+    assert getdoc(Kid().method) == "parent method | kid method"
+    kid.prop = 1
+    assert kid.prop == 1
+    assert Kid.prop.__doc__ == "parent prop"
+
+    # once merged, the attributes are looked up as usual
+    assert type(vars(Kid)["method"]) is FunctionType
+    assert type(vars(Kid)["prop"]) is property
+    assert type(Kid).__getattribute__ is type.__getattribute__
+
+
+def test_lazy_abc():
+    @add_metaclass(DocInheritMeta(style=style, abstract_base_class=True, lazy=True))
+    class Parent(object):
+        @abstractmethod
+        def absmthd(self):
+            """"""
+
+        @abstractproperty
+        def absproperty(self):
+            """"""
+
+    class Kid(Parent):
+        def absmthd(self):
+            pass
+
+        @property
+        def absproperty(self):
+            return None
+
+    # abc.ABCMeta looks up the abstract methods of Parent on Kid, which does not trigger the merge
+    assert Parent in _lazy_pending
+    assert Kid in _lazy_pending
+
+    assert isinstance(Kid, ABCMeta)
+    assert "absmthd" in Parent.__abstractmethods__
+    assert not Kid.__abstractmethods__
+    assert getdoc(Kid.absmthd) == "valid"
+    assert Parent not in _lazy_pending
+    assert getdoc(Kid.absproperty) == "valid"
+    Kid()
+
+
+""" Class docstring merged incrementally over the mro"""
+
+
+def test_class_docstring_single_merge_per_class():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc if child_doc is not None else prnt_doc
+
+    meta = DocInheritMeta(style=counting_style)
+
+    @add_metaclass(meta)
+    class Root(object):
+        """root"""
+
+    cls = Root
+    for _ in range(12):
+        del calls[:]
+        cls = type(meta)("Sub", (cls,), {})
+        assert calls == [("root", None)]
+    assert getdoc(cls) == "root"
+
+
+def test_class_docstring_diamond():
+    parents = []
+
+    def recording_style(prnt_doc, child_doc):
+        parents.append(prnt_doc)
+        return "\n".join(doc for doc in (child_doc, prnt_doc) if doc)
+
+    @add_metaclass(DocInheritMeta(style=recording_style))
+    class A(object):
+        """A"""
+
+    class B(A):
+        """B"""
+
+    class C(A):
+        """C"""
+
+    del parents[:]
+
+    class D(B, C):
+        """D"""
+
+    # each ancestor contributes once, following the C3 mro: A is accounted for by B, and so only
+    # the own docstring of C is merged
+    assert parents == [B.__doc__, "C"]
+    lines = D.__doc__.split("\n")
+    assert lines[:3] == ["D", "B", "A"]
+    assert lines.count("A") == 1 and lines.count("C") == 1
+
+
+def test_class_docstring_diamond_with_merge():
+    @add_metaclass(DocInheritMeta(style="numpy_with_merge"))
+    class Root(object):
+        """Root.
+
+        Notes
+        -----
+        shared note
+        """
+
+    class A(Root):
+        """A."""
+
+    class B(Root):
+        """B.
+
+        Notes
+        -----
+        b note
+        """
+
+    class C(A, B):
+        pass
+
+    assert C.__doc__.count("shared note") == 1
+    assert "b note" in C.__doc__
+
+
+def test_class_docstring_merge_hierarchy_no_duplication():
+    @add_metaclass(DocInheritMeta(style="numpy_with_merge"))
+    class GrandParent(object):
+        """GrandParent.
+
+        Notes
+        -----
+        foo
+        """
+
+    class Parent(GrandParent):
+        """
+        Notes
+        -----
+        bar
+        """
+
+    class Child(Parent):
+        pass
+
+    assert getdoc(Child) == "GrandParent.\n\nNotes\n-----\nfoo\nbar"
+
+
+""" Attribute-docstring index"""
+
+
+def test_attr_doc_index():
+    class Descriptor(object):
+        """descriptor"""
+
+        def __get__(self, instance, owner):
+            raise AssertionError("the descriptor protocol must not be invoked")
+
+    class Mixin(object):
+        def mixin_method(self):
+            """mixin"""
+
+        attr = Descriptor()
+
+    @add_metaclass(DocInheritMeta(style="parent"))
+    class Parent(object):
+        def method(self):
+            """parent"""
+
+        def undocumented(self):
+            pass
+
+    class Kid(Mixin, Parent):
+        def method(self):
+            pass
+
+        def mixin_method(self):
+            pass
+
+        attr = Descriptor()
+
+    class GrandKid(Kid):
+        def undocumented(self):
+            pass
+
+    assert getdoc(Kid.method) == "parent"
+    assert getdoc(Kid.mixin_method) == "mixin"
+    assert GrandKid.undocumented.__doc__ is None
+
+    # each class records its own class docstring, as written in its definition
+    assert vars(Kid)["_custom_inherit_docs"] == {"__doc__": None}
+    assert vars(GrandKid)["_custom_inherit_docs"] == {"__doc__": None}
+
+
+def test_attr_doc_set_after_class_creation():
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class Parent(object):
+        def method(self):
+            """Parent."""
+
+    Parent.method.__doc__ = """Parent, edited.
+
+    Returns
+    -------
+    int"""
+
+    class Kid(Parent):
+        def method(self):
+            """Kid."""
+
+    assert Kid.method.__doc__ == "Kid.\n\nReturns\n-------\nint"
+
+
+""" Metaclass cache"""
+
+
+def test_metaclass_cache():
+    def my_style(prnt_doc, child_doc):
+        return child_doc
+
+    assert DocInheritMeta(style="numpy") is DocInheritMeta(style="numpy")
+    assert DocInheritMeta(style=my_style, abstract_base_class=True) is DocInheritMeta(
+        my_style, True
+    )
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(style="numpy", lazy=True)
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(style="google")
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(
+        style="numpy", include_special_methods=True
+    )
+
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class A(object):
+        pass
+
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class B(object):
+        pass
+
+    class C(A, B):  # no metaclass conflict
+        pass
+
+    meta = DocInheritMeta(style="numpy")
+    DocInheritMeta.cache_clear()
+    assert DocInheritMeta(style="numpy") is not meta
+
+
+""" Deduplication of the merged docstrings"""
+
+
+def test_dedupe():
+    def make_hierarchy(**kwargs):
+        @add_metaclass(DocInheritMeta(style="numpy", **kwargs))
+        class Parent(object):
+            """Parent.
+
+            Parameters
+            ----------
+            x : int
+            """
+
+            def method(self):
+                """Method.
+
+                Parameters
+                ----------
+                y : int
+                """
+
+        class Kid(Parent):
+            def method(self):
+                pass
+
+        class Sibling(Parent):
+            def method(self):
+                pass
+
+        return Parent, Kid, Sibling
+
+    Parent, Kid, Sibling = make_hierarchy()
+    assert Kid.__doc__ == Sibling.__doc__ and Kid.__doc__ is not Sibling.__doc__
+    assert Kid.method.__doc__ == Sibling.method.__doc__ and Kid.method.__doc__ is not Sibling.method.__doc__
+
+    for kwargs in (dict(dedupe=True), dict(dedupe=True, lazy=True)):
+        Parent, Kid, Sibling = make_hierarchy(**kwargs)
+        assert Kid.__doc__ is Sibling.__doc__ is Parent.__doc__
+        assert Kid.method.__doc__ is Sibling.method.__doc__
+        assert Kid.method.__doc__ == make_hierarchy()[1].method.__doc__
+
+    assert DocInheritMeta(style="numpy", dedupe=True) is DocInheritMeta(style="numpy", dedupe=True)
+    assert DocInheritMeta(style="numpy", dedupe=True) is not DocInheritMeta(style="numpy")
+
+
+def test_clear_dedupe():
+    from custom_inherit import clear_dedupe
+    from custom_inherit._metaclass_base import _dedupe_tables
+
+    def make_kid(meta):
+        @add_metaclass(meta)
+        class Parent(object):
+            def method(self):
+                """Method.
+
+                Notes
+                -----
+                note"""
+
+        class Kid(Parent):
+            def method(self):
+                """Kid method."""
+
+        return Kid
+
+    meta = DocInheritMeta(style="numpy", dedupe=True)
+    other_meta = DocInheritMeta(style="numpy_with_merge", dedupe=True)
+    try:
+        first, other = make_kid(meta), make_kid(other_meta)
+        assert make_kid(meta).method.__doc__ is first.method.__doc__
+        assert make_kid(other_meta).method.__doc__ is other.method.__doc__
+        # each metaclass holds its own table, which holds the docstrings until it is cleared
+        assert _dedupe_tables[meta] and _dedupe_tables[other_meta]
+        clear_dedupe(meta)
+        assert not _dedupe_tables[meta] and _dedupe_tables[other_meta]
+        second = make_kid(meta)
+        assert second.method.__doc__ is not first.method.__doc__
+        assert make_kid(meta).method.__doc__ is second.method.__doc__
+
+        # a frozen metaclass no longer deduplicates
+        clear_dedupe(meta, freeze=True)
+        assert make_kid(meta).method.__doc__ is not make_kid(meta).method.__doc__
+        assert make_kid(meta).method.__doc__ == first.method.__doc__
+
+        clear_dedupe()
+        assert not _dedupe_tables[other_meta]
+        assert make_kid(other_meta).method.__doc__ is not other.method.__doc__
+    finally:
+        clear_dedupe()
+
+
+def test_dedupe_table_bounded(monkeypatch):
+    import custom_inherit._metaclass_base
+    from custom_inherit import clear_dedupe
+    from custom_inherit._metaclass_base import _dedupe, _dedupe_tables
+
+    monkeypatch.setattr(custom_inherit._metaclass_base, "_DEDUPE_MAXSIZE", 2)
+    meta = DocInheritMeta(style="numpy", dedupe=True)
+    clear_dedupe(meta)
+    try:
+        docs = ["".join(("doc", str(i))) for i in range(3)]
+        assert [_dedupe(meta, doc) for doc in docs] == docs
+        assert len(_dedupe_tables[meta]) == 2
+        # the least-recently-used docstring was released
+        assert _dedupe(meta, "".join(("doc", "0"))) is not docs[0]
+        assert _dedupe(meta, "".join(("doc", "2"))) is docs[2]
+    finally:
+        clear_dedupe()
+
+
+def test_share_sections():
+    from custom_inherit._metaclass_base import _SharedDoc
+
+    def make_hierarchy(style="numpy", **kwargs):
+        @add_metaclass(DocInheritMeta(style=style, **kwargs))
+        class Parent(object):
+            """Parent.
+
+            Parameters
+            ----------
+            x : int
+
+            Raises
+            ------
+            ValueError
+            """
+
+            def method(self):
+                """Method."""
+
+        class Kid(Parent):
+            """Kid.
+
+            Returns
+            -------
+            int
+            """
+
+        class Sibling(Parent):
+            """Sibling."""
+
+        class Grandkid(Kid):
+            pass
+
+        return Parent, Kid, Sibling, Grandkid
+
+    for style in ("numpy", "numpy_with_merge", "google", "numpy_napoleon", "reST"):
+        eager = make_hierarchy(style)
+        shared = make_hierarchy(style, share_sections=True)
+        for eager_cls, shared_cls in zip(eager, shared):
+            assert shared_cls.__doc__ == eager_cls.__doc__
+            assert shared_cls().__doc__ == eager_cls.__doc__
+            assert getdoc(shared_cls) == getdoc(eager_cls)
+
+    # combined with lazy mode, the first access (of any kind) renders the docstring as well
+    eager = make_hierarchy()
+    for access in (getdoc, lambda cls: cls.__doc__, lambda cls: cls().__doc__):
+        lazy = make_hierarchy(share_sections=True, lazy=True)
+        for eager_cls, lazy_cls in zip(eager, lazy):
+            assert access(lazy_cls) == access(eager_cls)
+            assert type(lazy_cls.__doc__) is str
+        # the sections remain shared
+        assert all(isinstance(vars(cls)["__doc__"], _SharedDoc) for cls in lazy[:3])
+        assert vars(lazy[1])["__doc__"].sections[1] is vars(lazy[2])["__doc__"].sections[1]
+
+    Parent, Kid, Sibling, Grandkid = make_hierarchy(share_sections=True)
+    # the docstrings are rendered upon access, from sections shared along the hierarchy
+    assert Kid.__doc__ is not Kid.__doc__
+    sections = [vars(cls)["__doc__"].sections for cls in (Parent, Kid, Sibling)]
+    assert sections[0][1] is sections[1][1] is sections[2][1]  # Parameters
+    assert sections[0][2] is sections[2][2]  # Raises
+    assert vars(Grandkid)["__doc__"] is vars(Kid)["__doc__"]
+    assert vars(make_hierarchy(share_sections=True)[1])["__doc__"] is vars(Kid)["__doc__"]
+    # the attributes' docstrings remain strings
+    assert Kid.method.__doc__ == "Method."
+
+    # styles without `merge_sections` merge into strings
+    assert isinstance(vars(make_hierarchy("parent", share_sections=True)[1])["__doc__"], str)
+
+    assert DocInheritMeta(style="numpy", share_sections=True) is not DocInheritMeta(style="numpy")
+
+    # the sections are deduplicated through the metaclass' table, which can be released
+    from custom_inherit import clear_dedupe
+    from custom_inherit._metaclass_base import _dedupe_tables
+
+    meta = type(Parent)
+    assert sections[0][1] in _dedupe_tables[meta]
+    clear_dedupe(meta)
+    assert not _dedupe_tables[meta]
+    assert vars(Kid)["__doc__"].sections[1] is sections[0][1]
+    assert Kid.__doc__ == make_hierarchy()[1].__doc__
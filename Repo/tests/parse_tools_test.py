@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+""" Tests the docstring tokenizer shared by the numpy and napoleon parsers """
+
+from inspect import cleandoc
+import re
+
+import pytest
+
+from custom_inherit._doc_parse_tools.napoleon_parse_tools import parse_napoleon_doc
+from custom_inherit._doc_parse_tools.numpy_parse_tools import parse_numpy_doc
+from custom_inherit._doc_parse_tools.section_items import _split_items
+from custom_inherit._doc_parse_tools.section_tokenizer import clean_lines
+
+
+@pytest.mark.parametrize(
+    "doc",
+    (
+        "",
+        "\n",
+        "one line",
+        "  first\n    second\n      third\n",
+        "\n\n    first\n\n    second\n    \n",
+        "first\n        \n    second\n      ",
+        "first\n\ttabbed\n    spaced",
+        "first\r\n    second\r\n",
+        "first\n    second\x0cthird",
+        "\n      \n    text\n      \n",
+        u"caf\xe9\n    cr\xe8me",
+        u"first\u2028    second",
+    ),
+)
+def test_clean_lines(doc):
+    assert clean_lines(doc) == [line.rstrip() for line in cleandoc(doc).splitlines()]
+
+
+def test_non_ascii_unicode():
+    from custom_inherit._doc_parse_tools.numpy_parse_tools import merge_numpy_docs
+
+    assert merge_numpy_docs(u"Parent\n\nNotes\n-----\nnote", u"Child caf\xe9") == (
+        u"Child caf\xe9\n\nNotes\n-----\nnote"
+    )
+
+
+def test_header_on_last_line():
+    assert parse_numpy_doc("Summary\n\nReturns")["Returns"] == ""
+    assert parse_napoleon_doc("Summary\n\nReturns", "numpy")["Returns"] == ""
+    assert parse_napoleon_doc("Summary\n\nReturns:", "google")["Returns"] == ""
+
+
+def test_google_headers():
+    sections = parse_napoleon_doc("Summary\n\nArgs\n    x\n\nReturn:\n    int", "google")
+    assert sections["Short Summary"] == "Summary"
+    assert list(sections["Parameters"]) == ["x"]
+    assert sections["Returns"] == "    int"
+
+    # only a single trailing colon is stripped from a header
+    sections = parse_napoleon_doc("Summary\nReturns::\n    int", "google")
+    assert sections["Returns"] is None
+
+
+def test_numpy_delimiter_skipped():
+    sections = parse_numpy_doc("Summary\n\nNotes\n~~~~~\nnote\n")
+    assert sections["Short Summary"] == "Summary"
+    assert sections["Notes"] == "note"
+
+
+# the pattern formerly used to split the items of a section
+_RE_PATTERN_ITEMS = re.compile(r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", flags=re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "section_content",
+    (
+        "",
+        "\n",
+        "  : no name",
+        "x : int\n    The x.\n",
+        "x : int\n\n    The x.\n\n*args\n    Args.\n**kwargs : dict\n",
+        "- not an item\n* bullet\n  x\ny\n",
+        "**\n*\nx\n***y z\n",
+        "préfixe ü\n    ß\n",
+        "trailing\n\n",
+    ),
+)
+def test_split_items_matches_regex(section_content):
+    assert _split_items(section_content) == _RE_PATTERN_ITEMS.findall(section_content)
@@ -66,3 +66,81 @@ def test_store():
     )
     assert "parent" in store.keys()
     assert "numpy" in store.keys()
+
+
+def test_remove_style():
+    from custom_inherit import add_style, remove_style
+
+    add_style("test_style", good_style1)
+    assert "test_style" in store
+    remove_style("test_style")
+    assert "test_style" not in store
+    remove_style("test_style")  # removing a missing style is a no-op
+
+
+def test_validation_cache():
+    calls = []
+
+    def counting_style(x, y):
+        calls.append((x, y))
+        return y
+
+    _store = _Store()
+    for _ in range(3):
+        assert _store[counting_style] is counting_style
+    assert calls == [("", "")]
+
+    _store["counting"] = counting_style
+    assert calls == [("", "")]
+
+
+def test_signature_validation():
+    calls = []
+
+    def counting_style(x, y):
+        calls.append((x, y))
+        return y
+
+    _store = _Store()
+    _store.validation = "signature"
+    assert _store[counting_style] is counting_style
+    assert calls == []
+
+    with raises(TypeError):
+        _store[bad_style_sig1]
+
+    with raises(TypeError):
+        _store[bad_style_sig2]
+
+    with raises(TypeError):
+        _store["not a style"]
+
+    # the output of the style function is not checked
+    assert _store[bad_style_type2] is bad_style_type2
+
+    with raises(ValueError):
+        _store.validation = "unknown"
+    assert _store.validation == "signature"
+
+
+def test_entry_point_styles(tmp_path, monkeypatch):
+    import sys
+
+    (tmp_path / "org_styles.py").write_text("def shout(prnt_doc, child_doc):\n    return (child_doc or prnt_doc).upper()\n")
+    dist_info = tmp_path / "org_styles-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: org-styles\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text("[custom_inherit.styles]\nshout = org_styles:shout\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "org_styles", raising=False)
+
+    _store = _Store()
+    assert "shout" not in _store
+    with raises(TypeError):
+        _store["whisper"]
+    assert "org_styles" not in sys.modules  # discovered, not imported
+
+    assert _store["shout"]("parent", "kid") == "KID"
+    assert "org_styles" in sys.modules
+    assert "shout" in _store
+    assert _store["shout"] is sys.modules["org_styles"].shout